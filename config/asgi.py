@@ -8,9 +8,29 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
+import re
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# 앱 모듈은 Django 초기화 이후에 불러옴
+from meetings.consumers import LiveRecordingConsumer  # noqa: E402
+
+LIVE_RECORDING_PATH = re.compile(r'^/ws/meetings/(?P<meeting_id>\d+)/recordings/live/$')
+
+
+async def application(scope, receive, send):
+    # 웹소켓은 실시간 녹음 경로만 처리하고, 나머지 요청은 Django로 전달
+    if scope['type'] == 'websocket':
+        match = LIVE_RECORDING_PATH.match(scope['path'])
+        if match is None:
+            await send({'type': 'websocket.close', 'code': 4404})
+            return
+
+        await LiveRecordingConsumer(int(match.group('meeting_id')))(scope, receive, send)
+        return
+
+    await django_application(scope, receive, send)
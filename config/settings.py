@@ -289,26 +289,114 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # queue
+# 녹음 변환(ffmpeg)은 전사 작업에 막히지 않도록 별도 작업자(Q_CLUSTER_NAME=media python manage.py qcluster)로 처리, 작업자 수가 ffmpeg 동시 실행 수
+FFMPEG_MAX_CONCURRENCY = env.int('FFMPEG_MAX_CONCURRENCY', default=2)
+RECORDING_CONVERSION_CLUSTER = env('RECORDING_CONVERSION_CLUSTER', default=None)
+# 실시간 전사는 긴 전사 작업 뒤에 대기하지 않도록 별도 작업자(Q_CLUSTER_NAME=live python manage.py qcluster)로 처리
+LIVE_TRANSCRIPTION_CLUSTER = env('LIVE_TRANSCRIPTION_CLUSTER', default=None)
 Q_CLUSTER = {
     'name': 'DjangORM',
     'workers': 1,
-    'recycle': 1, # 작업 하나 끝날 때마다 프로세스 초기화(메모리 누수 방지)
+    'recycle': 500,
+    'max_rss': env.int('Q_CLUSTER_MAX_RSS_KB', default=4194304),  # 작업자 메모리가 기준(KB)을 넘을 때만 프로세스 초기화(메모리 누수 방지)
     'timeout': 7200,
     'retry': 10800,
     'queue_limit': 50,
     "poll": 3,
     'ack_failures': True,
     'orm': 'default',
+    'ALT_CLUSTERS': {
+        'media': {
+            'workers': FFMPEG_MAX_CONCURRENCY,
+            'timeout': 3600,
+            'retry': 3900,
+        },
+        'live': {
+            'workers': 1,
+            'timeout': 600,
+            'retry': 900,
+        },
+    },
 }
 
+# model cache(음성 인식·정렬·화자 분리 모델이 함께 사용하는 메모리 예산)
+MODEL_CACHE_MEMORY_BUDGET_MB = env.int('MODEL_CACHE_MEMORY_BUDGET_MB', default=8192)
+MODEL_CACHE_GPU_MEMORY_BUDGET_MB = env.int('MODEL_CACHE_GPU_MEMORY_BUDGET_MB', default=6144)
+
+# audio(이 길이 이상의 녹음은 디코딩한 PCM을 메모리 맵 파일로 사용)
+AUDIO_MEMMAP_MIN_SECOND = env.int('AUDIO_MEMMAP_MIN_SECOND', default=1800)
+
+# chunked transcription(긴 녹음을 무음 구간에서 나누어 여러 프로세스로 음성 인식, 1 이하는 사용 안 함, 추론 서버(INFERENCE_SERVER_ENABLED)에서만 동작)
+TRANSCRIPTION_CHUNK_WORKERS = env.int('TRANSCRIPTION_CHUNK_WORKERS', default=1)
+TRANSCRIPTION_CHUNK_SECOND = env.int('TRANSCRIPTION_CHUNK_SECOND', default=600)
+TRANSCRIPTION_CHUNK_MIN_SECOND = env.int('TRANSCRIPTION_CHUNK_MIN_SECOND', default=1800)
+
+# live transcription(실시간 녹음 중 이 길이 이상 쌓이면 음성 인식하고, 끝부분은 다음 구간과 함께 다시 인식하도록 확정하지 않음)
+LIVE_TRANSCRIPTION_MIN_SECOND = env.int('LIVE_TRANSCRIPTION_MIN_SECOND', default=30)
+LIVE_TRANSCRIPTION_TAIL_SECOND = env.int('LIVE_TRANSCRIPTION_TAIL_SECOND', default=5)
+LIVE_RECORDING_MAX_CHUNK_BYTES = env.int('LIVE_RECORDING_MAX_CHUNK_BYTES', default=5 * 1024 * 1024)
+
+# word storage(row: 단어마다 Word 행 저장, packed: 부분마다 단어 배열과 시간·점수 배열을 묶어 저장)
+WORD_STORAGE_MODE = env('WORD_STORAGE_MODE', default='row')
+
+# word alignment(교정된 문장과 단어 대응, 전체 단어 수가 이 값 이상이면 여러 프로세스로 처리, 1 이하는 사용 안 함)
+WORD_ALIGNMENT_WORKERS = env.int('WORD_ALIGNMENT_WORKERS', default=1)
+WORD_ALIGNMENT_PARALLEL_MIN_WORDS = env.int('WORD_ALIGNMENT_PARALLEL_MIN_WORDS', default=50000)
+
+# diarization(저장된 음성 구간이 있으면 음성 구간만 화자 분리, 없으면 전체 음성을 화자 분리하고 음성 인식 단계에서 찾은 음성 구간을 다음 실행을 위해 저장)
+DIARIZATION_SPEECH_REGIONS_ENABLED = env.bool('DIARIZATION_SPEECH_REGIONS_ENABLED', default=True)
+# 회의 참석자 수로 최대 화자 수를 정할 때 더하는 여유 화자 수
+DIARIZATION_SPEAKER_COUNT_MARGIN = env.int('DIARIZATION_SPEAKER_COUNT_MARGIN', default=1)
+# 녹음에 지정할 수 있는 최대 화자 수
+DIARIZATION_MAX_SPEAKER_COUNT = env.int('DIARIZATION_MAX_SPEAKER_COUNT', default=20)
+
+# inference server(모델을 상주시키는 추론 서버, python manage.py inference_server)
+INFERENCE_SERVER_ENABLED = env.bool('INFERENCE_SERVER_ENABLED', default=False)
+INFERENCE_SERVER_HOST = env('INFERENCE_SERVER_HOST', default='127.0.0.1')
+INFERENCE_SERVER_BIND_HOST = env('INFERENCE_SERVER_BIND_HOST', default='127.0.0.1')
+INFERENCE_SERVER_PORT = env.int('INFERENCE_SERVER_PORT', default=58100)
+INFERENCE_SERVER_MAX_RSS_MB = env.int('INFERENCE_SERVER_MAX_RSS_MB', default=16384)
+INFERENCE_SERVER_WARM_UP_LANGUAGE_CODE = env('INFERENCE_SERVER_WARM_UP_LANGUAGE_CODE', default='ko')
+
 # Hugging Face Token
 HF_TOKEN = env('HF_TOKEN')
 
 # Gemini API Key
 GEMINI_API_KEY = env('GEMINI_API_KEY')
 
+# gemini(전사 내용이 이 토큰 수를 넘으면 구간별로 나누어 동시에 교정·요약하고 구간 요약을 합쳐 최종 요약)
+GEMINI_CHUNK_INPUT_TOKENS = env.int('GEMINI_CHUNK_INPUT_TOKENS', default=8000)
+# 구간마다 맥락으로 포함하는 이전 구간 끝부분의 토큰 수
+GEMINI_CHUNK_OVERLAP_TOKENS = env.int('GEMINI_CHUNK_OVERLAP_TOKENS', default=500)
+GEMINI_CHUNK_CONCURRENCY = env.int('GEMINI_CHUNK_CONCURRENCY', default=4)
+GEMINI_MAX_RETRIES = env.int('GEMINI_MAX_RETRIES', default=5)
+# 모델별 분당 요청 수·토큰 수(입력) 할당량, 순서가 우선순위이며 할당량이 남은 모델로 요청
+GEMINI_MODEL_QUOTAS = [
+    ('gemini-3-flash-preview', env.int('GEMINI_3_FLASH_REQUESTS_PER_MINUTE', default=1000), env.int('GEMINI_3_FLASH_TOKENS_PER_MINUTE', default=1000000)),
+    ('gemini-2.5-flash', env.int('GEMINI_2_5_FLASH_REQUESTS_PER_MINUTE', default=1000), env.int('GEMINI_2_5_FLASH_TOKENS_PER_MINUTE', default=1000000)),
+]
+# 429를 받은 모델에 요청하지 않는 시간(Retry-After가 더 길면 Retry-After 사용)
+GEMINI_RATE_LIMIT_COOLDOWN_SECOND = env.int('GEMINI_RATE_LIMIT_COOLDOWN_SECOND', default=60)
+# 할당량이 남은 모델이 없을 때 이 시간 이하면 기다렸다가 요청하고, 넘으면 작업을 다시 예약
+GEMINI_QUOTA_MAX_WAIT_SECOND = env.int('GEMINI_QUOTA_MAX_WAIT_SECOND', default=10)
+# 교정·요약 응답 캐시의 최대 크기(전사 내용·프롬프트·모델이 같으면 저장한 응답 사용, 넘으면 오래 사용하지 않은 응답부터 삭제)
+GEMINI_RESPONSE_CACHE_MAX_BYTES = env.int('GEMINI_RESPONSE_CACHE_MAX_BYTES', default=256 * 1024 * 1024)
+# 프로세스마다 재사용하는 Gemini 클라이언트의 요청 제한 시간, 최대 연결 수(GEMINI_CHUNK_CONCURRENCY 이상), 유휴 연결 유지 시간
+GEMINI_REQUEST_TIMEOUT_SECOND = env.int('GEMINI_REQUEST_TIMEOUT_SECOND', default=600)
+GEMINI_MAX_CONNECTIONS = env.int('GEMINI_MAX_CONNECTIONS', default=8)
+GEMINI_KEEPALIVE_SECOND = env.int('GEMINI_KEEPALIVE_SECOND', default=120)
+
 # upload
 FILE_UPLOAD_MAX_MEMORY_SIZE=67108864
+FILE_UPLOAD_HANDLERS = [
+    'meetings.uploadhandlers.ContentHashUploadHandler',  # 중복 녹음 확인을 위한 내용 해시 계산
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+# resumable upload(조각 단위 업로드, 조각 크기와 파일 최대 크기, 완료되지 않은 업로드 보관 시간)
+RECORDING_UPLOAD_CHUNK_BYTES = env.int('RECORDING_UPLOAD_CHUNK_BYTES', default=8 * 1024 * 1024)
+RECORDING_UPLOAD_MAX_BYTES = env.int('RECORDING_UPLOAD_MAX_BYTES', default=2 * 1024 * 1024 * 1024)
+RECORDING_UPLOAD_EXPIRE_HOUR = env.int('RECORDING_UPLOAD_EXPIRE_HOUR', default=24)
 
 # tls
 if not DEBUG:
@@ -30,4 +30,5 @@ urlpatterns = [
     path('', include('meetings.urls')),
     path("metrics/", views.metrics, name="metrics"),
     path("metrics_realtime/", views.metrics_realtime, name="metrics_realtime"),
+    path("metrics_inference/", views.metrics_inference, name="metrics_inference"),
 ]
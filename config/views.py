@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.shortcuts import render
@@ -8,6 +9,8 @@ from config.metrics.cpu import get_cpu_usage
 from config.metrics.gpu import get_gpu_usage
 from config.metrics.memory import get_memory_usage
 from config.metrics.task import get_task_count
+from meetings.errors import InferenceServerError
+from meetings.inference import InferenceClient
 from meetings.models import SpeechRecognition, Summarization
 
 
@@ -33,3 +36,14 @@ def metrics_realtime(request):
     data['summarization'] = Summarization.get_count()
 
     return JsonResponse(data)
+
+
+@json_login_required
+def metrics_inference(request):
+    if not settings.INFERENCE_SERVER_ENABLED:
+        return JsonResponse({'status': 'disabled'})
+
+    try:
+        return JsonResponse({'status': 'success', 'health': InferenceClient.health()})
+    except InferenceServerError as e:
+        return JsonResponse({'status': 'error', 'message': e.message}, status=503)
@@ -0,0 +1,183 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from rapidfuzz.distance import Indel  # C++ 구현(비트 병렬 LCS), 설치되어 있지 않으면 Myers diff 사용
+except ImportError:
+    Indel = None
+
+logger = logging.getLogger(__name__)
+MAX_EDIT_DISTANCE = 1000  # 구간마다 탐색하는 최대 편집 거리, 넘으면 해당 구간은 위치 순서대로 대응
+MAX_INDEL_CELLS = 25_000_000  # rapidfuzz는 원본 x 교정 단어 수에 비례하는 메모리를 사용하므로 이보다 크면 Myers diff 사용
+
+
+def align_corrected_words(word_texts: list[str], corrected_word_texts: list[str]) -> list[str | None]:
+    # 원본 단어마다 대응하는 교정된 단어를 반환, 교정 과정에서 삭제된 단어는 None
+    # 같은 단어는 최장 공통 부분 수열(rapidfuzz 또는 선형 공간 Myers diff)로 대응시키고, 같은 단어 사이의 바뀐 구간은 위치 순서대로 대응(남는 원본 단어는 삭제)
+    a, b = _encode(word_texts, corrected_word_texts)
+    if Indel is not None and len(a) * len(b) <= MAX_INDEL_CELLS:
+        matches = _match_with_indel(a, b)
+    else:
+        matches = _match(a, b)
+
+    corrected_words = [None] * len(a)
+    i = j = 0
+    for match_i, match_j in matches + [(len(a), len(b))]:
+        for k in range(min(match_i - i, match_j - j)):
+            corrected_words[i + k] = corrected_word_texts[j + k]
+        if match_i < len(a):
+            corrected_words[match_i] = corrected_word_texts[match_j]
+        i, j = match_i + 1, match_j + 1
+
+    return corrected_words
+
+
+class WordAligner:
+    # 여러 부분의 단어 대응을 처리, 전체 단어 수가 많으면 프로세스 풀로 나누어 처리
+    def __init__(self, workers: int = 1, parallel_min_words: int = 0):
+        self.workers = workers
+        self.parallel_min_words = parallel_min_words
+
+    def align_all(self, pairs: list[tuple[list[str], list[str]]]) -> list[list[str | None]]:
+        if not self._can_parallel(pairs):
+            return [align_corrected_words(word_texts, corrected_word_texts) for word_texts, corrected_word_texts in pairs]
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(pairs)), mp_context=context) as executor:
+            return list(executor.map(_align_pair, pairs, chunksize=max(1, len(pairs) // (self.workers * 4))))
+
+    def _can_parallel(self, pairs) -> bool:
+        if self.workers <= 1 or len(pairs) < 2:
+            return False
+        if sum(len(word_texts) for word_texts, _ in pairs) < self.parallel_min_words:
+            return False
+
+        # django-q 작업자는 데몬 프로세스라 자식 프로세스를 만들 수 없으므로 순서대로 처리
+        if multiprocessing.current_process().daemon:
+            logger.info('데몬 프로세스에서는 단어 대응을 병렬로 처리할 수 없어 순서대로 처리해요.')
+            return False
+
+        return True
+
+
+def _align_pair(pair):
+    return align_corrected_words(*pair)
+
+
+def _encode(word_texts, corrected_word_texts):
+    # 문자열 비교 대신 정수 비교를 하도록 단어를 정수로 변환
+    codes = {}
+    a = [codes.setdefault(w, len(codes)) for w in word_texts]
+    b = [codes.setdefault(w, len(codes)) for w in corrected_word_texts]
+    return a, b
+
+
+def _match_with_indel(a, b) -> list[tuple[int, int]]:
+    matches = []
+    for opcode in Indel.opcodes(a, b):
+        if opcode.tag == 'equal':
+            matches.extend(zip(range(opcode.src_start, opcode.src_end), range(opcode.dest_start, opcode.dest_end)))
+    return matches
+
+
+def _match(a, b) -> list[tuple[int, int]]:
+    # 같은 단어의 (원본 위치, 교정 위치) 목록, 재귀 대신 스택으로 구간을 나누어 처리
+    matches = []
+    stack = [(0, len(a), 0, len(b))]
+
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+
+        while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+            matches.append((a0, b0))
+            a0 += 1
+            b0 += 1
+        while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+            a1 -= 1
+            b1 -= 1
+            matches.append((a1, b1))
+
+        if a0 == a1 or b0 == b1:
+            continue
+
+        split = _middle_snake(a, b, a0, a1, b0, b1)
+        if split is None:
+            continue
+
+        x, y = split
+        stack.append((a0, a0 + x, b0, b0 + y))
+        stack.append((a0 + x, a1, b0 + y, b1))
+
+    matches.sort()
+    return matches
+
+
+def _middle_snake(a, b, a0, a1, b0, b1):
+    # 앞과 뒤에서 동시에 최단 편집 경로를 탐색하여 두 경로가 만나는 분할 위치(x, y) 반환
+    # 편집 거리가 MAX_EDIT_DISTANCE를 넘거나 분할할 수 없으면 None
+    n = a1 - a0
+    m = b1 - b0
+    max_d = (n + m + 1) // 2
+    offset = max_d
+    length = 2 * max_d + 2
+    v1 = [-1] * length
+    v2 = [-1] * length
+    v1[offset + 1] = 0
+    v2[offset + 1] = 0
+    delta = n - m
+    front = delta % 2 != 0
+    k1_start = k1_end = k2_start = k2_end = 0
+
+    for d in range(min(max_d, MAX_EDIT_DISTANCE)):
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[a0 + x1] == b[b0 + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1_end += 2
+            elif y1 > m:
+                k1_start += 2
+            elif front:
+                k2_offset = offset + delta - k1
+                if 0 <= k2_offset < length and v2[k2_offset] != -1 and x1 >= n - v2[k2_offset]:
+                    return _split(x1, y1, n, m)
+
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[a1 - x2 - 1] == b[b1 - y2 - 1]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2_end += 2
+            elif y2 > m:
+                k2_start += 2
+            elif not front:
+                k1_offset = offset + delta - k2
+                if 0 <= k1_offset < length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    y1 = offset + x1 - k1_offset
+                    if x1 >= n - x2:
+                        return _split(x1, y1, n, m)
+
+    return None
+
+
+def _split(x, y, n, m):
+    # 구간이 줄어들지 않는 분할은 무시
+    if (x, y) in ((0, 0), (n, m)):
+        return None
+    return x, y
@@ -0,0 +1,174 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import psutil
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# 음성 인식·정렬·화자 분리 모델을 프로세스 메모리에 보관하는 LRU 캐시
+# 장치(RAM/VRAM) 예산을 넘으면 가장 오래 사용하지 않은 모델부터 해제하고, 적중/실패 횟수와 적재 시간을 통계로 남김
+# 적재는 키마다 잠금으로 처리하여 서로 다른 모델(예: 음성 인식과 화자 분리)은 동시에 적재하고, 전역 잠금은 LRU를 갱신할 때만 사용
+class ModelCache:
+    _ENTRIES = OrderedDict()  # key -> {'model', 'size', 'device'}
+    _STATS = {}  # key -> {'hit_count', 'miss_count', 'load_count', 'load_second', 'size'}
+    _EVICTION_COUNT = 0
+    _LOCK = threading.RLock()
+    _LOADING_LOCKS = {}  # key -> threading.Lock
+    _LOADING_COUNT = 0  # 적재 중인 모델 수
+    _LOAD_SEQUENCE = 0  # 적재를 시작할 때마다 증가, 적재 중에 다른 적재가 시작됐는지 확인
+
+    @classmethod
+    def get(cls, key: tuple, loader, device: str):
+        with cls._LOCK:
+            model = cls._get_cached(key)
+            if model is not None:
+                return model
+            loading_lock = cls._LOADING_LOCKS.setdefault(key, threading.Lock())
+
+        with loading_lock:
+            with cls._LOCK:
+                # 기다리는 동안 다른 스레드가 같은 모델을 적재했으면 사용
+                model = cls._get_cached(key)
+                if model is not None:
+                    return model
+
+                stats = cls._get_key_stats(key)
+                stats['miss_count'] += 1
+                logger.debug('Cache miss model %s', key)
+
+                # 이전에 적재한 적이 있으면 측정된 크기만큼 미리 비워 적재 중 메모리 초과를 방지
+                if stats['size']:
+                    cls._evict(device, stats['size'])
+
+                is_overlapped = cls._LOADING_COUNT > 0
+                cls._LOADING_COUNT += 1
+                cls._LOAD_SEQUENCE += 1
+                load_sequence = cls._LOAD_SEQUENCE
+                before = cls._get_used_memory(device)
+
+            start = time.perf_counter()
+            try:
+                model = loader()
+            finally:
+                with cls._LOCK:
+                    cls._LOADING_COUNT -= 1
+                    is_overlapped = is_overlapped or cls._LOAD_SEQUENCE != load_sequence
+            load_second = time.perf_counter() - start
+
+            with cls._LOCK:
+                # 다른 모델을 동시에 적재했으면 메모리 차이에 다른 모델의 할당이 섞이므로 파라미터 크기와 이전에 측정한 크기만 사용
+                measured_size = stats['size'] if is_overlapped else max(0, cls._get_used_memory(device) - before)
+                size = cls._get_model_size(model, measured_size)
+
+                stats['load_count'] += 1
+                stats['load_second'] += load_second
+                stats['size'] = size
+
+                cls._evict(device, size)
+                cls._ENTRIES[key] = {'model': model, 'size': size, 'device': device}
+
+                logger.info(f"모델 적재 완료: {key} ({load_second:.1f}초, {size / 1024 / 1024:.0f}MB, 사용 {cls._get_cached_size(device) / 1024 / 1024:.0f}/"
+                            f"{cls._get_budget(device) / 1024 / 1024:.0f}MB)")
+
+                return model
+
+    @classmethod
+    def clear(cls):
+        with cls._LOCK:
+            cls._ENTRIES.clear()
+            cls._release_memory()
+
+    @classmethod
+    def get_stats(cls):
+        with cls._LOCK:
+            hit_count = sum(s['hit_count'] for s in cls._STATS.values())
+            miss_count = sum(s['miss_count'] for s in cls._STATS.values())
+            return {
+                'hit_count': hit_count,
+                'miss_count': miss_count,
+                'hit_ratio': hit_count / (hit_count + miss_count) if hit_count + miss_count else 0.0,
+                'load_second': sum(s['load_second'] for s in cls._STATS.values()),
+                'eviction_count': cls._EVICTION_COUNT,
+                'models': {
+                    '/'.join(map(str, key)): dict(stats, is_cached=key in cls._ENTRIES)
+                    for key, stats in cls._STATS.items()
+                },
+            }
+
+    @classmethod
+    def _get_cached(cls, key):
+        if key not in cls._ENTRIES:
+            return None
+
+        cls._ENTRIES.move_to_end(key)
+        cls._get_key_stats(key)['hit_count'] += 1
+        logger.debug('Cache hit model %s', key)
+        return cls._ENTRIES[key]['model']
+
+    @classmethod
+    def _get_key_stats(cls, key):
+        if key not in cls._STATS:
+            cls._STATS[key] = {'hit_count': 0, 'miss_count': 0, 'load_count': 0, 'load_second': 0.0, 'size': 0}
+        return cls._STATS[key]
+
+    @classmethod
+    def _evict(cls, device, required_size):
+        budget = cls._get_budget(device)
+        evicted = False
+
+        for key in list(cls._ENTRIES.keys()):
+            if cls._get_cached_size(device) + required_size <= budget:
+                break
+            if cls._ENTRIES[key]['device'] != device:
+                continue
+
+            entry = cls._ENTRIES.pop(key)
+            cls._EVICTION_COUNT += 1
+            evicted = True
+            logger.info(f"모델 캐시 해제: {key} ({entry['size'] / 1024 / 1024:.0f}MB)")
+
+        if evicted:
+            cls._release_memory()
+
+    @classmethod
+    def _get_cached_size(cls, device):
+        return sum(e['size'] for e in cls._ENTRIES.values() if e['device'] == device)
+
+    @staticmethod
+    def _get_budget(device):
+        if device == 'cuda':
+            return settings.MODEL_CACHE_GPU_MEMORY_BUDGET_MB * 1024 * 1024
+        return settings.MODEL_CACHE_MEMORY_BUDGET_MB * 1024 * 1024
+
+    @staticmethod
+    def _get_used_memory(device):
+        if device == 'cuda':
+            import torch
+            return torch.cuda.memory_allocated()
+        return psutil.Process().memory_info().rss
+
+    @staticmethod
+    def _get_model_size(model, measured_size):
+        # torch 모듈은 파라미터 크기로 계산하고, ctranslate2 등 그 외 모델은 적재 전후 메모리 차이를 사용
+        import torch
+
+        modules = [m for m in (model if isinstance(model, tuple) else (model,)) if isinstance(m, torch.nn.Module)]
+        if not modules:
+            modules = [m for m in vars(model).values() if isinstance(m, torch.nn.Module)] if hasattr(model, '__dict__') else []
+
+        size = sum(t.numel() * t.element_size() for m in modules for t in (*m.parameters(), *m.buffers()))
+        return max(size, measured_size)
+
+    @staticmethod
+    def _release_memory():
+        import gc
+        import torch
+
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
@@ -0,0 +1,78 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+import numpy as np
+from pandas import DataFrame
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StageCheckpoint:
+    # 음성 인식 단계별 결과를 녹음 파일 옆(media/checkpoints/<녹음 id>)에 압축 저장하여, 실패한 작업을 마지막으로 완료된 단계부터 재개
+    # 파일 이름에 모델 버전 해시를 포함하여 모델이 바뀌면 이전 결과를 사용하지 않음
+    # 음성 인식 외의 작업(교정·요약 등)은 category 디렉터리(media/checkpoints/<category>/<녹음 id>)를 사용하여 clear()가 서로의 체크포인트를 지우지 않음
+    def __init__(self, recording_id: int, model_version: str, category: str | None = None):
+        self.directory = os.path.join(settings.MEDIA_ROOT, 'checkpoints', *([category] if category else []), str(recording_id))
+        self.version = hashlib.sha1(model_version.encode('utf-8')).hexdigest()[:12]
+
+    def load(self, step_code):
+        for path in (self._get_path(step_code, 'json.gz'), self._get_path(step_code, 'npz')):
+            if not os.path.exists(path):
+                continue
+
+            try:
+                if path.endswith('.npz'):
+                    with np.load(path, allow_pickle=False) as data:
+                        data = DataFrame({'start': data['start'], 'end': data['end'], 'speaker': data['speaker']})
+                else:
+                    with gzip.open(path, 'rt', encoding='utf-8') as f:
+                        data = json.load(f)
+            except Exception as e:
+                logger.warning(f"체크포인트 읽기 실패({path}): {e}")
+                return None
+
+            logger.info(f"체크포인트 사용: {path}")
+            return data
+
+        return None
+
+    def save(self, step_code, data):
+        os.makedirs(self.directory, exist_ok=True)
+
+        if isinstance(data, DataFrame):
+            path = self._get_path(step_code, 'npz')
+            temp_path = f"{path}.tmp.npz"
+            np.savez_compressed(
+                temp_path,
+                start=data['start'].to_numpy(dtype=np.float64),
+                end=data['end'].to_numpy(dtype=np.float64),
+                speaker=data['speaker'].astype(str).to_numpy(dtype=str),
+            )
+        else:
+            path = self._get_path(step_code, 'json.gz')
+            temp_path = f"{path}.tmp"
+            with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'), default=StageCheckpoint._to_json)
+
+        # 쓰기 도중 실패해도 깨진 체크포인트가 남지 않도록 임시 파일을 교체
+        os.replace(temp_path, path)
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _get_path(self, step_code, extension):
+        return os.path.join(self.directory, f"{step_code}-{self.version}.{extension}")
+
+    @staticmethod
+    def _to_json(value):
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return str(value)
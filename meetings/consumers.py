@@ -0,0 +1,176 @@
+import json
+import logging
+import os
+import time
+import uuid
+from importlib import import_module
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import aget_user
+from django.db import transaction
+from django.http.cookie import parse_cookie
+from django.urls import reverse
+from django_q.tasks import async_task, fetch
+
+from config import settings
+from .models import Meeting, Recording, Segment, get_recording_upload_path
+
+logger = logging.getLogger(__name__)
+
+
+class LiveRecordingConsumer:
+    # 브라우저 MediaRecorder가 보내는 webm 조각을 녹음 파일에 이어 쓰고, 일정 길이 이상 쌓이면 실시간 전사 작업을 요청
+    # 메시지: 바이너리(webm 조각), 텍스트 {"type": "stop"}(녹음 종료)
+    # 응답: {"type": "started"}, {"type": "segments"}(새로 확정된 임시 부분), {"type": "completed"}(녹음 정보), {"type": "error"}
+    def __init__(self, meeting_id: int):
+        self.meeting_id = meeting_id
+        self.user = None
+        self.recording = None
+        self.file = None
+        self.task_id = None
+        self.task_requested_time = time.monotonic()
+        self.last_segment_id = 0
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+
+        try:
+            while True:
+                message = await receive()
+
+                if message['type'] == 'websocket.connect':
+                    if not await self.connect(scope):
+                        await send({'type': 'websocket.close', 'code': 4403})
+                        return
+                    await send({'type': 'websocket.accept'})
+                    await self.send_json({'type': 'started', 'id': self.recording.pk})
+                elif message['type'] == 'websocket.receive':
+                    if message.get('bytes') is not None:
+                        await self.receive_chunk(message['bytes'])
+                    elif json.loads(message.get('text') or '{}').get('type') == 'stop':
+                        await self.stop()
+                        await send({'type': 'websocket.close', 'code': 1000})
+                        return
+                elif message['type'] == 'websocket.disconnect':
+                    return
+        finally:
+            # 녹음 종료 메시지 없이 연결이 끊기거나(브라우저 종료 등) 예외가 발생하면 지금까지 받은 녹음으로 종료 처리
+            # 종료하지 않으면 녹음이 실시간 녹음 상태로 남아 전사할 수 없고 파일이 열린 채로 남음
+            if self.recording is not None:
+                await self.stop(notify=False)
+
+    async def connect(self, scope) -> bool:
+        headers = {name.decode('latin1'): value.decode('latin1') for name, value in scope.get('headers', [])}
+
+        # 웹소켓은 CSRF 검증을 거치지 않으므로 다른 출처에서 연 연결을 거부
+        origin = headers.get('origin')
+        if origin and not self._is_allowed_origin(origin, headers.get('host')):
+            logger.warning(f"실시간 녹음 연결 거부 (출처 불일치: {origin})")
+            return False
+
+        session_key = parse_cookie(headers.get('cookie', '')).get(settings.SESSION_COOKIE_NAME)
+        session_store = import_module(settings.SESSION_ENGINE).SessionStore
+        user = await aget_user(SimpleNamespace(session=session_store(session_key)))
+        if not user.is_authenticated:
+            return False
+
+        self.user = user
+        self.recording = await sync_to_async(self._create_recording)()
+        return self.recording is not None
+
+    async def receive_chunk(self, data: bytes):
+        if len(data) > settings.LIVE_RECORDING_MAX_CHUNK_BYTES:
+            await self.send_json({'type': 'error', 'message': '⛔️ 녹음 조각이 너무 커요.'})
+            return
+
+        await sync_to_async(self._write)(data)
+        await sync_to_async(self._request_live_transcription)()
+
+        segments = await sync_to_async(self._find_new_segments)()
+        if segments:
+            await self.send_json({'type': 'segments', 'segments': segments})
+
+    async def stop(self, notify=True):
+        # 종료 처리 중 예외가 발생해도 다시 종료 처리하지 않도록 먼저 녹음을 비움
+        recording, self.recording = self.recording, None
+        await sync_to_async(self._stop)(recording)
+
+        if notify:
+            download_url = reverse('download_recording', args=[self.meeting_id, recording.pk])
+            await self.send_json({
+                'type': 'completed',
+                'status': 'success',
+                'id': recording.pk,
+                'play_millisecond': recording.play_millisecond,
+                'download_url': download_url,
+            })
+
+    async def send_json(self, data: dict):
+        await self.send({'type': 'websocket.send', 'text': json.dumps(data, ensure_ascii=False)})
+
+    @staticmethod
+    def _is_allowed_origin(origin: str, host: str | None) -> bool:
+        # 같은 출처(Host와 일치)이거나 신뢰하는 출처(CSRF_TRUSTED_ORIGINS)와 정확히 일치할 때만 허용
+        return urlparse(origin).netloc == host or origin in getattr(settings, 'CSRF_TRUSTED_ORIGINS', [])
+
+    def _create_recording(self):
+        meeting = Meeting.objects.filter(pk=self.meeting_id).first()
+        if meeting is None or not meeting.can_edit(self.user):
+            return None
+
+        webm_file_name = get_recording_upload_path(None, f"{uuid.uuid4()}.webm")
+        webm_file_path = os.path.join(settings.MEDIA_ROOT, webm_file_name)
+        os.makedirs(os.path.dirname(webm_file_path), exist_ok=True)
+        self.file = open(webm_file_path, 'ab')
+
+        with transaction.atomic():
+            recording = Recording.objects.create(
+                meeting=meeting,
+                content_type='audio/webm',
+                upload_file_name=os.path.basename(webm_file_name),
+                is_live=True,
+                created_user=self.user,
+                last_modified_user=self.user,
+            )
+            recording.webm_file.name = webm_file_name
+            recording.save(update_fields=['webm_file'])
+
+            recording.start_live_recording(self.user)
+
+        logger.info(f"실시간 녹음 시작: Recording #{recording.pk}")
+
+        return recording
+
+    def _write(self, data: bytes):
+        self.file.write(data)
+        self.file.flush()
+
+    def _request_live_transcription(self):
+        # 작업자 수가 적으므로 음성이 충분히 쌓였고 이전 실시간 전사 작업이 끝난 뒤에만 다음 작업을 요청
+        if time.monotonic() - self.task_requested_time < settings.LIVE_TRANSCRIPTION_MIN_SECOND:
+            return
+        if self.task_id is not None and fetch(self.task_id) is None:
+            return
+
+        self.task_requested_time = time.monotonic()
+        self.task_id = async_task('meetings.tasks.run_live_transcription', self.recording.pk, self.user.pk, cluster=settings.LIVE_TRANSCRIPTION_CLUSTER)
+
+    def _find_new_segments(self):
+        segments = list(Segment.objects
+                        .filter(speech_recognition_id=self.recording.latest_speech_recognition_id, is_provisional=True, pk__gt=self.last_segment_id)
+                        .order_by('pk')
+                        .values('id', 'start_millisecond', 'end_millisecond', 'text'))
+        if segments:
+            self.last_segment_id = segments[-1]['id']
+
+        return [{'id': s['id'], 'start': s['start_millisecond'], 'end': s['end_millisecond'], 'text': s['text']} for s in segments]
+
+    def _stop(self, recording):
+        self.file.close()
+
+        with transaction.atomic():
+            recording.stop_live_recording(self.user)
+
+        logger.info(f"실시간 녹음 종료: Recording #{recording.pk} ({recording.play_millisecond}ms)")
@@ -0,0 +1,104 @@
+import numpy as np
+from pandas import DataFrame
+
+from .media import SAMPLE_RATE
+
+SPEECH_REGION_PADDING_MILLISECOND = 200  # 음성 구간 앞뒤 여유
+SPEECH_REGION_MERGE_GAP_MILLISECOND = 1000  # 이보다 짧은 무음으로 떨어진 음성 구간은 하나로 합침
+OVERLAP_EPSILON = 1e-9  # 누적 합 차이로 계산하므로 부동 소수점 오차보다 작은 겹침은 겹치지 않은 것으로 처리
+
+
+class SpeakerAssigner:
+    # 화자 분리 결과로 부분·단어의 화자를 지정(whisperx.assign_word_speakers와 같은 결과)
+    # 부분·단어마다 구간과 겹치는 시간이 가장 긴 화자를 지정하고, 겹치는 화자가 없으면 지정하지 않음
+    # 화자별로 발화 시작·종료 시간을 정렬해 누적 합을 만들어 두고, 시각 t까지의 발화 시간 F(t)를 searchsorted로 계산하여
+    # 구간 [s, e]와 겹치는 시간을 F(e) - F(s)로 구함, 화자 수 K, 발화 수 T, 단어 수 W에 대해 O(K(W + T) log T)
+    def __init__(self, diarized: tuple[DataFrame, dict[str, list[float]] | None] | DataFrame):
+        diarize_df = diarized[0] if isinstance(diarized, tuple) else diarized
+
+        self.speakers = sorted(diarize_df['speaker'].unique()) if len(diarize_df) else []
+        self.intervals = []
+        for speaker in self.speakers:
+            turns = diarize_df[diarize_df['speaker'] == speaker]
+            starts = np.sort(turns['start'].to_numpy(dtype=np.float64))
+            ends = np.sort(turns['end'].to_numpy(dtype=np.float64))
+            self.intervals.append((
+                starts, np.concatenate(([0.0], np.cumsum(starts))),
+                ends, np.concatenate(([0.0], np.cumsum(ends))),
+            ))
+
+    def assign(self, aligned: dict) -> dict:
+        segments = aligned['segments']
+        words = [word for segment in segments for word in segment.get('words', []) if 'start' in word]
+        items = segments + words
+
+        speakers = self.find_speakers(
+            np.asarray([item['start'] for item in items], dtype=np.float64),
+            np.asarray([item['end'] for item in items], dtype=np.float64),
+        )
+        for item, speaker in zip(items, speakers):
+            if speaker is not None:
+                item['speaker'] = speaker
+
+        return aligned
+
+    def find_speakers(self, starts: np.ndarray, ends: np.ndarray) -> list[str | None]:
+        if not self.speakers or len(starts) == 0:
+            return [None] * len(starts)
+
+        overlaps = np.stack([self._covered(interval, ends) - self._covered(interval, starts) for interval in self.intervals])
+        best = np.argmax(overlaps, axis=0)
+        has_speaker = overlaps[best, np.arange(len(starts))] > OVERLAP_EPSILON
+
+        return [self.speakers[index] if found else None for index, found in zip(best.tolist(), has_speaker.tolist())]
+
+    @staticmethod
+    def _covered(interval, times: np.ndarray) -> np.ndarray:
+        # 시각 t까지 화자가 발화한 시간의 합
+        # F(t) = Σ(시작 <= t) (t - 시작) - Σ(종료 <= t) (t - 종료)
+        starts, start_sums, ends, end_sums = interval
+        started = np.searchsorted(starts, times, side='right')
+        ended = np.searchsorted(ends, times, side='right')
+        return (started * times - start_sums[started]) - (ended * times - end_sums[ended])
+
+
+class SpeechRegions:
+    # 음성 인식(VAD) 단계에서 찾은 음성 구간만 이어 붙여 화자 분리하고, 화자 분리 결과의 시간을 원래 녹음의 시간으로 되돌림
+    def __init__(self, regions: list[list[int]]):
+        self.regions = regions
+        self.starts = np.asarray([start for start, _ in regions], dtype=np.float64) / 1000
+        lengths = np.asarray([end - start for start, end in regions], dtype=np.float64) / 1000
+        self.offsets = np.concatenate(([0.0], np.cumsum(lengths)))  # 이어 붙인 음성에서 각 구간의 시작 초
+
+    @staticmethod
+    def from_segments(segments: list[dict], duration_millisecond: int) -> list[list[int]]:
+        # 음성 인식 결과의 부분은 VAD가 찾은 음성 구간 단위이므로 부분의 시작·종료 시간으로 음성 구간을 만듦
+        regions = []
+        for segment in sorted(segments, key=lambda s: s['start']):
+            start = max(0, int(segment['start'] * 1000) - SPEECH_REGION_PADDING_MILLISECOND)
+            end = int(segment['end'] * 1000) + SPEECH_REGION_PADDING_MILLISECOND
+            if duration_millisecond:
+                end = min(duration_millisecond, end)
+            if end <= start:
+                continue
+
+            if regions and start - regions[-1][1] < SPEECH_REGION_MERGE_GAP_MILLISECOND:
+                regions[-1][1] = max(regions[-1][1], end)
+            else:
+                regions.append([start, end])
+
+        return regions
+
+    def concatenate(self, audio: np.ndarray) -> np.ndarray:
+        return np.concatenate([audio[start * SAMPLE_RATE // 1000:end * SAMPLE_RATE // 1000] for start, end in self.regions])
+
+    def restore(self, diarize_df: DataFrame) -> DataFrame:
+        diarize_df = diarize_df.drop(columns=['segment'], errors='ignore').copy()
+        diarize_df['start'] = self._to_original_second(diarize_df['start'].to_numpy(dtype=np.float64), 'right')
+        diarize_df['end'] = self._to_original_second(diarize_df['end'].to_numpy(dtype=np.float64), 'left')
+        return diarize_df
+
+    def _to_original_second(self, times: np.ndarray, side) -> np.ndarray:
+        # 구간 경계의 시각은 시작이면 다음 구간, 종료면 이전 구간으로 대응
+        index = np.clip(np.searchsorted(self.offsets, times, side=side) - 1, 0, len(self.regions) - 1)
+        return self.starts[index] + (times - self.offsets[index])
@@ -14,3 +14,15 @@ class GeminiApiError(Exception):
         self.generative_ai_model_name = generative_ai_model_name
         self.exception = exception
         super().__init__(message)
+
+
+class GeminiRateLimitError(GeminiApiError):
+    # 429 RESOURCE_EXHAUSTED, 작업자를 점유하지 않도록 대기하지 않고 작업을 다시 예약
+    def __init__(self, message: str, generative_ai_model_name: Optional[str] = None, exception: Optional[Exception] = None):
+        super().__init__(message, generative_ai_model_name, exception)
+
+
+class InferenceServerError(Exception):
+    def __init__(self, message: str):
+        self.message = f"추론 서버 처리 중 예외가 발생했어요 (원인: {message if message else '알 수 없음'})"
+        super().__init__(message)
@@ -0,0 +1,546 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from google import genai
+from google.genai import types
+from google.genai.errors import APIError
+
+from config import settings
+from .checkpoints import StageCheckpoint
+from .errors import GeminiApiError, GeminiRateLimitError
+from .models import GenerativeAiModelQuota, GenerativeAiResponseCache
+
+logger = logging.getLogger(__name__)
+PROMPT_VERSION = '1'  # 프롬프트나 응답 스키마를 바꾸면 올려서 이전에 저장한 응답을 사용하지 않음
+_HANGUL_PATTERN = re.compile(r'[가-힣ㄱ-ㆎ]')
+_REQUEST_TIMING = contextvars.ContextVar('gemini_request_timing', default=None)  # 요청마다 연결(DNS·TCP·TLS)에 걸린 시간을 모음
+
+# AI의 행동 강령/정체성 부여
+SYSTEM_INSTRUCTION = (
+    "당신은 회의록 전사 기록을 교정하고 내용을 구조화하여 공식 회의록을 작성하는 전문가입니다. "
+    "제공된 데이터를 분석하여 반드시 **지정된 JSON 스키마 형식**으로만 응답해야 합니다.\n\n"
+    "**[핵심 원칙]**\n"
+    "1. **정확성:** 원본의 의미를 왜곡하지 않고 정확하게 교정해야 합니다.\n"
+    "2. **데이터 무결성:** 결과의 'corrected_segments' 리스트에 있는 'original_segment_id'는 입력된 원본 ID와 반드시 일치해야 합니다.\n"
+    "3. **가독성 (문단 분리):** 텍스트 교정 시, 다음 기준에 따라 적극적으로 문단을 분리하고 개행 문자('\\n')를 사용하십시오.\n"
+    "   - 화자가 바뀌거나 주제가 전환될 때.\n"
+    "   - 하나의 문단에는 하나의 중심 생각만 담을 것."
+)
+
+CORRECT_WORD_PROMPT = " 단어의 원형은 가급적 유지하며 문법만 교정하십시오."
+IS_CORRECT_WORD = False  # 단어 교정을 우선으로 하려면
+
+_GENERAL_SUMMARIZATION_SCHEMA = types.Schema(
+    type=types.Type.STRING,
+    description="교정된 전체 내용을 약 10줄로 개괄적으로 요약한 내용입니다."
+)
+_MEETING_MINUTES_SCHEMA = types.Schema(
+    type=types.Type.STRING,
+    description="회의의 핵심 의제, 주요 논의 결과 및 결정 사항을 문어체, 두괄식으로 압축하여 작성한 공식 회의록 본문입니다."
+)
+_ACTION_ITEMS_SCHEMA = types.Schema(
+    type=types.Type.ARRAY,
+    description="회의 내용에서 도출된 조치 사항(Action Item)을 추출합니다. 각 항목은 '주체: 내용' 또는 '주체(마감일): 내용' 형태로 작성합니다.",
+    items=types.Schema(
+        type=types.Type.STRING,
+        description="하나의 구체적인 액션 아이템 (예: 홍길동: 12/31까지 보고서 초안 작성)"
+    )
+)
+_CORRECTED_SEGMENTS_SCHEMA = types.Schema(
+    type=types.Type.ARRAY,
+    description="각 세그먼트의 교정 결과 리스트입니다.",
+    items=types.Schema(
+        type=types.Type.OBJECT,
+        properties={
+            "original_segment_id": types.Schema(
+                type=types.Type.INTEGER,
+                description="요청 시 제공된 Segment의 ID (이 값을 반드시 그대로 반환해야 합니다)."
+            ),
+            "corrected_text": types.Schema(
+                type=types.Type.STRING,
+                description="원본 텍스트를 문법, 오타 등을 교정한 최종 결과 텍스트입니다. 화자 레이블은 포함하지 않습니다."
+            )
+        },
+        required=["original_segment_id", "corrected_text"]
+    )
+)
+
+# 한 번에 요청(교정·요약)
+RESPONSE_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "general_summarization": _GENERAL_SUMMARIZATION_SCHEMA,
+        "meeting_minutes": _MEETING_MINUTES_SCHEMA,
+        "action_items": _ACTION_ITEMS_SCHEMA,
+        "corrected_segments": _CORRECTED_SEGMENTS_SCHEMA,
+    },
+    required=["general_summarization", "meeting_minutes", "action_items", "corrected_segments"]
+)
+
+# 구간별 요청(교정, 구간 요약)
+CHUNK_RESPONSE_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "chunk_summarization": types.Schema(
+            type=types.Type.STRING,
+            description="이 구간에서 논의된 의제, 주요 논의 내용, 결정 사항을 빠짐없이 정리한 요약입니다."
+        ),
+        "action_items": _ACTION_ITEMS_SCHEMA,
+        "corrected_segments": _CORRECTED_SEGMENTS_SCHEMA,
+    },
+    required=["chunk_summarization", "action_items", "corrected_segments"]
+)
+
+# 구간 요약을 합쳐 최종 요약
+REDUCE_RESPONSE_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "general_summarization": _GENERAL_SUMMARIZATION_SCHEMA,
+        "meeting_minutes": _MEETING_MINUTES_SCHEMA,
+        "action_items": _ACTION_ITEMS_SCHEMA,
+    },
+    required=["general_summarization", "meeting_minutes", "action_items"]
+)
+
+
+def estimate_tokens(text: str) -> int:
+    # 토큰 수 API를 호출하지 않고 보수적으로 추정, 한글은 글자당 약 1토큰, 그 외 문자는 약 4자당 1토큰
+    hangul_count = len(_HANGUL_PATTERN.findall(text))
+    return hangul_count + math.ceil((len(text) - hangul_count) / 4)
+
+
+def dump_segments(segments: list[dict]) -> str:
+    # 한국어 처리를 위해 ensure_ascii=False, 토큰을 줄이기 위해 들여쓰기 없이 한 줄에 한 부분
+    return "\n".join(json.dumps(segment, ensure_ascii=False) for segment in segments)
+
+
+def plan_chunks(segments: list[dict], max_tokens: int, overlap_tokens: int) -> list[dict]:
+    # 부분을 토큰 예산 이하의 구간으로 나눔, 구간마다 앞 구간의 끝부분(overlap_tokens 이하)을 교정하지 않는 맥락으로 포함
+    # [{'context': [이전 구간 끝부분], 'segments': [교정할 부분]}, ...]
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for segment in segments:
+        tokens = estimate_tokens(json.dumps(segment, ensure_ascii=False))
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+
+        current.append(segment)
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+
+    planned = []
+    for index, chunk in enumerate(chunks):
+        context = []
+        if index > 0:
+            context_tokens = 0
+            for segment in reversed(chunks[index - 1]):
+                context_tokens += estimate_tokens(json.dumps(segment, ensure_ascii=False))
+                if context_tokens > overlap_tokens:
+                    break
+                context.insert(0, segment)
+
+        planned.append({'context': context, 'segments': chunk})
+
+    return planned
+
+
+class GeminiClientPool:
+    # 프로세스마다 genai.Client 하나와 이벤트 루프 스레드 하나를 유지하여 요청 사이에 HTTP 연결(TLS 포함)을 재사용
+    # 비동기 HTTP 연결은 만든 이벤트 루프에 묶이므로 작업마다 asyncio.run으로 루프를 새로 만들지 않고 같은 루프에서 실행
+    # 요청마다 연결 시간과 생성(응답 대기) 시간을 나누어 통계로 남김
+    _CLIENT = None
+    _LOOP = None
+    _PID = None
+    _STATS = {'request_count': 0, 'connect_count': 0, 'connect_second': 0.0, 'generation_second': 0.0}
+    _LOCK = threading.Lock()
+
+    @classmethod
+    def run(cls, coroutine):
+        # 작업자 스레드에서 호출하여 풀의 이벤트 루프에서 실행하고 결과를 기다림
+        return asyncio.run_coroutine_threadsafe(coroutine, cls._get_loop()).result()
+
+    @classmethod
+    def get_client(cls) -> genai.Client:
+        with cls._LOCK:
+            cls._reset_if_forked()
+            if cls._CLIENT is None:
+                cls._CLIENT = genai.Client(http_options=types.HttpOptions(
+                    timeout=settings.GEMINI_REQUEST_TIMEOUT_SECOND * 1000,
+                    httpx_async_client=httpx.AsyncClient(
+                        limits=httpx.Limits(
+                            max_connections=settings.GEMINI_MAX_CONNECTIONS,
+                            max_keepalive_connections=settings.GEMINI_MAX_CONNECTIONS,
+                            keepalive_expiry=settings.GEMINI_KEEPALIVE_SECOND,
+                        ),
+                        event_hooks={'request': [cls._trace_request]},
+                    ),
+                ))
+                logger.info(f"Gemini 클라이언트 생성 (PID {cls._PID})")
+            return cls._CLIENT
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        with cls._LOCK:
+            return dict(cls._STATS)
+
+    @classmethod
+    def measure(cls, generative_ai_model_name: str, start: float) -> tuple[float, float]:
+        # 요청을 시작한 뒤 지난 시간을 (연결 밀리초, 생성 밀리초)로 나누어 통계에 더함
+        timing = _REQUEST_TIMING.get() or {'connect_count': 0, 'connect_second': 0.0}
+        connect_second = timing['connect_second']
+        generation_second = max(0.0, time.perf_counter() - start - connect_second)
+
+        with cls._LOCK:
+            cls._STATS['request_count'] += 1
+            cls._STATS['connect_count'] += timing['connect_count']
+            cls._STATS['connect_second'] += connect_second
+            cls._STATS['generation_second'] += generation_second
+
+        logger.info(f"Gemini 응답 (모델: {generative_ai_model_name}, 연결 {connect_second * 1000:.0f}ms, 생성 {generation_second * 1000:.0f}ms, "
+                    f"{'새 연결' if timing['connect_count'] else '연결 재사용'})")
+        return connect_second * 1000, generation_second * 1000
+
+    @staticmethod
+    def start_timing():
+        _REQUEST_TIMING.set({'connect_count': 0, 'connect_second': 0.0, 'connect_start': None})
+
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._LOCK:
+            cls._reset_if_forked()
+            if cls._LOOP is None:
+                cls._LOOP = asyncio.new_event_loop()
+                threading.Thread(target=cls._LOOP.run_forever, name='gemini-client-loop', daemon=True).start()
+            return cls._LOOP
+
+    @classmethod
+    def _reset_if_forked(cls):
+        # 작업자 프로세스가 fork되면 부모의 스레드와 연결을 사용할 수 없으므로 다시 생성
+        if cls._PID != os.getpid():
+            cls._PID = os.getpid()
+            cls._CLIENT = None
+            cls._LOOP = None
+
+    @staticmethod
+    async def _trace_request(request: httpx.Request):
+        timing = _REQUEST_TIMING.get()
+        if timing is None:
+            return
+
+        async def trace(event_name, info):
+            # 연결을 재사용하면 connect_tcp, start_tls 이벤트가 발생하지 않음
+            if event_name == 'connection.connect_tcp.started':
+                timing['connect_start'] = time.perf_counter()
+            elif event_name in ('connection.connect_tcp.complete', 'connection.start_tls.complete') and timing['connect_start'] is not None:
+                now = time.perf_counter()
+                timing['connect_second'] += now - timing['connect_start']
+                timing['connect_start'] = now
+                if event_name == 'connection.connect_tcp.complete':
+                    timing['connect_count'] += 1
+
+        request.extensions['trace'] = trace
+
+
+def get_response_cache_key(segments: list[dict], generative_ai_model_name: str) -> str:
+    # 전사 내용, 시스템 지침, 응답 스키마, 모델 이름이 같으면 같은 키
+    schemas = [schema.model_dump(mode='json', exclude_none=True) for schema in (RESPONSE_SCHEMA, CHUNK_RESPONSE_SCHEMA, REDUCE_RESPONSE_SCHEMA)]
+    payload = json.dumps([PROMPT_VERSION, generative_ai_model_name, SYSTEM_INSTRUCTION, schemas, segments], ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class GeminiModelRouter:
+    # 요청 전에 할당량(GenerativeAiModelQuota)이 남은 모델을 골라 차감하고, 모델별 응답 시간과 실제 토큰 수를 기록
+    # 모든 모델의 할당량이 GEMINI_QUOTA_MAX_WAIT_SECOND 안에 충전되지 않으면 GeminiRateLimitError로 작업을 다시 예약하도록 함
+    def __init__(self, quotas: list[tuple[str, int, int]] | None = None):
+        self.quotas = quotas or settings.GEMINI_MODEL_QUOTAS
+
+    async def acquire(self, token_count: int, preferred_name: str | None = None) -> str:
+        while True:
+            generative_ai_model_name, wait_second = await self._call_db(GenerativeAiModelQuota.acquire, self.quotas, token_count, preferred_name)
+            if generative_ai_model_name is not None:
+                return generative_ai_model_name
+
+            if wait_second > settings.GEMINI_QUOTA_MAX_WAIT_SECOND:
+                # 할당량을 가장 먼저 확인한 모델(우선 사용할 모델 또는 우선순위가 가장 높은 모델)로 재시도를 예약
+                generative_ai_model_name = preferred_name or self.quotas[0][0]
+                raise GeminiRateLimitError(message=f"할당량이 남은 모델이 없어요. ({wait_second:.0f}초 후 사용 가능)", generative_ai_model_name=generative_ai_model_name)
+
+            logger.info(f"할당량이 남은 모델이 없어 {wait_second:.1f}초 후 요청합니다.")
+            await asyncio.sleep(wait_second)
+
+    async def record(self, generative_ai_model_name: str, latency_millisecond: float, token_count: int, response):
+        usage_metadata = getattr(response, 'usage_metadata', None)
+        prompt_token_count = getattr(usage_metadata, 'prompt_token_count', None)
+        token_count_correction = prompt_token_count - token_count if prompt_token_count is not None else 0
+        await self._call_db(GenerativeAiModelQuota.record, generative_ai_model_name, latency_millisecond, token_count_correction)
+
+    async def exhaust(self, generative_ai_model_name: str, exception: APIError | None = None):
+        await self._call_db(GenerativeAiModelQuota.exhaust, generative_ai_model_name, self._get_retry_after_second(exception))
+
+    @staticmethod
+    def _get_retry_after_second(exception: APIError | None) -> float | None:
+        # Retry-After 헤더 또는 응답 본문의 RetryInfo(retryDelay: '37s')에서 다시 요청할 수 있는 시간을 읽음
+        if exception is None:
+            return None
+
+        headers = getattr(getattr(exception, 'response', None), 'headers', None) or {}
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            pass
+
+        details = exception.details if isinstance(getattr(exception, 'details', None), dict) else {}
+        for detail in details.get('error', {}).get('details', []) or []:
+            retry_delay = detail.get('retryDelay') if isinstance(detail, dict) else None
+            if isinstance(retry_delay, str) and retry_delay.endswith('s'):
+                try:
+                    return float(retry_delay[:-1])
+                except ValueError:
+                    pass
+        return None
+
+    @staticmethod
+    async def _call_db(func, *args):
+        # sync_to_async의 스레드는 요청·작업 주기 밖에서 계속 재사용되어 Django가 연결을 정리하지 않으므로
+        # DB 재시작이나 유휴 시간 초과로 끊긴 연결을 호출 전후에 직접 정리
+        def call():
+            close_old_connections()
+            try:
+                return func(*args)
+            finally:
+                close_old_connections()
+
+        return await sync_to_async(call)()
+
+
+class GeminiSummarizer:
+    # 교정·요약 요청을 계획하고 실행
+    # 전사 내용이 GEMINI_CHUNK_INPUT_TOKENS 이하이면 한 번에 요청하고, 넘으면 구간별로 교정·요약을 동시에 요청(map)한 뒤 구간 요약을 합쳐 최종 요약(reduce)
+    # 요청마다 재시도하고, 성공한 응답은 체크포인트로 저장하여 작업이 실패해도 다시 실행할 때 완료된 구간은 요청하지 않음
+    # 요청할 모델은 GeminiModelRouter가 할당량에 따라 고르고, 429를 받은 모델은 할당량을 비운 뒤 다른 모델로 재시도
+    # 사용할 수 있는 모델이 없으면 대기하지 않고 GeminiRateLimitError를 발생시켜 작업을 다시 예약하도록 함
+    def __init__(self, checkpoint: StageCheckpoint | None = None, generative_ai_model_name: str | None = None, router: GeminiModelRouter | None = None):
+        self.checkpoint = checkpoint
+        self.generative_ai_model_name = generative_ai_model_name  # 우선 사용할 모델(재시도 전에 사용한 모델), 동시에 실행하는 구간 요청이 공유하므로 요청 중에는 바꾸지 않음
+        self.router = router or GeminiModelRouter()
+
+    def run(self, segments: list[dict]) -> tuple[str, dict]:
+        cache_keys = {name: get_response_cache_key(segments, name) for name, _, _ in self.router.quotas}
+        cache = GenerativeAiResponseCache.find([cache_keys[name] for name in self._order_by_preferred(list(cache_keys))])
+        if cache is not None:
+            logger.info(f"교정·요약 응답 캐시 사용: 모델 {cache.generative_ai_model_name}, 부분 {len(segments)}개")
+            return cache.generative_ai_model_name, cache.response
+
+        chunks = plan_chunks(segments, settings.GEMINI_CHUNK_INPUT_TOKENS, settings.GEMINI_CHUNK_OVERLAP_TOKENS)
+        logger.info(f"교정·요약 요청 계획: 부분 {len(segments)}개, 구간 {len(chunks)}개")
+
+        try:
+            generative_ai_model_name, result = GeminiClientPool.run(self._run(chunks))
+        except GeminiApiError:
+            raise
+        except Exception as e:
+            logger.error(f"Gemini API 호출 실패: {e}")
+            raise GeminiApiError(message=f"시스템 예외({str(e)})", generative_ai_model_name=self.generative_ai_model_name, exception=e)
+
+        cache_key = cache_keys.get(generative_ai_model_name) or get_response_cache_key(segments, generative_ai_model_name)
+        response_size = len(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        GenerativeAiResponseCache.put(cache_key, generative_ai_model_name, result, response_size)
+
+        return generative_ai_model_name, result
+
+    def _order_by_preferred(self, generative_ai_model_names: list[str]) -> list[str]:
+        return sorted(generative_ai_model_names, key=lambda name: name != self.generative_ai_model_name)
+
+    async def _run(self, chunks: list[dict]) -> tuple[str, dict]:
+        # 동시에 실행하는 구간 요청이 인스턴스 상태를 바꾸지 않도록 요청마다 사용한 모델을 반환받아 합침
+        # 결과의 모델은 마지막 요청(한 번에 요청 또는 최종 요약)에 사용한 모델
+        client = GeminiClientPool.get_client()
+
+        if len(chunks) == 1:
+            return await self._generate(client, self._build_prompt(chunks[0]['segments']), RESPONSE_SCHEMA, self.generative_ai_model_name)
+
+        semaphore = asyncio.Semaphore(settings.GEMINI_CHUNK_CONCURRENCY)
+
+        async def correct(index, chunk):
+            async with semaphore:
+                return await self._generate(client, self._build_chunk_prompt(index, len(chunks), chunk), CHUNK_RESPONSE_SCHEMA, self.generative_ai_model_name)
+
+        # 실패한 구간이 있어도 나머지 구간은 끝까지 요청하여 체크포인트로 저장
+        chunk_results = await asyncio.gather(*[correct(index, chunk) for index, chunk in enumerate(chunks)], return_exceptions=True)
+        for chunk_result in chunk_results:
+            if isinstance(chunk_result, BaseException):
+                raise chunk_result
+
+        # 최종 요약은 마지막 구간에 사용한 모델을 우선 사용
+        chunk_model_name = chunk_results[-1][0]
+        chunk_results = [chunk_result for _, chunk_result in chunk_results]
+
+        corrected_segments = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            # 맥락으로 포함한 이전 구간의 부분은 해당 구간의 교정 결과를 사용
+            segment_ids = {segment['original_segment_id'] for segment in chunk['segments']}
+            corrected_segments.extend(s for s in chunk_result.get('corrected_segments', []) if s.get('original_segment_id') in segment_ids)
+
+        generative_ai_model_name, result = await self._generate(client, self._build_reduce_prompt(chunk_results), REDUCE_RESPONSE_SCHEMA, chunk_model_name)
+        result['corrected_segments'] = corrected_segments
+        return generative_ai_model_name, result
+
+    async def _generate(self, client, prompt: str, response_schema: types.Schema, preferred_name: str | None = None) -> tuple[str, dict]:
+        # (사용한 모델 이름, 응답)을 반환, 체크포인트에도 모델 이름을 함께 저장
+        cache_key = f"gemini-response-{hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:16]}"
+        if self.checkpoint is not None:
+            cached = self.checkpoint.load(cache_key)
+            if cached is not None:
+                return cached['generative_ai_model_name'], cached['result']
+
+        token_count = estimate_tokens(SYSTEM_INSTRUCTION) + estimate_tokens(prompt)
+
+        for attempt in range(settings.GEMINI_MAX_RETRIES):
+            generative_ai_model_name = await self.router.acquire(token_count, preferred_name)
+            GeminiClientPool.start_timing()
+            start = time.perf_counter()
+            try:
+                response = await client.aio.models.generate_content(
+                    model=generative_ai_model_name,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=response_schema,
+                        system_instruction=SYSTEM_INSTRUCTION
+                    ),
+                )
+                _, latency_millisecond = GeminiClientPool.measure(generative_ai_model_name, start)
+                result = json.loads(response.text)
+                break
+            except APIError as e:
+                logger.error(f"Gemini API 호출 실패 (모델: {generative_ai_model_name}, 시도 {attempt + 1}/{settings.GEMINI_MAX_RETRIES}): {e}")
+                error_message = str(e)
+                if '429 RESOURCE_EXHAUSTED' in error_message:
+                    await self.router.exhaust(generative_ai_model_name, e)
+                    if attempt == settings.GEMINI_MAX_RETRIES - 1:
+                        raise GeminiRateLimitError(message=error_message, generative_ai_model_name=generative_ai_model_name, exception=e)
+                    continue
+
+                # 일시적인 서버 오류만 짧게 대기 후 재시도
+                if attempt == settings.GEMINI_MAX_RETRIES - 1 or e.code is None or e.code < 500:
+                    raise GeminiApiError(message=error_message, generative_ai_model_name=generative_ai_model_name, exception=e)
+
+                await asyncio.sleep(2 ** attempt)
+            except json.JSONDecodeError as e:
+                # 출력 토큰 한도 등으로 잘린 응답은 다시 요청
+                logger.error(f"Gemini API 응답 해석 실패 (모델: {generative_ai_model_name}, 시도 {attempt + 1}/{settings.GEMINI_MAX_RETRIES}): {e}")
+                if attempt == settings.GEMINI_MAX_RETRIES - 1:
+                    raise GeminiApiError(message=f"응답 형식 예외({str(e)})", generative_ai_model_name=generative_ai_model_name, exception=e)
+            except Exception as e:
+                logger.error(f"Gemini API 호출 실패: {e}")
+                error_message = str(e)
+                if '[Errno 8] nodename nor servname provided, or not known' in error_message:
+                    raise GeminiApiError(message=f"서버 네트워크 예외가 발생했어요. 관리자에게 문의해 주세요.", generative_ai_model_name=generative_ai_model_name, exception=e)
+
+                raise GeminiApiError(message=f"시스템 예외({str(e)})", generative_ai_model_name=generative_ai_model_name, exception=e)
+
+        await self.router.record(generative_ai_model_name, latency_millisecond, token_count, response)
+
+        if self.checkpoint is not None:
+            self.checkpoint.save(cache_key, {'generative_ai_model_name': generative_ai_model_name, 'result': result})
+
+        return generative_ai_model_name, result
+
+    @staticmethod
+    def _build_prompt(segments: list[dict]) -> str:
+        return f"""
+    다음 [데이터]를 바탕으로 아래 4가지 작업을 수행하고 JSON 결과를 반환하십시오.
+
+    **[작업 지시사항]**
+
+    **1. 세그먼트 교정 (corrected_segments)**
+    - 각 세그먼트의 'text'를 문법과 오타를 수정하고 자연스러운 문어체로 다듬어 'corrected_text'에 작성하십시오.{CORRECT_WORD_PROMPT if IS_CORRECT_WORD else ''}
+    - 시스템 지침의 '가독성 원칙'을 적용하여 문단을 적절히 분리하십시오.
+
+    **2. 일반 요약 (general_summarization)**
+    - 전체 회의 내용을 약 10줄 내외로 개괄적으로 요약하십시오.
+    - 시스템 지침의 '가독성 원칙'을 적용하여 문단을 적절히 분리하십시오.
+
+    **3. 회의록 본문 작성 (meeting_minutes)**
+    - 전체 내용을 **공식 회의록 스타일(문어체, 두괄식)**로 재구성하십시오.
+    - **주요 의제(회의 목적)**, **핵심 논의 내용**, **최종 결정 사항**을 명확한 소제목으로 구분하여 작성하십시오.
+
+    **4. 액션 아이템 추출 (action_items)**
+    - 회의 내용 중 실행이 필요한 과업을 찾아 **'담당자: 할 일 (마감기한)'** 형태로 명확히 추출하십시오.
+
+    **[데이터]**
+    {dump_segments(segments)}
+    """
+
+    @staticmethod
+    def _build_chunk_prompt(index: int, count: int, chunk: dict) -> str:
+        context = f"""
+    **[이전 맥락]** (교정하지 말고 내용 이해에만 사용하십시오)
+    {dump_segments(chunk['context'])}
+    """ if chunk['context'] else ''
+
+        return f"""
+    다음 [데이터]는 긴 회의 전사 기록을 나눈 {count}개 구간 중 {index + 1}번째 구간입니다. 아래 3가지 작업을 수행하고 JSON 결과를 반환하십시오.
+
+    **[작업 지시사항]**
+
+    **1. 세그먼트 교정 (corrected_segments)**
+    - [데이터]의 각 세그먼트의 'text'를 문법과 오타를 수정하고 자연스러운 문어체로 다듬어 'corrected_text'에 작성하십시오.{CORRECT_WORD_PROMPT if IS_CORRECT_WORD else ''}
+    - 시스템 지침의 '가독성 원칙'을 적용하여 문단을 적절히 분리하십시오.
+
+    **2. 구간 요약 (chunk_summarization)**
+    - 이 구간의 의제, 핵심 논의 내용, 결정 사항을 나중에 전체 회의록을 작성할 수 있도록 빠짐없이 정리하십시오.
+
+    **3. 액션 아이템 추출 (action_items)**
+    - 이 구간에서 실행이 필요한 과업을 찾아 **'담당자: 할 일 (마감기한)'** 형태로 명확히 추출하십시오.
+    {context}
+    **[데이터]**
+    {dump_segments(chunk['segments'])}
+    """
+
+    @staticmethod
+    def _build_reduce_prompt(chunk_results: list[dict]) -> str:
+        chunk_summarizations = "\n\n".join(
+            f"[구간 {index + 1}]\n{chunk_result.get('chunk_summarization', '')}" for index, chunk_result in enumerate(chunk_results)
+        )
+        action_items = "\n".join(f"- {item}" for chunk_result in chunk_results for item in chunk_result.get('action_items', []))
+
+        return f"""
+    다음 [구간 요약]은 긴 회의를 시간 순서대로 나누어 요약한 내용입니다. 이를 바탕으로 아래 3가지 작업을 수행하고 JSON 결과를 반환하십시오.
+
+    **[작업 지시사항]**
+
+    **1. 일반 요약 (general_summarization)**
+    - 전체 회의 내용을 약 10줄 내외로 개괄적으로 요약하십시오.
+    - 시스템 지침의 '가독성 원칙'을 적용하여 문단을 적절히 분리하십시오.
+
+    **2. 회의록 본문 작성 (meeting_minutes)**
+    - 전체 내용을 **공식 회의록 스타일(문어체, 두괄식)**로 재구성하십시오.
+    - **주요 의제(회의 목적)**, **핵심 논의 내용**, **최종 결정 사항**을 명확한 소제목으로 구분하여 작성하십시오.
+
+    **3. 액션 아이템 정리 (action_items)**
+    - [액션 아이템 후보]에서 중복을 합치고 **'담당자: 할 일 (마감기한)'** 형태로 정리하십시오.
+
+    **[구간 요약]**
+    {chunk_summarizations}
+
+    **[액션 아이템 후보]**
+    {action_items}
+    """
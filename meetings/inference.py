@@ -0,0 +1,214 @@
+import gc
+import logging
+import os
+import threading
+import time
+from multiprocessing.connection import Listener, Client
+
+import numpy as np
+import psutil
+
+from config import settings
+from .errors import InferenceServerError
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceClient:
+    # 추론 서버에 음성 인식·정렬·화자 분리를 요청하는 클라이언트
+    # 메모리 맵 오디오는 파일 경로만, 그 외 오디오는 배열을 그대로 전달
+    @staticmethod
+    def is_enabled():
+        return settings.INFERENCE_SERVER_ENABLED and not InferenceServer.is_running()
+
+    @staticmethod
+    def transcribe(audio: np.ndarray, language_code=None, is_live=False, start=0):
+        operation = 'transcribe_live' if is_live else 'transcribe'
+        return InferenceClient._call(operation, audio=InferenceClient._pack_audio(audio, start), language_code=language_code)
+
+    @staticmethod
+    def align(audio: np.ndarray, language_code, segments):
+        return InferenceClient._call('align', audio=InferenceClient._pack_audio(audio), language_code=language_code, segments=segments)
+
+    @staticmethod
+    def transcribe_and_align_in_chunks(audio: np.ndarray):
+        return InferenceClient._call('transcribe_and_align_in_chunks', audio=InferenceClient._pack_audio(audio))
+
+    @staticmethod
+    def diarize(audio: np.ndarray, speech_regions=None, min_speakers=None, max_speakers=None):
+        return InferenceClient._call('diarize', audio=InferenceClient._pack_audio(audio), speech_regions=speech_regions,
+                                     min_speakers=min_speakers, max_speakers=max_speakers)
+
+    @staticmethod
+    def health():
+        return InferenceClient._call('health')
+
+    @staticmethod
+    def _pack_audio(audio: np.ndarray, start=0):
+        # start(샘플 위치)부터의 오디오를 전달, 메모리 맵은 경로와 위치만 전달하여 서버에서 잘라 사용
+        if isinstance(audio, np.memmap):
+            return {'path': audio.filename, 'start': start}
+        return {'array': audio[start:] if start else audio}
+
+    @staticmethod
+    def _call(operation, **kwargs):
+        try:
+            with Client((settings.INFERENCE_SERVER_HOST, settings.INFERENCE_SERVER_PORT), authkey=InferenceServer.get_authkey()) as connection:
+                connection.send({'operation': operation, **kwargs})
+                response = connection.recv()
+        except (ConnectionError, EOFError, OSError) as e:
+            raise InferenceServerError(f"추론 서버에 연결할 수 없어요. ({e})") from e
+
+        if response.get('status') != 'success':
+            raise InferenceServerError(response.get('message'))
+        return response.get('result')
+
+
+class InferenceServer:
+    # 모델을 한 번만 적재하여 상주시키고 로컬 소켓으로 작업을 처리하는 추론 서버
+    # 연결마다 스레드로 처리하되, 같은 종류의 작업은 잠금으로 직렬화(음성 인식과 화자 분리는 동시에 실행 가능)
+    # 실시간 전사는 전체 음성 인식이 끝날 때까지 기다리지 않도록 별도 잠금으로 처리
+    _RUNNING = False
+
+    def __init__(self):
+        self._locks = {operation: threading.Lock() for operation in ('transcribe', 'transcribe_live', 'align', 'diarize', 'transcribe_and_align_in_chunks')}
+        self._active_count = 0
+        self._active_lock = threading.Lock()
+        self._job_count = 0
+        self._start_time = time.time()
+
+    @staticmethod
+    def is_running():
+        return InferenceServer._RUNNING
+
+    @staticmethod
+    def get_authkey():
+        return settings.SECRET_KEY.encode('utf-8')
+
+    def serve_forever(self):
+        InferenceServer._RUNNING = True
+
+        self.warm_up()
+
+        address = (settings.INFERENCE_SERVER_BIND_HOST, settings.INFERENCE_SERVER_PORT)
+        with Listener(address, authkey=InferenceServer.get_authkey()) as listener:
+            logger.info(f"추론 서버 시작: {address}")
+            while True:
+                try:
+                    connection = listener.accept()
+                except Exception as e:
+                    logger.error(f"추론 서버 연결 수락 실패: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def warm_up(self):
+        from .utils import ModelHolder, RecordingUtils
+        from .media import SAMPLE_RATE
+
+        start = time.perf_counter()
+
+        ModelHolder.get_model()
+        ModelHolder.get_align_model(settings.INFERENCE_SERVER_WARM_UP_LANGUAGE_CODE)
+        ModelHolder.get_diarization_pipeline()
+
+        # 첫 추론의 초기화 비용(커널 컴파일, 스레드 풀 생성 등)을 미리 지불
+        # 무음으로 언어를 감지하지 않도록 설정한 언어로 음성 인식
+        silence = np.zeros(SAMPLE_RATE, np.float32)
+        RecordingUtils.transcribe(silence, settings.INFERENCE_SERVER_WARM_UP_LANGUAGE_CODE)
+
+        logger.info(f"추론 서버 모델 준비 완료 ({time.perf_counter() - start:.1f}초)")
+
+    def _handle(self, connection):
+        with connection:
+            try:
+                request = connection.recv()
+                operation = request.pop('operation')
+
+                if operation == 'health':
+                    connection.send({'status': 'success', 'result': self._health()})
+                    return
+
+                if operation not in self._locks:
+                    raise ValueError(f"invalid operation: {operation}")
+
+                with self._active_lock:
+                    self._active_count += 1
+                try:
+                    with self._locks[operation]:
+                        result = self._run(operation, request)
+                finally:
+                    with self._active_lock:
+                        self._active_count -= 1
+                        self._job_count += 1
+
+                connection.send({'status': 'success', 'result': result})
+            except Exception as e:
+                logger.exception(f"추론 서버 작업 실패: {e}")
+                try:
+                    connection.send({'status': 'error', 'message': str(e)})
+                except Exception:
+                    pass
+            finally:
+                self._check_memory()
+
+    def _run(self, operation, request):
+        from .utils import RecordingUtils
+
+        audio = self._unpack_audio(request.pop('audio'))
+        start = time.perf_counter()
+
+        if operation in ('transcribe', 'transcribe_live'):
+            result = RecordingUtils.transcribe(audio, request.get('language_code'), operation == 'transcribe_live')
+        elif operation == 'align':
+            result = RecordingUtils.align(audio, request['language_code'], request['segments'])
+        elif operation == 'transcribe_and_align_in_chunks':
+            result = RecordingUtils.transcribe_and_align_in_chunks(audio)
+        else:
+            result = RecordingUtils.diarize(audio, request.get('speech_regions'), request.get('min_speakers'), request.get('max_speakers'))
+
+        logger.info(f"추론 서버 {operation} 완료 ({time.perf_counter() - start:.1f}초)")
+        return result
+
+    @staticmethod
+    def _unpack_audio(audio):
+        if 'path' in audio:
+            return np.memmap(audio['path'], dtype=np.float32, mode='c')[audio.get('start', 0):]
+        return audio['array']
+
+    def _health(self):
+        from .caches import ModelCache
+
+        return {
+            'pid': os.getpid(),
+            'uptime_second': int(time.time() - self._start_time),
+            'active_count': self._active_count,
+            'job_count': self._job_count,
+            'rss_mb': self._get_rss_mb(),
+            'model_cache': ModelCache.get_stats(),
+        }
+
+    def _check_memory(self):
+        # 작업마다 프로세스를 재시작하는 대신, 유휴 상태에서 메모리 사용량을 확인하여 기준을 넘을 때만 정리
+        from .caches import ModelCache
+
+        with self._active_lock:
+            if self._active_count > 0:
+                return
+
+            rss_mb = self._get_rss_mb()
+            if rss_mb <= settings.INFERENCE_SERVER_MAX_RSS_MB:
+                return
+
+            logger.warning(f"추론 서버 메모리 사용량 초과({rss_mb}MB > {settings.INFERENCE_SERVER_MAX_RSS_MB}MB)로 모델 캐시를 비워요.")
+            ModelCache.clear()
+            gc.collect()
+
+            rss_mb = self._get_rss_mb()
+            if rss_mb > settings.INFERENCE_SERVER_MAX_RSS_MB:
+                # 모델을 비워도 회수되지 않는 누수는 프로세스를 종료하여 컨테이너 재시작 정책에 맡김
+                logger.error(f"추론 서버 메모리가 회수되지 않아({rss_mb}MB) 종료해요.")
+                os._exit(1)
+
+    @staticmethod
+    def _get_rss_mb():
+        return psutil.Process().memory_info().rss // 1024 // 1024
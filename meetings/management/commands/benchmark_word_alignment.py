@@ -0,0 +1,75 @@
+import difflib
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from meetings.alignment import WordAligner, Indel
+
+
+class Command(BaseCommand):
+    help = '교정된 문장과 단어 대응의 처리 시간과 결과를 기존 방식(difflib)과 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--segments', type=int, default=200, help='부분 수')
+        parser.add_argument('--words', type=int, default=300, help='부분당 단어 수')
+        parser.add_argument('--edit-rate', type=float, default=0.1, help='교정으로 바뀌는 단어 비율')
+        parser.add_argument('--vocabulary', type=int, default=2000, help='단어 종류 수')
+        parser.add_argument('--workers', type=int, default=1, help='단어 대응 처리 프로세스 수')
+        parser.add_argument('--repeat', type=int, default=3, help='반복 횟수(가장 빠른 시간 사용)')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        pairs = [self._make_pair(rng, options['words'], options['edit_rate'], options['vocabulary']) for _ in range(options['segments'])]
+        aligner = WordAligner(options['workers'])
+
+        difflib_second, expected = self._measure(lambda: [_align_with_difflib(*pair) for pair in pairs], options['repeat'])
+        aligner_second, actual = self._measure(lambda: aligner.align_all(pairs), options['repeat'])
+
+        total = sum(len(word_texts) for word_texts, _ in pairs)
+        same = sum(e == a for expected_words, actual_words in zip(expected, actual) for e, a in zip(expected_words, actual_words))
+
+        self.stdout.write(f"부분 {len(pairs)}개, 단어 {total}개, 교정 비율 {options['edit_rate']}")
+        self.stdout.write(f"difflib: {difflib_second:.3f}초")
+        self.stdout.write(f"WordAligner({'rapidfuzz' if Indel is not None else 'Myers'}): {aligner_second:.3f}초 (x{difflib_second / aligner_second if aligner_second else 0:.1f})")
+        self.stdout.write(f"결과 일치: {same}/{total} ({same / total * 100 if total else 100:.2f}%)")
+
+    @staticmethod
+    def _make_pair(rng, count, edit_rate, vocabulary):
+        word_texts = [f"w{rng.randrange(vocabulary)}" for _ in range(count)]
+        corrected_word_texts = []
+        for word in word_texts:
+            r = rng.random()
+            if r >= edit_rate:
+                corrected_word_texts.append(word)
+            elif r < edit_rate / 3:
+                continue
+            elif r < edit_rate * 2 / 3:
+                corrected_word_texts.append(f"c{rng.randrange(vocabulary)}")
+            else:
+                corrected_word_texts.extend([word, f"c{rng.randrange(vocabulary)}"])
+        return word_texts, corrected_word_texts
+
+    @staticmethod
+    def _measure(function, repeat):
+        best = None
+        result = None
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            result = function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+
+def _align_with_difflib(word_texts, corrected_word_texts):
+    # 기존 방식(difflib.SequenceMatcher)
+    corrected_words = [None] * len(word_texts)
+    matcher = difflib.SequenceMatcher(None, word_texts, corrected_word_texts)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ('equal', 'replace'):
+            for index in range(min(i2 - i1, j2 - j1)):
+                corrected_words[i1 + index] = corrected_word_texts[j1 + index]
+    return corrected_words
+
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from meetings.inference import InferenceServer
+
+
+class Command(BaseCommand):
+    help = '음성 인식·정렬·화자 분리 모델을 상주시키는 추론 서버를 실행합니다.'
+
+    def handle(self, *args, **options):
+        InferenceServer().serve_forever()
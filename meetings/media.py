@@ -0,0 +1,231 @@
+import hashlib
+import json
+import logging
+import os
+import struct
+import subprocess
+import uuid
+
+import numpy as np
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+SAMPLE_RATE = 16000
+PEAKS_MAGIC = b'WPK1'
+PEAKS_SAMPLES_PER_PEAK = 256  # 가장 세밀한 단계의 피크 하나가 나타내는 샘플 수(16ms)
+PEAKS_LEVEL_COUNT = 5  # 단계마다 4배씩 줄여 256, 1024, 4096, 16384, 65536 샘플 단위
+
+
+class MediaUtils:
+    @staticmethod
+    def load_audio(file_path: str, play_millisecond: int = 0, start_millisecond: int = 0) -> np.ndarray:
+        # 16kHz mono float32 PCM으로 한 번만 디코딩하여 음성 인식·정렬·화자 분리에서 함께 사용
+        # 긴 녹음은 디스크에 디코딩한 뒤 메모리 맵으로 열어 RAM 점유를 줄임
+        # start_millisecond를 지정하면 해당 위치부터 디코딩(실시간 녹음 중 아직 확정되지 않은 구간)
+        command = [
+            'ffmpeg',
+            '-nostdin',
+            '-threads', '0',
+            '-ss', f"{start_millisecond / 1000:.3f}",
+            '-i', file_path,
+            '-f', 'f32le',
+            '-ac', '1',
+            '-acodec', 'pcm_f32le',
+            '-ar', str(SAMPLE_RATE),
+            '-',
+        ]
+
+        if play_millisecond < settings.AUDIO_MEMMAP_MIN_SECOND * 1000:
+            try:
+                out = subprocess.run(command, capture_output=True, check=True).stdout
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+            # 메모리 맵('c')과 같이 쓰기 가능한 배열로 반환(bytes로 만든 배열은 읽기 전용)
+            return np.frombuffer(bytearray(out), np.float32)
+
+        pcm_path = os.path.join(settings.MEDIA_ROOT, 'temp', f"{uuid.uuid4()}.f32")
+        os.makedirs(os.path.dirname(pcm_path), exist_ok=True)
+
+        try:
+            with open(pcm_path, 'wb') as pcm_file:
+                subprocess.run(command, stdout=pcm_file, stderr=subprocess.PIPE, check=True)
+        except subprocess.CalledProcessError as e:
+            os.remove(pcm_path)
+            raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+
+        if os.path.getsize(pcm_path) == 0:
+            os.remove(pcm_path)
+            return np.zeros(0, np.float32)
+
+        logger.info(f"오디오 메모리 맵 디코딩: {file_path} -> {pcm_path}")
+
+        # 'c'(copy-on-write)로 열어 torch.from_numpy 등에서 쓰기 가능한 배열로 다룰 수 있게 함
+        return np.memmap(pcm_path, dtype=np.float32, mode='c')
+
+    @staticmethod
+    def probe(file_path: str) -> dict:
+        # 디코딩 없이 컨테이너 헤더에서 재생 시간, 코덱, 샘플레이트, 채널 수를 읽음
+        command = [
+            'ffprobe',
+            '-v', 'error',
+            '-select_streams', 'a:0',
+            '-show_entries', 'format=duration:stream=codec_name,sample_rate,channels,duration',
+            '-of', 'json',
+            file_path,
+        ]
+        try:
+            out = subprocess.run(command, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to probe audio: {e.stderr.decode()}") from e
+
+        data = json.loads(out or '{}')
+        stream = (data.get('streams') or [{}])[0]
+        duration = MediaUtils._to_float(data.get('format', {}).get('duration')) or MediaUtils._to_float(stream.get('duration'))
+        if duration is None:
+            # MediaRecorder로 만든 webm 등 헤더에 재생 시간이 없으면 패킷 타임스탬프만 읽어 계산
+            duration = MediaUtils._scan_duration(file_path)
+
+        return {
+            'duration_millisecond': int(duration * 1000) if duration is not None else 0,
+            'audio_codec': stream.get('codec_name'),
+            'sample_rate': int(stream['sample_rate']) if stream.get('sample_rate') else None,
+            'channel_count': stream.get('channels'),
+        }
+
+    @staticmethod
+    def _scan_duration(file_path: str) -> float | None:
+        command = [
+            'ffprobe',
+            '-v', 'error',
+            '-select_streams', 'a:0',
+            '-show_entries', 'packet=pts_time,duration_time',
+            '-of', 'csv=p=0',
+            file_path,
+        ]
+        duration = None
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as process:
+            for line in process.stdout:
+                pts_time, _, duration_time = line.strip().partition(',')
+                pts_time = MediaUtils._to_float(pts_time)
+                if pts_time is not None:
+                    duration = max(duration or 0, pts_time + (MediaUtils._to_float(duration_time) or 0))
+        return duration
+
+    @staticmethod
+    def _to_float(value) -> float | None:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def convert_to_webm(input_path: str, output_path: str):
+        command = [
+            'ffmpeg',
+            '-i', input_path,  # -i: 입력 파일
+            '-c:a', 'libopus',  # -c:a: 오디오 코덱 (Opus는 WebM에서 효율적이며 품질이 좋음)
+            '-b:a', '128k',  # -b:a: 오디오 비트레이트 (예: 128k)
+            '-vn',  # -vn: 비디오 트랙 제거 (오디오 파일이므로)
+            '-y',  # 덮어쓰기 허용
+            '-f', 'webm',
+            '-cluster_size_limit', '0',  # 클러스터 크기 제한 해제 (더 작은 클러스터 생성 유도)
+            # '-chunk_limit', '500000',  # 클러스터 당 최대 청크 크기 제한 (더 잦은 Cues 생성 유도)
+            '-fflags', '+genpts',  # 타임스탬프 생성을 강제
+            '-movflags', 'faststart',  # 스트리밍 및 시킹 최적화 (메타데이터를 파일 시작으로 이동)
+            output_path
+        ]
+        subprocess.run(command, check=True, capture_output=True)
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def compute_peaks(audio: np.ndarray) -> list[np.ndarray]:
+        # 단계별 (min, max) int8 피크 배열 목록, 가장 세밀한 단계를 PCM에서 계산하고 나머지 단계는 이전 단계를 4개씩 묶어 계산
+        samples_per_peak = PEAKS_SAMPLES_PER_PEAK
+        block = (SAMPLE_RATE * 600 // samples_per_peak) * samples_per_peak  # 메모리 맵 전체를 한 번에 읽지 않도록 10분 단위로 계산
+
+        mins = []
+        maxs = []
+        for i in range(0, len(audio), block):
+            frames = np.asarray(audio[i:i + block], dtype=np.float32)
+            if len(frames) % samples_per_peak:
+                frames = np.pad(frames, (0, samples_per_peak - len(frames) % samples_per_peak))
+            frames = frames.reshape(-1, samples_per_peak)
+            mins.append(frames.min(axis=1))
+            maxs.append(frames.max(axis=1))
+
+        level_min = np.concatenate(mins) if mins else np.zeros(0, np.float32)
+        level_max = np.concatenate(maxs) if maxs else np.zeros(0, np.float32)
+
+        levels = []
+        for _ in range(PEAKS_LEVEL_COUNT):
+            peaks = np.stack([level_min, level_max], axis=1)
+            levels.append(np.clip(np.round(peaks * 127), -128, 127).astype(np.int8))
+
+            if len(level_min) % 4:
+                pad = 4 - len(level_min) % 4
+                level_min = np.pad(level_min, (0, pad), mode='edge' if len(level_min) else 'constant')
+                level_max = np.pad(level_max, (0, pad), mode='edge' if len(level_max) else 'constant')
+            level_min = level_min.reshape(-1, 4).min(axis=1)
+            level_max = level_max.reshape(-1, 4).max(axis=1)
+
+        return levels
+
+    @staticmethod
+    def write_peaks(file_path: str, levels: list[np.ndarray], duration_millisecond: int):
+        # 파일 구조: magic(4) | sample_rate, duration_millisecond, level_count(uint32 x 3)
+        #           | 단계별 samples_per_peak, peak_count(uint32 x 2) | 단계별 (min, max) int8 배열
+        temp_path = f"{file_path}.tmp"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(PEAKS_MAGIC)
+            f.write(struct.pack('<III', SAMPLE_RATE, duration_millisecond, len(levels)))
+            for i, peaks in enumerate(levels):
+                f.write(struct.pack('<II', PEAKS_SAMPLES_PER_PEAK * 4 ** i, len(peaks)))
+            for peaks in levels:
+                f.write(peaks.tobytes())
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def release_audio(audio: np.ndarray | None):
+        if isinstance(audio, np.memmap):
+            # 매핑은 참조가 모두 사라질 때 해제되므로 파일만 삭제
+            pcm_path = audio.filename
+            if pcm_path and os.path.exists(pcm_path):
+                os.remove(pcm_path)
+
+    @staticmethod
+    def find_silence_boundaries(audio: np.ndarray, chunk_second: int, search_second: int = 30, frame_millisecond: int = 30) -> list[int]:
+        # chunk_second 간격의 목표 지점 주변(±search_second)에서 에너지가 가장 낮은 프레임(무음)을 찾아 분할 지점(샘플 위치)으로 사용
+        frame_size = SAMPLE_RATE * frame_millisecond // 1000
+        frame_count = len(audio) // frame_size
+        if frame_count == 0:
+            return [0, len(audio)]
+
+        energy = np.empty(frame_count, np.float32)
+        block = max(1, (SAMPLE_RATE * 600) // frame_size)  # 메모리 맵 전체를 한 번에 읽지 않도록 10분 단위로 계산
+        for i in range(0, frame_count, block):
+            frames = np.asarray(audio[i * frame_size:min(frame_count, i + block) * frame_size]).reshape(-1, frame_size)
+            energy[i:i + len(frames)] = np.sqrt(np.mean(np.square(frames), axis=1))
+
+        chunk_frames = chunk_second * 1000 // frame_millisecond
+        search_frames = search_second * 1000 // frame_millisecond
+
+        boundaries = [0]
+        target = chunk_frames
+        while target < frame_count - search_frames:
+            window_start = max(boundaries[-1] // frame_size + 1, target - search_frames)
+            window_end = min(frame_count, target + search_frames)
+            silence_frame = window_start + int(np.argmin(energy[window_start:window_end]))
+            boundaries.append(silence_frame * frame_size)
+            target = silence_frame + chunk_frames
+        boundaries.append(len(audio))
+
+        return boundaries
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='speechrecognition',
+            name='diarization_start_datetime',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='화자 분리 시작 시간'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0002_speechrecognition_diarization_start_datetime'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='내용 해시'),
+        ),
+        migrations.AddIndex(
+            model_name='recording',
+            index=models.Index(fields=['content_hash'], name='idx_recording_01'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0003_recording_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='is_live',
+            field=models.BooleanField(default=False, verbose_name='실시간 녹음 중 여부'),
+        ),
+        migrations.AddField(
+            model_name='recording',
+            name='live_transcribed_millisecond',
+            field=models.IntegerField(default=0, verbose_name='실시간 음성 인식 확정 밀리초'),
+        ),
+        migrations.AddField(
+            model_name='segment',
+            name='is_provisional',
+            field=models.BooleanField(default=False, verbose_name='임시 여부'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0004_live_recording'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecordingUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='id')),
+                ('created_date', models.DateTimeField(auto_now_add=True, verbose_name='등록일시')),
+                ('last_modified_date', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('upload_key', models.CharField(max_length=32, unique=True, verbose_name='업로드 키')),
+                ('file_name', models.CharField(max_length=256, verbose_name='파일 명')),
+                ('content_type', models.CharField(blank=True, max_length=128, verbose_name='파일종류')),
+                ('source_type', models.CharField(blank=True, max_length=32, verbose_name='출처 유형')),
+                ('file_size', models.BigIntegerField(verbose_name='파일 크기')),
+                ('received_size', models.BigIntegerField(default=0, verbose_name='수신 크기')),
+                ('upload_status_code', models.CharField(max_length=16, verbose_name='업로드 상태 코드')),
+                ('created_user', models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='등록자')),
+                ('last_modified_user', models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='수정자')),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, to='meetings.meeting', verbose_name='회의')),
+                ('recording', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.RESTRICT, to='meetings.recording', verbose_name='녹음')),
+            ],
+            options={
+                'verbose_name': '녹음 업로드',
+                'verbose_name_plural': '녹음 업로드 목록',
+                'db_table': 'meetings_recording_upload',
+            },
+        ),
+    ]
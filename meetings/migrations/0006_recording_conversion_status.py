@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0005_recording_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='conversion_status_code',
+            field=models.CharField(blank=True, max_length=16, null=True, verbose_name='변환 상태 코드'),
+        ),
+    ]
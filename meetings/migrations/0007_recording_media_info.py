@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0006_recording_conversion_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='audio_codec',
+            field=models.CharField(blank=True, max_length=32, null=True, verbose_name='오디오 코덱'),
+        ),
+        migrations.AddField(
+            model_name='recording',
+            name='channel_count',
+            field=models.SmallIntegerField(blank=True, null=True, verbose_name='채널 수'),
+        ),
+        migrations.AddField(
+            model_name='recording',
+            name='sample_rate',
+            field=models.IntegerField(blank=True, null=True, verbose_name='샘플레이트'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:06
+
+import meetings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0007_recording_media_info'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='peaks_file',
+            field=models.FileField(blank=True, max_length=256, null=True, upload_to=meetings.models.get_recording_upload_path, verbose_name='파형 피크 파일'),
+        ),
+    ]
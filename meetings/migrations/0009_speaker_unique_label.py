@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:08
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def merge_duplicate_speakers(apps, schema_editor):
+    # 같은 회의의 같은 화자 레이블을 하나로 합침, 사용자가 매핑된 화자(없으면 가장 먼저 만든 화자)를 남기고 부분·단어를 옮긴 뒤 나머지를 삭제
+    Speaker = apps.get_model('meetings', 'Speaker')
+    Segment = apps.get_model('meetings', 'Segment')
+    Word = apps.get_model('meetings', 'Word')
+
+    duplicates = (Speaker.objects
+                  .values('meeting_id', 'speaker_label')
+                  .annotate(speaker_count=Count('id'))
+                  .filter(speaker_count__gt=1))
+
+    for duplicate in duplicates.iterator():
+        speakers = list(Speaker.objects
+                        .filter(meeting_id=duplicate['meeting_id'], speaker_label=duplicate['speaker_label'])
+                        .order_by('id'))
+        survivor = next((speaker for speaker in speakers if speaker.user_id is not None), speakers[0])
+        duplicate_ids = [speaker.id for speaker in speakers if speaker.id != survivor.id]
+
+        Segment.objects.filter(speaker_id__in=duplicate_ids).update(speaker_id=survivor.id)
+        Word.objects.filter(speaker_id__in=duplicate_ids).update(speaker_id=survivor.id)
+        Speaker.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0008_recording_peaks_file'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_speakers, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='speaker',
+            unique_together={('meeting', 'speaker_label')},
+        ),
+    ]
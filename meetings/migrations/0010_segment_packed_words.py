@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:09
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0009_speaker_unique_label'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='segment',
+            name='corrected_words',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=128, null=True), blank=True, null=True, size=None, verbose_name='교정된 단어 목록'),
+        ),
+        migrations.AddField(
+            model_name='segment',
+            name='word_timings',
+            field=models.BinaryField(blank=True, null=True, verbose_name='단어 시간·점수'),
+        ),
+        migrations.AddField(
+            model_name='segment',
+            name='words',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=128), blank=True, null=True, size=None, verbose_name='단어 목록'),
+        ),
+    ]
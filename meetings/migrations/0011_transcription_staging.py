@@ -0,0 +1,49 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # 전사 결과를 먼저 저장하는 임시(staging) 테이블
+    # WAL을 기록하지 않는 UNLOGGED 테이블이며 트라이그램 인덱스 없이 음성 인식 id 인덱스만 생성
+
+    dependencies = [
+        ('meetings', '0010_segment_packed_words'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE UNLOGGED TABLE meetings_segment_staging (
+                    id bigint NOT NULL,
+                    text text NOT NULL,
+                    start_millisecond integer NULL,
+                    end_millisecond integer NULL,
+                    speech_recognition_id bigint NOT NULL,
+                    speaker_id bigint NOT NULL,
+                    created_user_id bigint NOT NULL,
+                    created_date timestamp with time zone NOT NULL,
+                    last_modified_user_id bigint NOT NULL,
+                    last_modified_date timestamp with time zone NOT NULL
+                );
+                CREATE INDEX idx_meetings_segment_staging_01 ON meetings_segment_staging (speech_recognition_id);
+
+                CREATE UNLOGGED TABLE meetings_word_staging (
+                    word varchar(128) NOT NULL,
+                    score double precision NOT NULL,
+                    start_millisecond integer NULL,
+                    end_millisecond integer NULL,
+                    segment_id bigint NOT NULL,
+                    speaker_id bigint NOT NULL,
+                    speech_recognition_id bigint NOT NULL,
+                    created_user_id bigint NOT NULL,
+                    created_date timestamp with time zone NOT NULL,
+                    last_modified_user_id bigint NOT NULL,
+                    last_modified_date timestamp with time zone NOT NULL
+                );
+                CREATE INDEX idx_meetings_word_staging_01 ON meetings_word_staging (speech_recognition_id);
+            """,
+            reverse_sql="""
+                DROP TABLE meetings_word_staging;
+                DROP TABLE meetings_segment_staging;
+            """,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0011_transcription_staging'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='speech_regions',
+            field=models.JSONField(blank=True, null=True, verbose_name='음성 구간'),
+        ),
+    ]
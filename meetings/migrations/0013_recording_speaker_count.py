@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0012_recording_speech_regions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recording',
+            name='max_speaker_count',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='최대 화자 수'),
+        ),
+        migrations.AddField(
+            model_name='recording',
+            name='min_speaker_count',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='최소 화자 수'),
+        ),
+    ]
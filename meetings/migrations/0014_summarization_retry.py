@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0013_recording_speaker_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summarization',
+            name='retry_count',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='재시도 횟수'),
+        ),
+        migrations.AddField(
+            model_name='summarization',
+            name='retry_datetime',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='재시도 예정 시간'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0014_summarization_retry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenerativeAiModelQuota',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('generative_ai_model_name', models.CharField(max_length=64, unique=True, verbose_name='생성형 AI 모델 이름')),
+                ('available_request_count', models.FloatField(verbose_name='사용 가능 요청 수')),
+                ('available_token_count', models.FloatField(verbose_name='사용 가능 토큰 수')),
+                ('refilled_datetime', models.DateTimeField(verbose_name='충전 시간')),
+                ('latency_millisecond', models.FloatField(blank=True, null=True, verbose_name='평균 응답 밀리초')),
+                ('request_count', models.BigIntegerField(default=0, verbose_name='요청 수')),
+                ('rate_limited_count', models.BigIntegerField(default=0, verbose_name='요청 한도 초과 수')),
+            ],
+            options={
+                'verbose_name': '생성형 AI 모델 할당량',
+                'verbose_name_plural': '생성형 AI 모델 할당량 목록',
+                'db_table': 'meetings_generative_ai_model_quota',
+            },
+        ),
+    ]
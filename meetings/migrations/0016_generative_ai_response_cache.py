@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:22
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0015_generative_ai_model_quota'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenerativeAiResponseCache',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('cache_key', models.CharField(max_length=64, unique=True, verbose_name='캐시 키')),
+                ('generative_ai_model_name', models.CharField(max_length=64, verbose_name='생성형 AI 모델 이름')),
+                ('response', models.JSONField(verbose_name='응답')),
+                ('response_size', models.IntegerField(verbose_name='응답 크기')),
+                ('hit_count', models.IntegerField(default=0, verbose_name='사용 횟수')),
+                ('created_date', models.DateTimeField(auto_now_add=True, verbose_name='등록일시')),
+                ('last_accessed_datetime', models.DateTimeField(default=django.utils.timezone.now, verbose_name='마지막 사용 시간')),
+            ],
+            options={
+                'verbose_name': '생성형 AI 응답 캐시',
+                'verbose_name_plural': '생성형 AI 응답 캐시 목록',
+                'db_table': 'meetings_generative_ai_response_cache',
+                'indexes': [models.Index(fields=['last_accessed_datetime'], name='idx_ai_response_cache_01')],
+            },
+        ),
+    ]
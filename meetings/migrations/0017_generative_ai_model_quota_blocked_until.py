@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0016_generative_ai_response_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generativeaimodelquota',
+            name='blocked_until_datetime',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='요청 차단 종료 시간'),
+        ),
+    ]
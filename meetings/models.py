@@ -1,13 +1,17 @@
 import logging
+import os
 from datetime import timedelta
 
+import numpy as np
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import OuterRef, Subquery, Count, Q
+from django.db import models, transaction
+from django.db.models import OuterRef, Subquery, Count, Q, F, Value, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-from django_q.tasks import async_task
-from pydub import AudioSegment
+from django_q.models import Schedule
+from django_q.tasks import async_task, schedule
 
 from accounts.caches import DepartmentCache
 from accounts.models import Department, User
@@ -15,6 +19,7 @@ from common.bases import BaseCode
 from common.mixins import PrefetchValidationMixin
 from common.models import Base, CreatedBase
 from config import settings
+from meetings.media import MediaUtils
 from reservations.models import Reservation
 
 logger = logging.getLogger(__name__)
@@ -24,6 +29,9 @@ GEMINI_2_5_PRO_MODEL_NAME = 'gemini-2.5-pro'
 GEMINI_2_5_PRO_MODEL_ESTIMATED_MINUTE = 5
 GEMINI_2_5_FLASH_MODEL_NAME = 'gemini-2.5-flash'
 GEMINI_2_5_FLASH_MODEL_ESTIMATED_MINUTE = 3
+WORD_STORAGE_MODE_ROW = 'row'
+WORD_STORAGE_MODE_PACKED = 'packed'
+LATENCY_SMOOTHING_FACTOR = 0.2  # 응답 시간 지수 이동 평균에서 새 값의 비중
 
 
 class MeetingTypeCode(BaseCode):
@@ -47,9 +55,21 @@ class SpeechRecognitionStepCode(BaseCode):
     COMPLETION = 'completion', '완료'
 
 
+class RecordingConversionStatusCode(BaseCode):
+    CONVERTING = 'converting', '변환 중'
+    COMPLETED = 'completed', '완료'
+    FAILED = 'failed', '실패'
+
+
+class RecordingUploadStatusCode(BaseCode):
+    UPLOADING = 'uploading', '업로드 중'
+    COMPLETED = 'completed', '완료'
+
+
 class SummarizationStepCode(BaseCode):
     PREPARATION = 'preparation', '준비'
     REQUEST = 'request', '요청'
+    RETRY_WAITING = 'retry', '재시도 대기'
     SAVE_RESULT = 'save', '결과 저장'
     COMPLETION = 'completion', '완료'
 
@@ -190,11 +210,24 @@ class Recording(Base):
     webm_file = models.FileField(null=True, blank=True, max_length=256, upload_to=get_recording_upload_path, verbose_name='webm 파일')
     webm_file_size = models.BigIntegerField(null=True, blank=True, default=0, verbose_name='webm 파일 크기')
     play_millisecond = models.IntegerField(default=0, verbose_name='재생 밀리초')
+    peaks_file = models.FileField(null=True, blank=True, max_length=256, upload_to=get_recording_upload_path, verbose_name='파형 피크 파일')
+    audio_codec = models.CharField(max_length=32, null=True, blank=True, verbose_name='오디오 코덱')
+    sample_rate = models.IntegerField(null=True, blank=True, verbose_name='샘플레이트')
+    channel_count = models.SmallIntegerField(null=True, blank=True, verbose_name='채널 수')
+    content_hash = models.CharField(max_length=64, null=True, blank=True, verbose_name='내용 해시')
+    conversion_status_code = models.CharField(max_length=16, null=True, blank=True, verbose_name='변환 상태 코드')
+    is_live = models.BooleanField(default=False, verbose_name='실시간 녹음 중 여부')
+    live_transcribed_millisecond = models.IntegerField(default=0, verbose_name='실시간 음성 인식 확정 밀리초')
+    speech_regions = models.JSONField(null=True, blank=True, verbose_name='음성 구간')  # [[시작 밀리초, 종료 밀리초], ...]
+    min_speaker_count = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name='최소 화자 수')
+    max_speaker_count = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name='최대 화자 수')
     meeting = models.ForeignKey('Meeting', on_delete=models.RESTRICT, verbose_name='회의')
     latest_speech_recognition = models.ForeignKey('SpeechRecognition', null=True, blank=True, on_delete=models.RESTRICT, related_name='+', verbose_name='최근 음성 인식')
     latest_summarization = models.ForeignKey('Summarization', null=True, blank=True, on_delete=models.RESTRICT, related_name='+', verbose_name='최근 요약')
     is_active = models.BooleanField(default=True, verbose_name='사용여부')
 
+    PROBE_FIELDS = ['play_millisecond', 'audio_codec', 'sample_rate', 'channel_count']
+
     @staticmethod
     def find_by_id_with_latest_tasks(id: int):
         return Recording.objects.select_related('latest_speech_recognition', 'latest_summarization').get(pk=id)
@@ -204,12 +237,31 @@ class Recording(Base):
         return Recording.objects.select_related('latest_speech_recognition', 'latest_summarization').get(latest_speech_recognition__id=speech_recognition_id)
 
     def can_speech_recognition_task(self):
-        return self.latest_speech_recognition is None or self.latest_speech_recognition.is_failed()
+        if self.is_live or self.is_converting() or self.is_failed_conversion():
+            return False
+        return self.latest_speech_recognition is None or self.latest_speech_recognition.is_failed() or self.latest_speech_recognition.is_provisional()
 
     def start_speech_recognition_task(self, user: User):
         if not self.can_speech_recognition_task():
             raise ValidationError('전사 작업을 시작할 수 없어요.')
 
+        if self.latest_speech_recognition is not None and self.latest_speech_recognition.is_provisional():
+            # 실시간 녹음 중 만든 음성 인식은 확정된 구간을 체크포인트로 남겼으므로, 같은 음성 인식으로 나머지 구간만 처리
+            task_id = async_task('meetings.tasks.run_speech_recognition', self.id, user.id)
+            self.latest_speech_recognition.request(task_id, user)
+            return
+
+        if self.latest_speech_recognition is not None:
+            # 완료된 단계의 결과는 체크포인트로 남아 있으므로 새 작업은 실패한 단계부터 이어서 처리
+            logger.info(f"전사 작업 재시도: Recording #{self.id} (실패 단계: {self.latest_speech_recognition.task_step_code})")
+
+        # 같은 내용의 녹음이 이미 전사되었으면 음성 인식 작업 대신 결과를 복제
+        source_speech_recognition = SpeechRecognition.find_completed_by_content_hash(self.content_hash, self.id)
+        if source_speech_recognition is not None:
+            with transaction.atomic():
+                self._clone_speech_recognition(source_speech_recognition, user)
+            return
+
         task_id = async_task('meetings.tasks.run_speech_recognition', self.id, user.id)
 
         speech_recognition = SpeechRecognition.objects.create(
@@ -222,6 +274,127 @@ class Recording(Base):
 
         self.set_latest_speech_recognition(speech_recognition, user)
 
+    def _clone_speech_recognition(self, source_speech_recognition, user: User):
+        speech_recognition = SpeechRecognition.objects.create(
+            task_id='',
+            task_status_code=TaskStatusCode.WAITING,
+            recording=self,
+            created_user=user,
+            last_modified_user=user,
+        )
+
+        self.set_latest_speech_recognition(speech_recognition, user)
+
+        speech_recognition.clone_result(source_speech_recognition, user)
+
+    def is_converting(self):
+        return self.conversion_status_code == RecordingConversionStatusCode.CONVERTING
+
+    def is_failed_conversion(self):
+        return self.conversion_status_code == RecordingConversionStatusCode.FAILED
+
+    def start_conversion_task(self, user: User):
+        # webm 변환은 요청 스레드가 아닌 변환 전용 작업자(FFMPEG_MAX_CONCURRENCY개)에서 처리
+        transaction.on_commit(lambda: async_task('meetings.tasks.run_recording_conversion', self.id, user.id, cluster=settings.RECORDING_CONVERSION_CLUSTER))
+
+    def complete_conversion(self, webm_file_name, user: User):
+        self.webm_file.name = webm_file_name
+        self.webm_file_size = self.webm_file.size
+        self.probe()
+        self.conversion_status_code = RecordingConversionStatusCode.COMPLETED
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['webm_file', 'webm_file_size', *self.PROBE_FIELDS, 'conversion_status_code', 'last_modified_user', 'last_modified_date'])
+
+        self.start_waveform_task()
+
+    def fail_conversion(self, user: User):
+        self.conversion_status_code = RecordingConversionStatusCode.FAILED
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['conversion_status_code', 'last_modified_user', 'last_modified_date'])
+
+    def start_waveform_task(self):
+        # 플레이어 타임라인에 사용할 파형 피크는 녹음마다 한 번만 백그라운드에서 계산
+        if self.is_live:
+            return
+        transaction.on_commit(lambda: async_task('meetings.tasks.run_waveform_peaks', self.id, cluster=settings.RECORDING_CONVERSION_CLUSTER))
+
+    def start_content_hash_task(self):
+        # 조각 업로드로 받은 파일은 완료 요청에서 파일 전체를 다시 읽지 않도록 내용 해시를 백그라운드에서 계산
+        transaction.on_commit(lambda: async_task('meetings.tasks.run_content_hash', self.id, cluster=settings.RECORDING_CONVERSION_CLUSTER))
+
+    def save_content_hash(self, content_hash):
+        self.content_hash = content_hash
+
+        self.save(update_fields=['content_hash'])
+
+    def complete_waveform(self, peaks_file_name):
+        self.peaks_file.name = peaks_file_name
+
+        self.save(update_fields=['peaks_file'])
+
+    def save_speech_regions(self, speech_regions):
+        # 음성 인식 단계에서 찾은 음성 구간, 화자 분리를 다시 실행할 때 음성 인식을 기다리지 않고 사용
+        self.speech_regions = speech_regions
+
+        self.save(update_fields=['speech_regions'])
+
+    def get_speaker_count_bounds(self) -> tuple[int | None, int | None]:
+        # 화자 분리 클러스터링의 (최소, 최대) 화자 수, 녹음에 지정한 화자 수가 없으면 회의 참석자 수로 최대 화자 수를 정함
+        # 참석자 목록에 없는 발화자(주최자, 외부 참석자 등)를 고려해 DIARIZATION_SPEAKER_COUNT_MARGIN 만큼 여유를 둠
+        min_speakers = self.min_speaker_count
+        max_speakers = self.max_speaker_count
+
+        if max_speakers is None:
+            attendee_count = self.meeting.attendees.count()
+            if attendee_count:
+                max_speakers = attendee_count + settings.DIARIZATION_SPEAKER_COUNT_MARGIN
+
+        if min_speakers is not None and max_speakers is not None and min_speakers > max_speakers:
+            max_speakers = min_speakers
+
+        return min_speakers, max_speakers
+
+    def save_speaker_count(self, min_speaker_count, max_speaker_count, user: User):
+        self.min_speaker_count = min_speaker_count
+        self.max_speaker_count = max_speaker_count
+        self.last_modified_user = user
+
+        self.save(update_fields=['min_speaker_count', 'max_speaker_count', 'last_modified_user', 'last_modified_date'])
+
+    def start_live_recording(self, user: User):
+        # 실시간 녹음은 녹음 중에 임시 부분(Segment)을 저장할 음성 인식을 미리 만들고, 녹음 종료 후 전사 작업을 요청할 때 이어서 사용
+        speech_recognition = SpeechRecognition.objects.create(
+            task_id='',
+            task_status_code=TaskStatusCode.WAITING,
+            recording=self,
+            created_user=user,
+            last_modified_user=user,
+        )
+
+        self.set_latest_speech_recognition(speech_recognition, user)
+
+    def transcribe_live_recording(self, transcribed_millisecond, user: User):
+        self.live_transcribed_millisecond = transcribed_millisecond
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['live_transcribed_millisecond', 'last_modified_user', 'last_modified_date'])
+
+    def stop_live_recording(self, user: User):
+        self.is_live = False
+        self.webm_file_size = self.webm_file.size
+        self.probe()
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['is_live', 'webm_file_size', *self.PROBE_FIELDS, 'last_modified_user', 'last_modified_date'])
+
+        self.start_waveform_task()
+
     def set_latest_speech_recognition(self, speech_recognition, user):
         self.latest_speech_recognition = speech_recognition
         self.last_modified_user = user
@@ -252,25 +425,93 @@ class Recording(Base):
 
         if is_new:
             if self.webm_file:
-                try:
-                    audio = AudioSegment.from_file(self.webm_file.path)
-                    self.play_millisecond = len(audio)
-                    super().save(update_fields=['play_millisecond'])
-                except Exception as e:
-                    logger.error(f"Audio duration read failed: {e}")
-                    self.play_millisecond = 0
+                self.probe()
+                super().save(update_fields=self.PROBE_FIELDS)
+                self.start_waveform_task()
             else:
                 self.play_millisecond = 0
 
+    def probe(self):
+        # 파일 전체를 디코딩하지 않고 컨테이너 헤더에서 재생 시간과 오디오 정보를 읽음
+        try:
+            media_info = MediaUtils.probe(self.webm_file.path)
+        except Exception as e:
+            logger.error(f"Audio probe failed: {e}")
+            self.play_millisecond = 0
+            return
+
+        self.play_millisecond = media_info['duration_millisecond']
+        self.audio_codec = media_info['audio_codec']
+        self.sample_rate = media_info['sample_rate']
+        self.channel_count = media_info['channel_count']
+
     class Meta:
         db_table = 'meetings_recording'
         verbose_name = '녹음'
         verbose_name_plural = '녹음 목록'
+        indexes = [
+            models.Index(fields=['content_hash'], name='idx_recording_01'),
+        ]
 
     def __str__(self):
         return f"Recording #{self.pk}"
 
 
+class RecordingUpload(Base):
+    # 큰 녹음 파일을 여러 조각으로 나누어 업로드(중단된 위치부터 이어서 업로드 가능), 완료되면 녹음(Recording)을 생성
+    id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='id')
+    upload_key = models.CharField(max_length=32, unique=True, verbose_name='업로드 키')
+    file_name = models.CharField(max_length=256, verbose_name='파일 명')
+    content_type = models.CharField(max_length=128, blank=True, verbose_name='파일종류')
+    source_type = models.CharField(max_length=32, blank=True, verbose_name='출처 유형')
+    file_size = models.BigIntegerField(verbose_name='파일 크기')
+    received_size = models.BigIntegerField(default=0, verbose_name='수신 크기')
+    upload_status_code = models.CharField(max_length=16, verbose_name='업로드 상태 코드')
+    meeting = models.ForeignKey('Meeting', on_delete=models.RESTRICT, verbose_name='회의')
+    recording = models.ForeignKey('Recording', null=True, blank=True, on_delete=models.RESTRICT, verbose_name='녹음')
+
+    @staticmethod
+    def find_by_upload_key_for_update(upload_key: str, meeting_id: int):
+        return RecordingUpload.objects.select_for_update().get(upload_key=upload_key, meeting_id=meeting_id)
+
+    @staticmethod
+    def find_expired():
+        expired_datetime = timezone.now() - timedelta(hours=settings.RECORDING_UPLOAD_EXPIRE_HOUR)
+        return RecordingUpload.objects.filter(upload_status_code=RecordingUploadStatusCode.UPLOADING, last_modified_date__lt=expired_datetime)
+
+    def get_file_path(self):
+        return os.path.join(settings.MEDIA_ROOT, 'uploads', self.upload_key)
+
+    def is_uploading(self):
+        return self.upload_status_code == RecordingUploadStatusCode.UPLOADING
+
+    def is_received(self):
+        return self.received_size == self.file_size
+
+    def receive(self, size, user: User):
+        self.received_size += size
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['received_size', 'last_modified_user', 'last_modified_date'])
+
+    def complete(self, recording, user: User):
+        self.recording = recording
+        self.upload_status_code = RecordingUploadStatusCode.COMPLETED
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['recording', 'upload_status_code', 'last_modified_user', 'last_modified_date'])
+
+    class Meta:
+        db_table = 'meetings_recording_upload'
+        verbose_name = '녹음 업로드'
+        verbose_name_plural = '녹음 업로드 목록'
+
+    def __str__(self):
+        return f"RecordingUpload #{self.pk}"
+
+
 class SpeechRecognition(Base):
     id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='id')
     task_id = models.CharField(max_length=32, verbose_name='작업 id')
@@ -280,6 +521,7 @@ class SpeechRecognition(Base):
     task_start_datetime = models.DateTimeField(null=True, blank=True, verbose_name='작업 시작 시간')
     speech_recognition_end_datetime = models.DateTimeField(null=True, blank=True, verbose_name='음성 인식 종료 시간')
     align_end_datetime = models.DateTimeField(null=True, blank=True, verbose_name='정렬 종료 시간')
+    diarization_start_datetime = models.DateTimeField(null=True, blank=True, verbose_name='화자 분리 시작 시간')
     diarization_end_datetime = models.DateTimeField(null=True, blank=True, verbose_name='화자 분리 종료 시간')
     assignment_end_datetime = models.DateTimeField(null=True, blank=True, verbose_name='할당 종료 시간')
     task_end_datetime = models.DateTimeField(null=True, blank=True, verbose_name='작업 종료 시간')
@@ -313,6 +555,17 @@ class SpeechRecognition(Base):
 
         return speech_recognition
 
+    @staticmethod
+    def find_completed_by_content_hash(content_hash: str | None, exclude_recording_id: int):
+        if not content_hash:
+            return None
+
+        return (SpeechRecognition.objects
+                .filter(recording__content_hash=content_hash, recording__is_active=True, task_status_code=TaskStatusCode.COMPLETED)
+                .exclude(recording_id=exclude_recording_id)
+                .order_by('-pk')
+                .first())
+
     def get_latest_summarization(self):
         if not getattr(self, 'latest_summarization', None):
             latest_summarization = Summarization.objects.filter(
@@ -388,6 +641,17 @@ class SpeechRecognition(Base):
     def is_failed(self):
         return self.task_status_code == TaskStatusCode.FAILED
 
+    def is_provisional(self):
+        # 실시간 녹음 중이거나 녹음이 끝났지만 아직 전사 작업을 요청하지 않은 음성 인식
+        return self.task_status_code == TaskStatusCode.WAITING and not self.task_id
+
+    def request(self, task_id, user):
+        self.task_id = task_id
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['task_id', 'last_modified_user', 'last_modified_date'])
+
     def transcribe(self, user):
         self.task_start_datetime = timezone.now()
         self.task_step_code = SpeechRecognitionStepCode.SPEECH_RECOGNITION
@@ -414,13 +678,15 @@ class SpeechRecognition(Base):
 
         self.save(update_fields=['task_step_code', 'align_end_datetime', 'last_modified_user', 'last_modified_date'])
 
-    def assign(self, user):
+    def assign(self, user, diarization_start_datetime=None, diarization_end_datetime=None):
+        # 화자 분리는 음성 인식·정렬과 동시에 실행되므로 실제 실행 구간을 전달받아 기록
         self.task_step_code = SpeechRecognitionStepCode.ASSIGNMENT
-        self.diarization_end_datetime = timezone.now()
+        self.diarization_start_datetime = diarization_start_datetime
+        self.diarization_end_datetime = diarization_end_datetime or timezone.now()
         self.last_modified_user = user
         self.last_modified_date = timezone.now()
 
-        self.save(update_fields=['task_step_code', 'diarization_end_datetime', 'last_modified_user', 'last_modified_date'])
+        self.save(update_fields=['task_step_code', 'diarization_start_datetime', 'diarization_end_datetime', 'last_modified_user', 'last_modified_date'])
 
     def save_result(self, result, user):
         self.speech_recognition_model_name = result.get('speech_recognition_model_name')
@@ -448,6 +714,75 @@ class SpeechRecognition(Base):
 
         self.start_summarization_task(user)
 
+    def clone_result(self, source, user: User):
+        # 같은 녹음 내용으로 완료된 음성 인식 결과(화자, 부분, 단어)를 복제하고 완료 처리
+        now = timezone.now()
+        meeting = self.recording.meeting
+
+        source_speakers = list(Speaker.objects.filter(segment__speech_recognition=source).distinct())
+        speakers = Speaker.upsert_all(
+            meeting,
+            {s.speaker_label for s in source_speakers},
+            self.recording,
+            user,
+            users={s.speaker_label: s.user for s in source_speakers if s.meeting_id == meeting.pk},
+        )
+        speaker_map = {s.pk: speakers[s.speaker_label] for s in source_speakers}
+
+        source_segments = list(Segment.objects.filter(speech_recognition=source).order_by('id'))
+        segments = Segment.objects.bulk_create([
+            Segment(
+                text=s.text,
+                start_millisecond=s.start_millisecond,
+                end_millisecond=s.end_millisecond,
+                words=s.words,
+                word_timings=s.word_timings,
+                speech_recognition=self,
+                speaker=speaker_map[s.speaker_id],
+                created_user=user,
+                last_modified_user=user,
+            )
+            for s in source_segments
+        ])
+        segment_map = {source_segment.pk: segment for source_segment, segment in zip(source_segments, segments)}
+
+        words = (Word.objects
+                 .filter(segment__speech_recognition=source)
+                 .order_by('id')
+                 .values_list('word', 'score', 'start_millisecond', 'end_millisecond', 'segment_id', 'speaker_id'))
+        Word.objects.bulk_create(
+            (Word(
+                word=word,
+                score=score,
+                start_millisecond=start_millisecond,
+                end_millisecond=end_millisecond,
+                segment=segment_map[segment_id],
+                speaker=speaker_map[speaker_id],
+                created_user=user,
+                last_modified_user=user,
+            ) for word, score, start_millisecond, end_millisecond, segment_id, speaker_id in words.iterator(chunk_size=5000)),
+            batch_size=5000
+        )
+
+        self.speech_recognition_model_name = source.speech_recognition_model_name
+        self.align_model_name = source.align_model_name
+        self.diarization_model_name = source.diarization_model_name
+        self.language_code = source.language_code
+        self.task_start_datetime = now
+        self.speech_recognition_end_datetime = now
+        self.align_end_datetime = now
+        self.diarization_start_datetime = now
+        self.diarization_end_datetime = now
+        self.assignment_end_datetime = now
+        self.task_status_code = TaskStatusCode.PROCESSING
+        self.save(update_fields=['speech_recognition_model_name', 'align_model_name', 'diarization_model_name', 'language_code', 'task_start_datetime',
+                                 'speech_recognition_end_datetime', 'align_end_datetime', 'diarization_start_datetime', 'diarization_end_datetime',
+                                 'assignment_end_datetime', 'task_status_code'])
+
+        logger.info(f"전사 결과 복제: SpeechRecognition #{source.pk} -> #{self.pk} (Recording #{self.recording_id})")
+
+        self.complete_task(user)
+
     def fail_task(self, user: User, start_datetime=None, end_datetime=timezone.now()):
         if not self.is_processing():
             raise ValidationError('실패 처리가 불가한 상태에요.')
@@ -549,10 +884,31 @@ class Speaker(Base):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.RESTRICT, null=True, blank=True, verbose_name='매핑된 사용자')
     original_recording = models.ForeignKey('Recording', on_delete=models.RESTRICT, null=True, blank=True, verbose_name='원본 녹음')
 
+    @staticmethod
+    def upsert_all(meeting, speaker_labels, recording, user: User, users=None) -> dict:
+        # 회의의 화자를 한 문장(INSERT ... ON CONFLICT)으로 등록하고 {화자 레이블: 화자} 반환, 이미 있는 화자는 변경하지 않음
+        if not speaker_labels:
+            return {}
+
+        users = users or {}
+        Speaker.objects.bulk_create([
+            Speaker(
+                speaker_label=label,
+                meeting=meeting,
+                user=users.get(label),
+                original_recording=recording,
+                created_user=user,
+                last_modified_user=user,
+            ) for label in speaker_labels
+        ], ignore_conflicts=True)
+
+        return {speaker.speaker_label: speaker for speaker in Speaker.objects.filter(meeting=meeting, speaker_label__in=speaker_labels)}
+
     class Meta:
         db_table = 'meetings_speaker'
         verbose_name = '화자'
         verbose_name_plural = '화자 목록'
+        unique_together = ("meeting", "speaker_label")
 
     def __str__(self):
         return self.speaker_label
@@ -564,8 +920,13 @@ class Segment(Base):
     start_millisecond = models.IntegerField(null=True, blank=True, verbose_name='시작 밀리초')
     end_millisecond = models.IntegerField(null=True, blank=True, verbose_name='종료 밀리초')
     corrected_text = models.TextField(null=True, blank=True, verbose_name='교정된 문자')
+    is_provisional = models.BooleanField(default=False, verbose_name='임시 여부')
     speech_recognition = models.ForeignKey('SpeechRecognition', on_delete=models.CASCADE, verbose_name='음성 인식')
     speaker = models.ForeignKey('Speaker', on_delete=models.CASCADE, verbose_name='화자')
+    # 단어 묶음 저장(WORD_STORAGE_MODE=packed), 단어 시간·점수는 int32 시작 밀리초, int32 종료 밀리초, float32 점수 배열을 차례로 이어 붙인 바이트(리틀 엔디언, 시간이 없으면 -1)
+    words = ArrayField(models.CharField(max_length=128), null=True, blank=True, verbose_name='단어 목록')
+    corrected_words = ArrayField(models.CharField(max_length=128, null=True), null=True, blank=True, verbose_name='교정된 단어 목록')
+    word_timings = models.BinaryField(null=True, blank=True, verbose_name='단어 시간·점수')
 
     class Meta:
         db_table = 'meetings_segment'
@@ -575,6 +936,23 @@ class Segment(Base):
     def __str__(self):
         return f"{self.start_millisecond} ~ {self.end_millisecond} {self.text}"
 
+    def is_packed_words(self):
+        return self.words is not None
+
+    def pack_words(self, words_data: list[dict]):
+        # 음성 인식 결과의 단어 목록(word, score, start, end 초)을 배열로 묶음
+        self.words = [w['word'] for w in words_data]
+        self.corrected_words = None
+        self.word_timings = b''.join([
+            np.asarray([self._to_millisecond(w.get('start')) for w in words_data], dtype='<i4').tobytes(),
+            np.asarray([self._to_millisecond(w.get('end')) for w in words_data], dtype='<i4').tobytes(),
+            np.asarray([w.get('score', 0.0) for w in words_data], dtype='<f4').tobytes(),
+        ])
+
+    @staticmethod
+    def _to_millisecond(second):
+        return int(second * 1000) if second is not None else -1
+
 
 class Word(Base):
     id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='id')
@@ -619,6 +997,8 @@ class Summarization(Base):
     summarization_content = models.TextField(null=True, blank=True, verbose_name='요약 내용')
     minutes_content = models.TextField(null=True, blank=True, verbose_name='회의록 내용')
     action_items = models.JSONField(null=True, blank=True, verbose_name='액션 아이템')
+    retry_count = models.PositiveSmallIntegerField(default=0, verbose_name='재시도 횟수')
+    retry_datetime = models.DateTimeField(null=True, blank=True, verbose_name='재시도 예정 시간')
     speech_recognition = models.ForeignKey('SpeechRecognition', on_delete=models.RESTRICT, related_name='summarization_set', verbose_name='음성 인식')
 
     @staticmethod
@@ -687,7 +1067,8 @@ class Summarization(Base):
 
     def prepare(self, user: User):
         self.task_step_code = SummarizationStepCode.PREPARATION
-        self.task_start_datetime = timezone.now()
+        if self.task_start_datetime is None:  # 재시도는 처음 시작한 시간 유지
+            self.task_start_datetime = timezone.now()
         self.task_status_code = TaskStatusCode.PROCESSING
         self.last_modified_user = user
         self.last_modified_date = timezone.now()
@@ -701,6 +1082,46 @@ class Summarization(Base):
 
         self.save(update_fields=['task_step_code', 'last_modified_user', 'last_modified_date'])
 
+    def can_retry(self):
+        return self.retry_count < settings.GEMINI_MAX_RETRIES - 1
+
+    def retry_task(self, generative_ai_model_name, user: User):
+        # 대기하는 동안 작업자가 다른 작업을 처리하도록 지연 시간 후 한 번 실행하는 일정으로 작업을 다시 예약
+        # 예약한 시간에 requeue_task로 교정·요약 작업을 큐에 넣고 작업 id를 갱신
+        if not self.can_retry():
+            raise ValidationError('재시도 횟수를 초과했어요.')
+
+        wait_second = min(60 * (2 ** self.retry_count), 300)  # 60초, 120초, 240초, 300초, ... 증가
+
+        self.generative_ai_model_name = generative_ai_model_name
+        self.task_step_code = SummarizationStepCode.RETRY_WAITING
+        self.retry_count += 1
+        self.retry_datetime = timezone.now() + timedelta(seconds=wait_second)
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['generative_ai_model_name', 'task_step_code', 'retry_count', 'retry_datetime', 'last_modified_user', 'last_modified_date'])
+
+        summarization_id = self.id
+        schedule_name = f"summarization-{self.id}-retry-{self.retry_count}"
+        retry_datetime = self.retry_datetime
+        transaction.on_commit(lambda: schedule(
+            'meetings.tasks.run_summarization_retry', summarization_id, user.id,
+            name=schedule_name,
+            schedule_type=Schedule.ONCE,
+            next_run=retry_datetime,
+        ))
+
+        return wait_second
+
+    def requeue_task(self, user: User):
+        # 상태 조회(fetch)가 실패한 이전 작업이 아닌 다시 실행하는 작업을 보도록 작업 id를 갱신
+        self.task_id = async_task('meetings.tasks.run_correction_and_summarization', self.speech_recognition_id, user.id)
+        self.last_modified_user = user
+        self.last_modified_date = timezone.now()
+
+        self.save(update_fields=['task_id', 'last_modified_user', 'last_modified_date'])
+
     def save_result(self, generative_ai_model_name, user: User):
         self.generative_ai_model_name = generative_ai_model_name
         self.task_step_code = SummarizationStepCode.SAVE_RESULT
@@ -771,3 +1192,173 @@ class Summarization(Base):
 
     def __str__(self):
         return f"Summarization #{self.pk}"
+
+
+class GenerativeAiModelQuota(models.Model):
+    # 생성형 AI 모델별 분당 요청 수·토큰 수 토큰 버킷, 여러 작업자가 함께 사용하도록 행 잠금(select_for_update)으로 차감
+    # 버킷 크기와 충전 속도는 settings.GEMINI_MODEL_QUOTAS로 정하며 행은 처음 사용할 때 생성
+    id = models.BigAutoField(primary_key=True)
+    generative_ai_model_name = models.CharField(max_length=64, unique=True, verbose_name='생성형 AI 모델 이름')
+    available_request_count = models.FloatField(verbose_name='사용 가능 요청 수')
+    available_token_count = models.FloatField(verbose_name='사용 가능 토큰 수')
+    refilled_datetime = models.DateTimeField(verbose_name='충전 시간')
+    blocked_until_datetime = models.DateTimeField(null=True, blank=True, verbose_name='요청 차단 종료 시간')
+    latency_millisecond = models.FloatField(null=True, blank=True, verbose_name='평균 응답 밀리초')
+    request_count = models.BigIntegerField(default=0, verbose_name='요청 수')
+    rate_limited_count = models.BigIntegerField(default=0, verbose_name='요청 한도 초과 수')
+
+    @staticmethod
+    def acquire(quotas: list[tuple[str, int, int]], token_count: int, preferred_name: str | None = None) -> tuple[str | None, float]:
+        # quotas: [(모델 이름, 분당 요청 수, 분당 토큰 수), ...] 우선순위 순서
+        # 요청할 수 있는 모델이 있으면 요청 1개와 토큰을 차감하고 (모델 이름, 0), 없으면 (None, 가장 빨리 요청할 수 있을 때까지의 초)
+        # 같은 요청의 구간들이 같은 모델을 사용하도록 preferred_name에 여유가 있으면 먼저 사용
+        if preferred_name is not None:
+            quotas = sorted(quotas, key=lambda quota: quota[0] != preferred_name)
+
+        now = timezone.now()
+        names = [quota[0] for quota in quotas]
+        if GenerativeAiModelQuota.objects.filter(generative_ai_model_name__in=names).count() < len(names):
+            GenerativeAiModelQuota.objects.bulk_create([
+                GenerativeAiModelQuota(
+                    generative_ai_model_name=name,
+                    available_request_count=requests_per_minute,
+                    available_token_count=tokens_per_minute,
+                    refilled_datetime=now,
+                ) for name, requests_per_minute, tokens_per_minute in quotas
+            ], ignore_conflicts=True)
+
+        with transaction.atomic():
+            rows = {
+                row.generative_ai_model_name: row for row in
+                GenerativeAiModelQuota.objects.select_for_update().filter(generative_ai_model_name__in=names).order_by('id')
+            }
+
+            wait_second = None
+            for name, requests_per_minute, tokens_per_minute in quotas:
+                row = rows[name]
+                if row.blocked_until_datetime is not None and row.blocked_until_datetime > now:
+                    # 429를 받은 모델은 차단 시간이 끝날 때까지 요청하지 않음
+                    row_wait_second = (row.blocked_until_datetime - now).total_seconds()
+                    wait_second = row_wait_second if wait_second is None else min(wait_second, row_wait_second)
+                    continue
+
+                row._refill(requests_per_minute, tokens_per_minute, now)
+
+                required_token_count = min(token_count, tokens_per_minute)  # 버킷보다 큰 요청은 버킷이 가득 찼을 때 요청
+                if row.available_request_count >= 1 and row.available_token_count >= required_token_count:
+                    row.available_request_count -= 1
+                    row.available_token_count -= token_count
+                    row.request_count += 1
+                    row.save(update_fields=['available_request_count', 'available_token_count', 'refilled_datetime', 'request_count'])
+                    return name, 0
+
+                row.save(update_fields=['available_request_count', 'available_token_count', 'refilled_datetime'])
+                row_wait_second = max(
+                    (1 - row.available_request_count) * 60 / requests_per_minute,
+                    (required_token_count - row.available_token_count) * 60 / tokens_per_minute,
+                )
+                wait_second = row_wait_second if wait_second is None else min(wait_second, row_wait_second)
+
+        return None, wait_second or 0
+
+    @staticmethod
+    def record(generative_ai_model_name: str, latency_millisecond: float, token_count_correction: int = 0):
+        # 응답 시간의 지수 이동 평균을 기록하고, 추정한 토큰 수와 실제 토큰 수의 차이만큼 버킷을 보정
+        GenerativeAiModelQuota.objects.filter(generative_ai_model_name=generative_ai_model_name).update(
+            latency_millisecond=Coalesce(
+                F('latency_millisecond') * (1 - LATENCY_SMOOTHING_FACTOR) + Value(latency_millisecond * LATENCY_SMOOTHING_FACTOR),
+                Value(latency_millisecond),
+                output_field=models.FloatField(),
+            ),
+            available_token_count=F('available_token_count') - token_count_correction,
+        )
+
+    @staticmethod
+    def exhaust(generative_ai_model_name: str, retry_after_second: float | None = None):
+        # 429를 받으면 다른 작업자도 요청하지 않도록 남은 요청 수를 비우고, 차단 시간(Retry-After, 최소 GEMINI_RATE_LIMIT_COOLDOWN_SECOND) 동안 요청하지 않음
+        now = timezone.now()
+        cooldown_second = max(retry_after_second or 0, settings.GEMINI_RATE_LIMIT_COOLDOWN_SECOND)
+        GenerativeAiModelQuota.objects.filter(generative_ai_model_name=generative_ai_model_name).update(
+            available_request_count=0,
+            refilled_datetime=now,
+            blocked_until_datetime=now + timedelta(seconds=cooldown_second),
+            rate_limited_count=F('rate_limited_count') + 1,
+        )
+
+    def _refill(self, requests_per_minute: int, tokens_per_minute: int, now):
+        elapsed_minute = max(0.0, (now - self.refilled_datetime).total_seconds() / 60)
+        self.available_request_count = min(requests_per_minute, self.available_request_count + elapsed_minute * requests_per_minute)
+        self.available_token_count = min(tokens_per_minute, self.available_token_count + elapsed_minute * tokens_per_minute)
+        self.refilled_datetime = now
+
+    class Meta:
+        db_table = 'meetings_generative_ai_model_quota'
+        verbose_name = '생성형 AI 모델 할당량'
+        verbose_name_plural = '생성형 AI 모델 할당량 목록'
+
+    def __str__(self):
+        return f"{self.generative_ai_model_name}"
+
+
+class GenerativeAiResponseCache(models.Model):
+    # 같은 전사 내용·프롬프트·응답 스키마·모델의 교정·요약 응답을 저장하여 다시 요청하지 않음
+    # 전체 크기가 settings.GEMINI_RESPONSE_CACHE_MAX_BYTES를 넘으면 가장 오래 사용하지 않은 응답부터 삭제
+    id = models.BigAutoField(primary_key=True)
+    cache_key = models.CharField(max_length=64, unique=True, verbose_name='캐시 키')
+    generative_ai_model_name = models.CharField(max_length=64, verbose_name='생성형 AI 모델 이름')
+    response = models.JSONField(verbose_name='응답')
+    response_size = models.IntegerField(verbose_name='응답 크기')
+    hit_count = models.IntegerField(default=0, verbose_name='사용 횟수')
+    created_date = models.DateTimeField(auto_now_add=True, verbose_name='등록일시')
+    last_accessed_datetime = models.DateTimeField(default=timezone.now, verbose_name='마지막 사용 시간')
+
+    @staticmethod
+    def find(cache_keys: list[str]):
+        # cache_keys 순서(모델 우선순위)대로 처음 찾은 응답
+        caches = {cache.cache_key: cache for cache in GenerativeAiResponseCache.objects.filter(cache_key__in=cache_keys)}
+        for cache_key in cache_keys:
+            cache = caches.get(cache_key)
+            if cache is not None:
+                GenerativeAiResponseCache.objects.filter(pk=cache.pk).update(last_accessed_datetime=timezone.now(), hit_count=F('hit_count') + 1)
+                return cache
+        return None
+
+    @staticmethod
+    def put(cache_key: str, generative_ai_model_name: str, response: dict, response_size: int):
+        GenerativeAiResponseCache.objects.update_or_create(
+            cache_key=cache_key,
+            defaults={
+                'generative_ai_model_name': generative_ai_model_name,
+                'response': response,
+                'response_size': response_size,
+                'last_accessed_datetime': timezone.now(),
+            },
+        )
+        GenerativeAiResponseCache.evict(settings.GEMINI_RESPONSE_CACHE_MAX_BYTES)
+
+    @staticmethod
+    def evict(max_bytes: int):
+        total_size = GenerativeAiResponseCache.objects.aggregate(total_size=Sum('response_size'))['total_size'] or 0
+        if total_size <= max_bytes:
+            return
+
+        evicted_ids = []
+        for cache_id, response_size in GenerativeAiResponseCache.objects.order_by('last_accessed_datetime').values_list('id', 'response_size').iterator():
+            if total_size <= max_bytes:
+                break
+            evicted_ids.append(cache_id)
+            total_size -= response_size
+
+        GenerativeAiResponseCache.objects.filter(id__in=evicted_ids).delete()
+        logger.info(f"교정·요약 응답 캐시 {len(evicted_ids)}개 삭제")
+
+    class Meta:
+        db_table = 'meetings_generative_ai_response_cache'
+        verbose_name = '생성형 AI 응답 캐시'
+        verbose_name_plural = '생성형 AI 응답 캐시 목록'
+        indexes = [
+            models.Index(fields=['last_accessed_datetime'], name='idx_ai_response_cache_01'),
+        ]
+
+    def __str__(self):
+        return f"{self.cache_key}"
@@ -1,26 +1,28 @@
-import difflib
-import json
 import logging
+import os
+import subprocess
 import time
 import traceback
 from collections import defaultdict
-from typing import Any
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils import timezone
-from google import genai
-from google.genai import types
-from google.genai.errors import APIError
 
-from meetings.models import Recording, SpeechRecognition, Speaker, Segment, Word, Summarization, GEMINI_2_5_FLASH_MODEL_NAME, GEMINI_3_FLASH_MODEL_NAME
-from .errors import GeminiApiError
-from .utils import RecordingUtils
+from config import settings
+
+from meetings.models import Recording, SpeechRecognition, Speaker, Segment, Word, Summarization, SpeechRecognitionStepCode
+from .alignment import WordAligner
+from .checkpoints import StageCheckpoint
+from .diarization import SpeechRegions
+from .errors import GeminiApiError, GeminiRateLimitError
+from .gemini import GeminiSummarizer, PROMPT_VERSION
+from .media import MediaUtils, SAMPLE_RATE
+from .utils import RecordingUtils, StageScheduler
+from .writers import SpeechRecognitionWriter, WordCorrectionWriter, UNKNOWN_SPEAKER_LABEL
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
-UNKNOWN_SPEAKER_LABEL = 'UNKNOWN'
-_MAX_RETRIES = 5
 
 
 def run_speech_recognition(recording_id: int, user_id: int):
@@ -40,6 +42,7 @@ def run_speech_recognition(recording_id: int, user_id: int):
         logger.error(f"전사 작업 실패 (Recording #{recording_id}): {e}")
         return {'status': 'error', 'message': '사용자 정보를 확인할 수 없어요.'}
 
+    audio = None
     try:
         if recording.latest_speech_recognition.is_completed():
             if recording.latest_speech_recognition.can_summarization_task():
@@ -52,125 +55,330 @@ def run_speech_recognition(recording_id: int, user_id: int):
         with transaction.atomic():
             speech_recognition.transcribe(user)
 
-        file_path = recording.webm_file.path
+        # 단계별 결과를 체크포인트로 남기고, 이전에 실패한 작업이 남긴 체크포인트가 있으면 해당 단계는 건너뜀
+        checkpoint = StageCheckpoint(recording.id, RecordingUtils.get_model_version())
+        diarization_start_datetime = None
+        diarization_end_datetime = None
+
+        assignment = checkpoint.load(SpeechRecognitionStepCode.ASSIGNMENT)
+        if assignment is None:
+            transcription = checkpoint.load(SpeechRecognitionStepCode.SPEECH_RECOGNITION)
+            alignment = checkpoint.load(SpeechRecognitionStepCode.ALIGNMENT)
+            diarized = checkpoint.load(SpeechRecognitionStepCode.DIARIZATION)
+
+            if alignment is None or diarized is None:
+                # 녹음 파일은 한 번만 디코딩하여 모든 단계에서 같은 PCM 버퍼를 사용
+                audio = MediaUtils.load_audio(recording.webm_file.path, recording.play_millisecond)
+
+            # 화자 분리는 음성에만 의존하므로 음성 인식→정렬과 동시에 실행하고 화자 할당 단계에서 결과를 합침
+            # 음성 구간(저장된 음성 구간 또는 체크포인트의 음성 인식 결과)을 이미 알면 음성 구간만, 모르면 전체 음성을 처음부터 화자 분리
+            # 회의 참석자 수(또는 녹음에 지정한 화자 수)로 화자 분리 클러스터링의 화자 수 범위를 제한
+            speaker_count_bounds = recording.get_speaker_count_bounds()
+
+            with StageScheduler() as scheduler:
+                if diarized is None:
+                    scheduler.submit(SpeechRecognitionStepCode.DIARIZATION, RecordingUtils.diarize, audio, _find_speech_regions(recording, transcription),
+                                     *speaker_count_bounds)
+
+                if alignment is None and transcription is None and RecordingUtils.can_transcribe_in_chunks(audio):
+                    # 긴 녹음은 구간별로 나누어 음성 인식과 정렬을 병렬 처리
+                    chunked = RecordingUtils.transcribe_and_align_in_chunks(audio)
+                    transcription = {'language_code': chunked['language_code'], 'segments': chunked['segments']}
+                    checkpoint.save(SpeechRecognitionStepCode.SPEECH_RECOGNITION, transcription)
+
+                    alignment = {'language_code': chunked['language_code'], 'aligned': chunked['aligned']}
+                    checkpoint.save(SpeechRecognitionStepCode.ALIGNMENT, alignment)
+
+                    # 다음 실행(재전사 등)에서 음성 구간만 화자 분리하도록 음성 구간을 저장
+                    _find_speech_regions(recording, transcription)
+
+                if alignment is None:
+                    if transcription is None or 'transcribed_second' in transcription:
+                        # 실시간 녹음 중 확정된 구간이 있으면 나머지 구간만 음성 인식
+                        transcription = _transcribe(audio, transcription)
+                        checkpoint.save(SpeechRecognitionStepCode.SPEECH_RECOGNITION, transcription)
+
+                        # 다음 실행(재전사 등)에서 음성 구간만 화자 분리하도록 음성 구간을 저장
+                        _find_speech_regions(recording, transcription)
+
+                    with transaction.atomic():
+                        speech_recognition.align(transcription['language_code'], user)
+
+                    alignment = {
+                        'language_code': transcription['language_code'],
+                        'aligned': RecordingUtils.align(audio, transcription['language_code'], transcription['segments']),
+                    }
+                    checkpoint.save(SpeechRecognitionStepCode.ALIGNMENT, alignment)
+                else:
+                    with transaction.atomic():
+                        speech_recognition.align(alignment['language_code'], user)
+
+                # 정렬이 끝난 뒤에도 화자 분리가 진행 중이면 화자 분리 단계로 표시
+                with transaction.atomic():
+                    speech_recognition.diarize(user)
+
+                if diarized is None:
+                    diarized = scheduler.join(SpeechRecognitionStepCode.DIARIZATION)
+                    diarization_start_datetime = scheduler.start_datetimes[SpeechRecognitionStepCode.DIARIZATION]
+                    diarization_end_datetime = scheduler.end_datetimes[SpeechRecognitionStepCode.DIARIZATION]
+                    checkpoint.save(SpeechRecognitionStepCode.DIARIZATION, diarized)
+
+            with transaction.atomic():
+                speech_recognition.assign(user, diarization_start_datetime, diarization_end_datetime)
+
+            assignment = {
+                'language_code': alignment['language_code'],
+                'result': RecordingUtils.assign(alignment['aligned'], diarized),
+            }
+            checkpoint.save(SpeechRecognitionStepCode.ASSIGNMENT, assignment)
+        else:
+            with transaction.atomic():
+                speech_recognition.align(assignment['language_code'], user)
+                speech_recognition.diarize(user)
+                speech_recognition.assign(user)
+
+        result = assignment['result']
 
-        transcription_result = RecordingUtils.transcribe(file_path)
+        with transaction.atomic():
+            speech_recognition.save_result(result, user)
 
-        language_code = transcription_result.get("language", 'ko')
+        segments_data = result.get('segments', [])
+
+        writer = SpeechRecognitionWriter(speech_recognition, user)
+        writer.stage(segments_data)
 
         with transaction.atomic():
-            speech_recognition.align(language_code, user)
+            # 실시간 녹음 중 저장한 임시 부분은 최종 결과로 대체
+            Segment.objects.filter(speech_recognition=speech_recognition, is_provisional=True).delete()
+
+            writer.publish()
 
-        aligned = RecordingUtils.align(file_path, language_code, transcription_result['segments'])
+            speech_recognition.complete_task(user)
+
+        checkpoint.clear()
+
+        logger.info(f"전사 작업 완료: Recording #{recording_id} SpeechRecognition #{speech_recognition.id}")
 
+        return {'status': speech_recognition.task_status_code, 'recording_id': recording_id, 'speech_recognition_id': speech_recognition.id}
+    except Exception as e:
+        traceback.print_exc()
+        logger.error(f"전사 작업 실패 (Recording #{recording_id} SpeechRecognition #{recording.latest_speech_recognition.id}): {e}")
         with transaction.atomic():
-            speech_recognition.diarize(user)
+            recording.latest_speech_recognition.fail_task(user)
+        return {'status': 'error', 'message': f"전사 작업 중 예외가 발생했어요. {e}"}
+    finally:
+        MediaUtils.release_audio(audio)
+
+
+def run_recording_conversion(recording_id: int, user_id: int):
+    # 업로드된 파일을 녹음 저장 위치에 바로 webm으로 변환(임시 파일에 쓴 뒤 이름만 바꿔 완성된 파일만 노출)
+    logger.info(f"녹음 변환 작업 시작: Recording #{recording_id}")
+
+    try:
+        recording = Recording.objects.get(pk=recording_id)
+        user = User.objects.get(pk=user_id)
+    except (Recording.DoesNotExist, User.DoesNotExist) as e:
+        logger.error(f"녹음 변환 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': '녹음 정보를 확인할 수 없어요.'}
+
+    if not recording.is_converting():
+        return {'status': recording.conversion_status_code, 'recording_id': recording_id}
 
-        diarized = RecordingUtils.diarize(file_path)
+    webm_file_name = f"{os.path.splitext(recording.upload_file.name)[0]}.webm"
+    webm_file_path = os.path.join(settings.MEDIA_ROOT, webm_file_name)
+    temp_file_path = f"{webm_file_path}.part"
+
+    try:
+        start = time.perf_counter()
+        MediaUtils.convert_to_webm(recording.upload_file.path, temp_file_path)
+        os.replace(temp_file_path, webm_file_path)
 
         with transaction.atomic():
-            speech_recognition.assign(user)
+            recording.complete_conversion(webm_file_name, user)
 
-        result = RecordingUtils.assign(aligned, diarized)
+        logger.info(f"녹음 변환 작업 완료: Recording #{recording_id} ({time.perf_counter() - start:.1f}초)")
 
+        return {'status': recording.conversion_status_code, 'recording_id': recording_id}
+    except Exception as e:
+        if isinstance(e, subprocess.CalledProcessError):
+            logger.error(f"FFmpeg conversion failed: {e.stderr.decode()}")
+        logger.error(f"녹음 변환 작업 실패 (Recording #{recording_id}): {e}")
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
         with transaction.atomic():
-            speech_recognition.save_result(result, user)
+            recording.fail_conversion(user)
+        return {'status': 'error', 'message': f"녹음 변환 중 예외가 발생했어요. {e}"}
 
-        segments_data = result.get('segments', [])
 
-        speaker_labels = set()
-        for s in segments_data:
-            if 'speaker' not in s:
-                s['speaker'] = UNKNOWN_SPEAKER_LABEL
+def run_waveform_peaks(recording_id: int):
+    # 녹음을 한 번 디코딩하여 단계별 파형 피크를 계산하고 녹음 옆에 바이너리 파일로 저장
+    try:
+        recording = Recording.objects.get(pk=recording_id)
+    except Recording.DoesNotExist as e:
+        logger.error(f"파형 피크 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': '녹음 정보를 확인할 수 없어요.'}
 
-            speaker_labels.add(s['speaker'])
+    if not recording.webm_file:
+        return {'status': 'skipped', 'recording_id': recording_id}
+
+    audio = None
+    try:
+        start = time.perf_counter()
+        audio = MediaUtils.load_audio(recording.webm_file.path, recording.play_millisecond)
+        levels = MediaUtils.compute_peaks(audio)
+
+        peaks_file_name = f"{os.path.splitext(recording.webm_file.name)[0]}.peaks"
+        MediaUtils.write_peaks(os.path.join(settings.MEDIA_ROOT, peaks_file_name), levels, int(len(audio) * 1000 / SAMPLE_RATE))
 
         with transaction.atomic():
-            speaker_map = {}
-            for label in speaker_labels:
-                speaker, _ = Speaker.objects.get_or_create(
-                    speaker_label=label,
-                    meeting=recording.meeting,
-                    defaults={
-                        'original_recording': recording,
-                        'created_user': user,
-                        'last_modified_user': user
-                    }
-                )
-                speaker_map[label] = speaker
-
-            words_to_create = []
-
-            merged_segments = []
-            if segments_data:
-                current_segment = segments_data[0]
-                current_segment['words'] = current_segment.get('words', [])
-
-                for next_segment in segments_data[1:]:
-                    if next_segment['speaker'] == current_segment['speaker']:
-                        current_text_strip = current_segment['text'].strip()
-                        if current_text_strip and current_text_strip[-1] in ['.', '?', '!', '요']:  # 한국어 구어체 특성상 문장 종결을 나타내는 문자
-                            separator = "\n"
-                        else:
-                            separator = " "
-
-                        current_segment['end'] = next_segment['end']
-                        current_segment['text'] += separator + next_segment['text']
-                        current_segment['words'].extend(next_segment.get('words', []))
-                    else:
-                        merged_segments.append(current_segment)
-                        current_segment = next_segment
-                        current_segment['words'] = current_segment.get('words', [])
-                merged_segments.append(current_segment)
-
-            for segment_data in merged_segments:
-                speaker_label = segment_data['speaker']
-                speaker = speaker_map[speaker_label]
-
-                segment_start = segment_data.get('start')
-                segment_end = segment_data.get('end')
-
-                segment = Segment.objects.create(
-                    text=segment_data['text'].strip(),
-                    start_millisecond=int(segment_start * 1000) if segment_start is not None else None,
-                    end_millisecond=int(segment_end * 1000) if segment_end is not None else None,
+            recording.complete_waveform(peaks_file_name)
+
+        logger.info(f"파형 피크 작업 완료: Recording #{recording_id} ({time.perf_counter() - start:.1f}초)")
+
+        return {'status': 'success', 'recording_id': recording_id}
+    except Exception as e:
+        logger.error(f"파형 피크 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': f"파형 피크 계산 중 예외가 발생했어요. {e}"}
+    finally:
+        MediaUtils.release_audio(audio)
+
+
+def run_content_hash(recording_id: int):
+    # 업로드한 원본 파일(변환 전 파일 또는 webm)의 내용 해시를 계산하여 같은 내용의 녹음 전사 결과를 재사용할 수 있게 함
+    try:
+        recording = Recording.objects.get(pk=recording_id)
+    except Recording.DoesNotExist as e:
+        logger.error(f"내용 해시 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': '녹음 정보를 확인할 수 없어요.'}
+
+    file_field = recording.upload_file if recording.upload_file else recording.webm_file
+    if not file_field or recording.content_hash:
+        return {'status': 'skipped', 'recording_id': recording_id}
+
+    try:
+        start = time.perf_counter()
+        content_hash = MediaUtils.hash_file(file_field.path)
+
+        with transaction.atomic():
+            recording.save_content_hash(content_hash)
+
+        logger.info(f"내용 해시 작업 완료: Recording #{recording_id} ({time.perf_counter() - start:.1f}초)")
+
+        return {'status': 'success', 'recording_id': recording_id}
+    except Exception as e:
+        logger.error(f"내용 해시 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': f"내용 해시 계산 중 예외가 발생했어요. {e}"}
+
+
+def _find_speech_regions(recording: Recording, transcription: dict | None) -> list[list[int]] | None:
+    # 저장된 음성 구간이 있으면 사용하고, 없으면 음성 인식 결과로 음성 구간을 만들어 저장
+    if not settings.DIARIZATION_SPEECH_REGIONS_ENABLED:
+        return None
+    if recording.speech_regions is not None:
+        return recording.speech_regions
+    if transcription is None or 'transcribed_second' in transcription:
+        return None
+
+    speech_regions = SpeechRegions.from_segments(transcription['segments'], recording.play_millisecond)
+    with transaction.atomic():
+        recording.save_speech_regions(speech_regions)
+
+    return speech_regions
+
+
+def _transcribe(audio, transcription: dict | None = None) -> dict:
+    transcribed_second = transcription.get('transcribed_second', 0) if transcription else 0
+    language_code = transcription['language_code'] if transcription else None
+    segments = transcription['segments'] if transcription else []
+
+    start = int(transcribed_second * SAMPLE_RATE)
+    if start < len(audio):
+        # 메모리 맵은 복사하지 않고 시작 위치만 전달
+        transcription_result = RecordingUtils.transcribe(audio, language_code, start=start)
+        language_code = language_code or transcription_result.get("language", 'ko')
+        for segment in transcription_result['segments']:
+            segment['start'] += transcribed_second
+            segment['end'] += transcribed_second
+            segments.append(segment)
+
+    return {'language_code': language_code or 'ko', 'segments': segments}
+
+
+def run_live_transcription(recording_id: int, user_id: int):
+    # 실시간 녹음 중 아직 확정되지 않은 구간을 음성 인식하여 임시 부분으로 저장
+    # 끝부분(LIVE_TRANSCRIPTION_TAIL_SECOND)은 말이 끊긴 상태일 수 있으므로 확정하지 않고 다음 구간과 함께 다시 인식
+    try:
+        recording = Recording.find_by_id_with_latest_tasks(recording_id)
+        user = User.objects.get(pk=user_id)
+    except (Recording.DoesNotExist, User.DoesNotExist) as e:
+        logger.error(f"실시간 전사 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': '녹음 정보를 확인할 수 없어요.'}
+
+    speech_recognition = recording.latest_speech_recognition
+    if not recording.is_live or speech_recognition is None or not speech_recognition.is_provisional():
+        return {'status': 'skipped', 'recording_id': recording_id}
+
+    try:
+        checkpoint = StageCheckpoint(recording.id, RecordingUtils.get_model_version())
+        transcription = checkpoint.load(SpeechRecognitionStepCode.SPEECH_RECOGNITION) or {'language_code': None, 'segments': [], 'transcribed_second': 0}
+        transcribed_second = transcription['transcribed_second']
+
+        audio = MediaUtils.load_audio(recording.webm_file.path, start_millisecond=int(transcribed_second * 1000))
+        window_second = len(audio) / SAMPLE_RATE
+        if window_second < settings.LIVE_TRANSCRIPTION_MIN_SECOND:
+            return {'status': 'skipped', 'recording_id': recording_id}
+
+        transcription_result = RecordingUtils.transcribe(audio, transcription['language_code'], is_live=True)
+        language_code = transcription['language_code'] or transcription_result.get("language", 'ko')
+
+        committed_segments = [s for s in transcription_result['segments'] if s['end'] <= window_second - settings.LIVE_TRANSCRIPTION_TAIL_SECOND]
+        if not committed_segments:
+            return {'status': 'skipped', 'recording_id': recording_id}
+
+        for segment in committed_segments:
+            segment['start'] += transcribed_second
+            segment['end'] += transcribed_second
+
+        transcription = {
+            'language_code': language_code,
+            'segments': transcription['segments'] + committed_segments,
+            'transcribed_second': committed_segments[-1]['end'],
+        }
+        checkpoint.save(SpeechRecognitionStepCode.SPEECH_RECOGNITION, transcription)
+
+        with transaction.atomic():
+            speaker, _ = Speaker.objects.get_or_create(
+                speaker_label=UNKNOWN_SPEAKER_LABEL,
+                meeting=recording.meeting,
+                defaults={
+                    'original_recording': recording,
+                    'created_user': user,
+                    'last_modified_user': user
+                }
+            )
+
+            Segment.objects.bulk_create([
+                Segment(
+                    text=segment['text'].strip(),
+                    start_millisecond=int(segment['start'] * 1000),
+                    end_millisecond=int(segment['end'] * 1000),
+                    is_provisional=True,
                     speech_recognition=speech_recognition,
                     speaker=speaker,
                     created_user=user,
                     last_modified_user=user,
-                )
+                ) for segment in committed_segments
+            ])
 
-                for word_data in segment_data['words']:
-                    word_start = word_data.get('start')
-                    word_end = word_data.get('end')
-
-                    words_to_create.append(
-                        Word(
-                            word=word_data['word'],
-                            score=word_data.get('score', 0.0),
-                            start_millisecond=int(word_start * 1000) if word_start is not None else None,
-                            end_millisecond=int(word_end * 1000) if word_end is not None else None,
-                            segment=segment,
-                            speaker=speaker,
-                            created_user=user,
-                            last_modified_user=user,
-                        )
-                    )
-
-            if words_to_create:
-                Word.objects.bulk_create(words_to_create)
+            recording.transcribe_live_recording(int(transcription['transcribed_second'] * 1000), user)
 
-            speech_recognition.complete_task(user)
+        logger.info(f"실시간 전사: Recording #{recording_id} {transcribed_second:.1f}초 ~ {transcription['transcribed_second']:.1f}초 확정")
 
-        logger.info(f"전사 작업 완료: Recording #{recording_id} SpeechRecognition #{speech_recognition.id}")
-
-        return {'status': speech_recognition.task_status_code, 'recording_id': recording_id, 'speech_recognition_id': speech_recognition.id}
+        return {'status': 'success', 'recording_id': recording_id, 'transcribed_second': transcription['transcribed_second']}
     except Exception as e:
         traceback.print_exc()
-        logger.error(f"전사 작업 실패 (Recording #{recording_id} SpeechRecognition #{recording.latest_speech_recognition.id}): {e}")
-        with transaction.atomic():
-            recording.latest_speech_recognition.fail_task(user)
-        return {'status': 'error', 'message': f"전사 작업 중 예외가 발생했어요. {e}"}
+        logger.error(f"실시간 전사 작업 실패 (Recording #{recording_id}): {e}")
+        return {'status': 'error', 'message': f"실시간 전사 작업 중 예외가 발생했어요. {e}"}
 
 
 def run_correction_and_summarization(speech_recognition_id: int, user_id: int) -> dict:
@@ -200,15 +408,16 @@ def run_correction_and_summarization(speech_recognition_id: int, user_id: int) -
         with transaction.atomic():
             summarization.prepare(user)
 
-        full_text_json, original_segments_map = prepare_prompt_data(speech_recognition_id)
+        prompt_segments, original_segments_map = prepare_prompt_data(speech_recognition_id)
 
-        if not full_text_json:
+        if not prompt_segments:
             raise Exception('교정·요약할 내용이 없어요.')
 
         with transaction.atomic():
             summarization.request(user)
 
-        generative_ai_model_name, gemini_result = call_gemini_for_correction_and_summarization(full_text_json)
+        checkpoint = StageCheckpoint(recording.id, f"gemini-{PROMPT_VERSION}", 'summarization')
+        generative_ai_model_name, gemini_result = GeminiSummarizer(checkpoint, summarization.generative_ai_model_name).run(prompt_segments)
 
         with transaction.atomic():
             summarization.save_result(generative_ai_model_name, user)
@@ -250,11 +459,25 @@ def run_correction_and_summarization(speech_recognition_id: int, user_id: int) -
 
             logger.info(f"교정·요약 완료: SpeechRecognition #{speech_recognition_id} Summarization #{summarization.pk}")
 
+        checkpoint.clear()
+
         return {
             'status': summarization.task_status_code,
             'speech_recognition_id': speech_recognition_id,
             'summarization_id': summarization.pk,
         }
+    except GeminiRateLimitError as e:
+        if summarization.can_retry():
+            with transaction.atomic():
+                wait_second = summarization.retry_task(e.generative_ai_model_name, user)
+            logger.warning(f"Gemini API 429 Quota 초과 발생으로 {wait_second}초 후 재시도하도록 예약합니다. "
+                           f"(SpeechRecognition #{speech_recognition_id} Summarization #{summarization.pk} 시도 {summarization.retry_count}/{settings.GEMINI_MAX_RETRIES})")
+            return {'status': summarization.task_status_code, 'summarization_id': summarization.pk, 'retry_datetime': summarization.retry_datetime}
+
+        logger.error(f"교정·요약 작업 실패 (SpeechRecognition #{speech_recognition_id} Summarization #{summarization.pk}): {e}")
+        with transaction.atomic():
+            summarization.fail_task(e.generative_ai_model_name, user)
+        return {'status': 'error', 'message': e.message}
     except GeminiApiError as e:
         logger.error(f"교정·요약 작업 실패 (SpeechRecognition #{speech_recognition_id} Summarization #{summarization.pk}): {e}")
         with transaction.atomic():
@@ -267,6 +490,26 @@ def run_correction_and_summarization(speech_recognition_id: int, user_id: int) -
         return {'status': 'error', 'message': f"교정·요약 작업 중 시스템 예외가 발생했어요. {e}"}
 
 
+def run_summarization_retry(summarization_id: int, user_id: int):
+    # 재시도 예약 시간에 실행되어 교정·요약 작업을 큐에 넣음
+    try:
+        summarization = Summarization.objects.get(pk=summarization_id)
+        user = User.objects.get(pk=user_id)
+    except (Summarization.DoesNotExist, User.DoesNotExist) as e:
+        logger.error(f"교정·요약 재시도 실패 (Summarization #{summarization_id}): {e}")
+        return {'status': 'error', 'message': '교정·요약 정보를 확인할 수 없어요.'}
+
+    if not summarization.is_processing():
+        return {'status': summarization.task_status_code, 'summarization_id': summarization_id}
+
+    with transaction.atomic():
+        summarization.requeue_task(user)
+
+    logger.info(f"교정·요약 재시도 작업 요청: Summarization #{summarization_id} (작업 {summarization.task_id})")
+
+    return {'status': summarization.task_status_code, 'summarization_id': summarization_id, 'task_id': summarization.task_id}
+
+
 def prepare_prompt_data(speech_recognition_id: int):
     segments = Segment.objects.filter(speech_recognition_id=speech_recognition_id).select_related('speaker').order_by('id')
 
@@ -284,191 +527,40 @@ def prepare_prompt_data(speech_recognition_id: int):
         })
         original_segments_map[seg.id] = seg
 
-    # 한국어 처리를 위해 ensure_ascii=False
-    full_text_json = json.dumps(prompt_segments, ensure_ascii=False, indent=2)
-
-    return full_text_json, original_segments_map
-
-
-def call_gemini_for_correction_and_summarization(prompt_data: str) -> tuple[str, Any]:
-    # 출력 JSON 스키마 정의
-    response_schema = types.Schema(
-        type=types.Type.OBJECT,
-        properties={
-            "general_summarization": types.Schema(
-                type=types.Type.STRING,
-                description="교정된 전체 내용을 약 10줄로 개괄적으로 요약한 내용입니다."
-            ),
-            "meeting_minutes": types.Schema(
-                type=types.Type.STRING,
-                description="회의의 핵심 의제, 주요 논의 결과 및 결정 사항을 문어체, 두괄식으로 압축하여 작성한 공식 회의록 본문입니다."
-            ),
-            "action_items": types.Schema(
-                type=types.Type.ARRAY,
-                description="회의 내용에서 도출된 조치 사항(Action Item)을 추출합니다. 각 항목은 '주체: 내용' 또는 '주체(마감일): 내용' 형태로 작성합니다.",
-                items=types.Schema(
-                    type=types.Type.STRING,
-                    description="하나의 구체적인 액션 아이템 (예: 홍길동: 12/31까지 보고서 초안 작성)"
-                )
-            ),
-            "corrected_segments": types.Schema(
-                type=types.Type.ARRAY,
-                description="각 세그먼트의 교정 결과 리스트입니다.",
-                items=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "original_segment_id": types.Schema(
-                            type=types.Type.INTEGER,
-                            description="요청 시 제공된 Segment의 ID (이 값을 반드시 그대로 반환해야 합니다)."
-                        ),
-                        "corrected_text": types.Schema(
-                            type=types.Type.STRING,
-                            description="원본 텍스트를 문법, 오타 등을 교정한 최종 결과 텍스트입니다. 화자 레이블은 포함하지 않습니다."
-                        )
-                    },
-                    required=["original_segment_id", "corrected_text"]
-                )
-            )
-        },
-        required=["general_summarization", "meeting_minutes", "action_items", "corrected_segments"]
-    )
-
-    # AI의 행동 강령/정체성 부여
-    system_instruction = (
-        "당신은 회의록 전사 기록을 교정하고 내용을 구조화하여 공식 회의록을 작성하는 전문가입니다. "
-        "제공된 데이터를 분석하여 반드시 **지정된 JSON 스키마 형식**으로만 응답해야 합니다.\n\n"
-        "**[핵심 원칙]**\n"
-        "1. **정확성:** 원본의 의미를 왜곡하지 않고 정확하게 교정해야 합니다.\n"
-        "2. **데이터 무결성:** 결과의 'corrected_segments' 리스트에 있는 'original_segment_id'는 입력된 원본 ID와 반드시 일치해야 합니다.\n"
-        "3. **가독성 (문단 분리):** 텍스트 교정 시, 다음 기준에 따라 적극적으로 문단을 분리하고 개행 문자('\\n')를 사용하십시오.\n"
-        "   - 화자가 바뀌거나 주제가 전환될 때.\n"
-        "   - 하나의 문단에는 하나의 중심 생각만 담을 것."
-    )
-
-    correct_word_prompt = " 단어의 원형은 가급적 유지하며 문법만 교정하십시오."
-    is_correct_word = False  # 단어 교정을 우선으로 하려면
-
-    # 프롬프트
-    prompt = f"""
-    다음 [데이터]를 바탕으로 아래 4가지 작업을 수행하고 JSON 결과를 반환하십시오.
-
-    **[작업 지시사항]**
-
-    **1. 세그먼트 교정 (corrected_segments)**
-    - 각 세그먼트의 'text'를 문법과 오타를 수정하고 자연스러운 문어체로 다듬어 'corrected_text'에 작성하십시오.{correct_word_prompt if is_correct_word else ''}
-    - 시스템 지침의 '가독성 원칙'을 적용하여 문단을 적절히 분리하십시오.
-
-    **2. 일반 요약 (general_summarization)**
-    - 전체 회의 내용을 약 10줄 내외로 개괄적으로 요약하십시오.
-    - 시스템 지침의 '가독성 원칙'을 적용하여 문단을 적절히 분리하십시오.
-    
-    **3. 회의록 본문 작성 (meeting_minutes)**
-    - 전체 내용을 **공식 회의록 스타일(문어체, 두괄식)**로 재구성하십시오.
-    - **주요 의제(회의 목적)**, **핵심 논의 내용**, **최종 결정 사항**을 명확한 소제목으로 구분하여 작성하십시오.
-
-    **4. 액션 아이템 추출 (action_items)**
-    - 회의 내용 중 실행이 필요한 과업을 찾아 **'담당자: 할 일 (마감기한)'** 형태로 명확히 추출하십시오.
-
-    **[데이터]**
-    {prompt_data}
-    """
-
-    generative_ai_model_name = GEMINI_3_FLASH_MODEL_NAME
-
-    try:
-        client = genai.Client()
-
-        for attempt in range(_MAX_RETRIES):
-            try:
-                response = client.models.generate_content(
-                    model=generative_ai_model_name,
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        response_mime_type="application/json",
-                        response_schema=response_schema,
-                        system_instruction=system_instruction
-                    ),
-                )
-
-                return generative_ai_model_name, json.loads(response.text)
-            except APIError as e:
-                logger.error(f"Gemini API 호출 실패 (모델: {generative_ai_model_name}, 시도 {attempt + 1}/{_MAX_RETRIES}): {e}")
-                error_message = str(e)
-                if '429 RESOURCE_EXHAUSTED' in error_message and attempt < _MAX_RETRIES - 1:
-                    generative_ai_model_name = GEMINI_2_5_FLASH_MODEL_NAME
-                    wait_time = min(60 * (2 ** attempt), 300)  # 60초, 120초, 300초, ... 증가
-                    logger.warning(f"Gemini API 429 Quota 초과 발생으로 {wait_time}초 후 재시도합니다. (시도 {attempt + 1}/{_MAX_RETRIES})")
-                    time.sleep(wait_time)
-                    continue
-
-                raise GeminiApiError(message=error_message, generative_ai_model_name=generative_ai_model_name, exception=e)
-            except Exception as e:
-                logger.error(f"Gemini API 호출 실패: {e}")
-                error_message = str(e)
-                if '[Errno 8] nodename nor servname provided, or not known' in error_message:
-                    raise GeminiApiError(message=f"서버 네트워크 예외가 발생했어요. 관리자에게 문의해 주세요.", generative_ai_model_name=generative_ai_model_name, exception=e)
-
-                raise GeminiApiError(message=f"시스템 예외({str(e)})", generative_ai_model_name=generative_ai_model_name, exception=e)
-
-        raise GeminiApiError(message='최대 재시도 횟수를 초과하여 Gemini API 호출에 실패했어요.', generative_ai_model_name=generative_ai_model_name)
-    except Exception as e:
-        logger.error(f"Gemini API 호출 실패: {e}")
-        raise GeminiApiError(message=f"시스템 예외({str(e)})", generative_ai_model_name=generative_ai_model_name, exception=e)
+    return prompt_segments, original_segments_map
 
 
 def correct_words(segments_to_update, user):
     if not segments_to_update:
         return
 
-    segment_ids = [s.id for s in segments_to_update]
-    words = Word.objects.filter(segment_id__in=segment_ids).order_by('segment_id', 'id')
+    aligner = WordAligner(settings.WORD_ALIGNMENT_WORKERS, settings.WORD_ALIGNMENT_PARALLEL_MIN_WORDS)
+
+    # 단어를 부분에 묶어 저장한 경우 교정된 단어 배열만 갱신
+    packed_segments = [s for s in segments_to_update if s.is_packed_words()]
+    aligned = aligner.align_all([(segment.words, (segment.corrected_text or '').split()) for segment in packed_segments])
+    for segment, corrected_words in zip(packed_segments, aligned):
+        segment.corrected_words = corrected_words
+
+    if packed_segments:
+        Segment.objects.bulk_update(packed_segments, ['corrected_words'], batch_size=1000)
+
+    segment_ids = [s.id for s in segments_to_update if not s.is_packed_words()]
+    if not segment_ids:
+        return
+
+    # 단어 객체를 만들지 않고 (id, 단어)만 조회
+    words = Word.objects.filter(segment_id__in=segment_ids).order_by('segment_id', 'id').values_list('segment_id', 'id', 'word')
 
     words_by_segment = defaultdict(list)
-    for word in words:
-        words_by_segment[word.segment_id].append(word)
-
-    words_to_bulk_update = []
-    now = timezone.now()
-
-    for segment in segments_to_update:
-        segment_words = words_by_segment.get(segment.id, [])
-        if not segment_words:
-            continue
-
-        word_texts = [w.word for w in segment_words]
-        corrected_word_texts = (segment.corrected_text or '').split()
-
-        matcher = difflib.SequenceMatcher(None, word_texts, corrected_word_texts)
-
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag in ('equal', 'replace'):
-                original_slice = segment_words[i1:i2]
-                corrected_slice = corrected_word_texts[j1:j2]
-
-                for index, word in enumerate(original_slice):
-                    if index < len(corrected_slice):
-                        word.corrected_word = corrected_slice[index]
-                        word.is_correction_removed = False
-                    else:
-                        word.corrected_word = None
-                        word.is_correction_removed = True
-
-                    word.last_modified_user = user
-                    word.last_modified_date = now
-                    words_to_bulk_update.append(word)
-            elif tag == 'delete':
-                for word in segment_words[i1:i2]:
-                    word.corrected_word = None
-                    word.is_correction_removed = True
-                    word.last_modified_user = user
-                    word.last_modified_date = now
-                    words_to_bulk_update.append(word)
-            elif tag == 'insert':
-                pass
-
-    if words_to_bulk_update:
-        Word.objects.bulk_update(
-            words_to_bulk_update,
-            ['corrected_word', 'is_correction_removed', 'last_modified_user', 'last_modified_date'],
-            batch_size=1000
-        )
+    for segment_id, word_id, word in words.iterator(chunk_size=5000):
+        words_by_segment[segment_id].append((word_id, word))
+
+    segments = [s for s in segments_to_update if words_by_segment.get(s.id)]
+    aligned = aligner.align_all([([word for _, word in words_by_segment[s.id]], (s.corrected_text or '').split()) for s in segments])
+
+    corrections = []
+    for segment, corrected_words in zip(segments, aligned):
+        corrections.extend((word_id, corrected_word) for (word_id, _), corrected_word in zip(words_by_segment[segment.id], corrected_words))
+
+    WordCorrectionWriter(user).write(corrections)
@@ -1,3 +1,20 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from meetings.media import SAMPLE_RATE
+from meetings.utils import ChunkedTranscriber
+
+
+class ChunkedTranscriberTest(SimpleTestCase):
+    def test_merge_shifts_shared_words_once(self):
+        # whisperx align()의 word_segments는 segments의 words와 같은 객체
+        words = [{'word': '안녕', 'start': 1.0, 'end': 1.5}, {'word': '하세요', 'start': 1.5, 'end': 2.0}]
+        aligned = {'segments': [{'start': 1.0, 'end': 2.0, 'text': '안녕 하세요', 'words': words}], 'word_segments': words}
+        transcribed = {'segments': [{'start': 1.0, 'end': 2.0, 'text': '안녕 하세요'}]}
+
+        result = ChunkedTranscriber.merge([(0, 10 * SAMPLE_RATE), (10 * SAMPLE_RATE, 20 * SAMPLE_RATE)], 'ko',
+                                          [({'segments': []}, {'segments': [], 'word_segments': []}), (transcribed, aligned)])
+
+        self.assertEqual(result['segments'][0]['start'], 11.0)
+        self.assertEqual(result['aligned']['segments'][0]['start'], 11.0)
+        self.assertEqual([(w['start'], w['end']) for w in result['aligned']['word_segments']], [(11.0, 11.5), (11.5, 12.0)])
+        self.assertEqual([(w['start'], w['end']) for w in result['aligned']['segments'][0]['words']], [(11.0, 11.5), (11.5, 12.0)])
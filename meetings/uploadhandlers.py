@@ -0,0 +1,21 @@
+import hashlib
+
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class ContentHashUploadHandler(FileUploadHandler):
+    # 업로드 데이터가 스트리밍되는 동안 SHA-256 해시를 계산하여 request.upload_content_hashes[필드명]에 저장
+    # 파일 객체는 다음 업로드 핸들러(메모리/임시 파일)가 생성
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hash = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hash.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if not hasattr(self.request, 'upload_content_hashes'):
+            self.request.upload_content_hashes = {}
+        self.request.upload_content_hashes[self.field_name] = self.hash.hexdigest()
+        return None
@@ -6,8 +6,12 @@ urlpatterns = [
     path('meetings/', views.meetings, name='meetings'),
     path('meetings/<int:pk>/', views.MeetingView.as_view(), name='meeting'),
     path('meetings/<int:meeting_id>/recordings/', views.RecordingUploadView.as_view(), name='upload_recording'),
+    path('meetings/<int:meeting_id>/recordings/uploads/', views.RecordingResumableUploadView.as_view(), name='resumable_upload_recording'),
+    path('meetings/<int:meeting_id>/recordings/uploads/<str:upload_key>/', views.RecordingUploadChunkView.as_view(), name='upload_recording_chunk'),
+    path('meetings/<int:meeting_id>/recordings/uploads/<str:upload_key>/complete/', views.RecordingUploadCompleteView.as_view(), name='complete_upload_recording'),
     path('meetings/samples/<str:filename>', views.download_sample, name='download_sample'),
     path('meetings/<int:meeting_id>/recordings/<int:recording_id>/download', views.RecordingDownloadView.as_view(), name='download_recording'),
+    path('meetings/<int:meeting_id>/recordings/<int:recording_id>/waveform', views.RecordingWaveformView.as_view(), name='recording_waveform'),
     path('meetings/<int:meeting_id>/recordings/<int:recording_id>/', views.RecordingView.as_view(), name='recording'),
     path('meetings/<int:meeting_id>/recordings/<int:recording_id>/tasks/<str:task_id>/', views.RecordingTaskView.as_view(), name='recording_task'),
 ]
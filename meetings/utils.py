@@ -1,61 +1,239 @@
+import copy
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
+import numpy as np
 import torch
 import whisperx
+from django.utils import timezone
 from pandas import DataFrame
 
+from config import settings
+from .caches import ModelCache
+from .diarization import SpeakerAssigner, SpeechRegions
+from .inference import InferenceClient, InferenceServer
+from .media import MediaUtils, SAMPLE_RATE
+
 logger = logging.getLogger(__name__)
 
 
 class RecordingUtils:
+    # 추론 서버를 사용하면 모델이 상주하는 서버 프로세스에 요청하고, 그렇지 않으면 현재 프로세스에서 직접 실행
     @staticmethod
-    def transcribe(file_path):
+    def transcribe(audio: np.ndarray, language_code=None, is_live=False, start=0):
+        # start(샘플 위치)를 지정하면 해당 위치부터 음성 인식
+        if InferenceClient.is_enabled():
+            return InferenceClient.transcribe(audio, language_code, is_live, start)
+
+        audio = audio[start:] if start else audio
         model = ModelHolder.get_model()
+        if is_live:
+            # 실시간 전사는 다른 음성 인식과 동시에 실행될 수 있으므로 호출마다 바뀌는 상태(tokenizer, options)만 따로 갖는 얕은 복사본 사용(모델 가중치는 공유)
+            model = copy.copy(model)
+        if language_code is None:
+            # 상주 모델은 이전 작업에서 만든 tokenizer의 언어를 재사용하므로 언어를 지정하지 않은 작업은 매번 언어를 감지
+            language_code = model.detect_language(audio)
         batch_size = ModelHolder.get_thread_count()
-        return model.transcribe(file_path, batch_size=batch_size, print_progress=True)
+        return model.transcribe(audio, batch_size=batch_size, language=language_code, print_progress=True)
 
     @staticmethod
-    def align(file_path, language_code, segments) -> dict:
+    def align(audio: np.ndarray, language_code, segments) -> dict:
+        if InferenceClient.is_enabled():
+            return InferenceClient.align(audio, language_code, segments)
+
         align_model, metadata = ModelHolder.get_align_model(language_code)
-        return whisperx.align(segments, align_model, metadata, file_path, ModelHolder.get_device())
+        return whisperx.align(segments, align_model, metadata, audio, ModelHolder.get_device())
 
     @staticmethod
-    def diarize(file_path) -> tuple[DataFrame, dict[str, list[float]] | None] | DataFrame:
+    def diarize(audio: np.ndarray, speech_regions: list[list[int]] | None = None, min_speakers: int | None = None,
+                max_speakers: int | None = None) -> tuple[DataFrame, dict[str, list[float]] | None] | DataFrame:
+        if InferenceClient.is_enabled():
+            return InferenceClient.diarize(audio, speech_regions, min_speakers, max_speakers)
+
         diarization_pipeline = ModelHolder.get_diarization_pipeline()
-        return diarization_pipeline(file_path)
+        if not speech_regions:
+            return diarization_pipeline(audio, min_speakers=min_speakers, max_speakers=max_speakers)
+
+        # 음성 구간만 이어 붙여 화자 분리하여 긴 무음 구간의 분할·임베딩 추출을 생략
+        regions = SpeechRegions(speech_regions)
+        voiced = regions.concatenate(audio)
+        logger.info(f"음성 구간 화자 분리: {len(speech_regions)}개 구간, {len(voiced) / SAMPLE_RATE:.0f}초 / {len(audio) / SAMPLE_RATE:.0f}초")
+        return regions.restore(diarization_pipeline(voiced, min_speakers=min_speakers, max_speakers=max_speakers))
+
+    @staticmethod
+    def can_transcribe_in_chunks(audio: np.ndarray) -> bool:
+        # 긴 녹음은 CPU 환경에서 여러 프로세스로 나누어 처리(GPU는 모델 복제본을 여러 개 올릴 수 없어 제외)
+        # django-q 작업자는 데몬 프로세스라 자식 프로세스를 만들 수 없으므로 추론 서버에서만 처리
+        return (settings.TRANSCRIPTION_CHUNK_WORKERS > 1
+                and (InferenceClient.is_enabled() or InferenceServer.is_running())
+                and len(audio) >= settings.TRANSCRIPTION_CHUNK_MIN_SECOND * SAMPLE_RATE
+                and ModelHolder.get_device() == 'cpu')
+
+    @staticmethod
+    def transcribe_and_align_in_chunks(audio: np.ndarray) -> dict:
+        if InferenceClient.is_enabled():
+            return InferenceClient.transcribe_and_align_in_chunks(audio)
+
+        return ChunkedTranscriber(settings.TRANSCRIPTION_CHUNK_WORKERS).run(audio)
+
+    @staticmethod
+    def get_model_version():
+        return f"{ModelHolder.get_model_name()}|{ModelHolder.get_align_model_name()}|{ModelHolder.get_diarization_model_name()}"
 
     @staticmethod
     def assign(aligned: dict, diarized: tuple[DataFrame, dict[str, list[float]] | None] | DataFrame) -> dict:
-        result = whisperx.assign_word_speakers(diarized, aligned)
+        result = SpeakerAssigner(diarized).assign(aligned)
         result['speech_recognition_model_name'] = ModelHolder.get_model_name()
         result['align_model_name'] = ModelHolder.get_align_model_name()
         result['diarization_model_name'] = ModelHolder.get_diarization_model_name()
         return result
 
 
+class StageScheduler:
+    # 서로 의존하지 않는 단계(예: 음성 인식→정렬과 화자 분리)를 별도 스레드에서 동시에 실행하고, 필요한 시점에 결과를 합침
+    # torch, ctranslate2 연산은 GIL을 해제하므로 스레드로도 병렬 실행됨
+    def __init__(self, max_workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='stage')
+        self._futures = {}
+        self.start_datetimes = {}
+        self.end_datetimes = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 실패 시에도 이미 실행 중인 단계(예: 화자 분리)는 중단할 수 없으므로 끝날 때까지 기다려 다음 작업과 겹치지 않게 하고, 시작 전인 단계만 취소
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        return False
+
+    def submit(self, stage, func, *args, **kwargs):
+        def run():
+            self.start_datetimes[stage] = timezone.now()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.end_datetimes[stage] = timezone.now()
+                logger.info(f"{stage} 단계 종료 ({(self.end_datetimes[stage] - self.start_datetimes[stage]).total_seconds():.1f}초)")
+
+        self._futures[stage] = self._executor.submit(run)
+
+    def is_done(self, stage):
+        return self._futures[stage].done()
+
+    def join(self, stage):
+        return self._futures.pop(stage).result()
+
+
+class ChunkedTranscriber:
+    # 음성을 무음 구간에서 나누어 프로세스 풀에서 음성 인식과 정렬을 수행하고, 시간 정보를 보정하여 하나의 결과로 합침
+    # 프로세스마다 int8 모델 복제본을 적재하며, 코어를 프로세스 수로 나누어 사용
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.threads = max(1, (os.cpu_count() or workers) // workers)
+
+    def run(self, audio: np.ndarray) -> dict:
+        boundaries = MediaUtils.find_silence_boundaries(audio, settings.TRANSCRIPTION_CHUNK_SECOND)
+        chunks = [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+        logger.info(f"분할 병렬 음성 인식: {len(chunks)}개 구간, {self.workers}개 프로세스 x {self.threads}개 스레드")
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks)), mp_context=context,
+                                 initializer=_init_chunk_worker, initargs=(self.threads,)) as executor:
+            # 언어는 첫 구간에서 한 번만 감지하여 모든 구간에 같은 언어를 적용
+            language_code = executor.submit(_detect_chunk_language, self._pack(audio, *chunks[0])).result() or 'ko'
+
+            futures = [executor.submit(_transcribe_and_align_chunk, self._pack(audio, start, end), language_code) for start, end in chunks]
+            results = [future.result() for future in futures]
+
+        return self.merge(chunks, language_code, results)
+
+    @staticmethod
+    def merge(chunks: list[tuple[int, int]], language_code: str, results: list[tuple[dict, dict]]) -> dict:
+        # 구간별 결과의 시간 정보를 구간 시작 위치만큼 보정하여 합침
+        # whisperx는 word_segments를 segments의 words와 같은 객체로 만들므로, 보정한 segments의 words로 word_segments를 다시 만듦
+        segments = []
+        aligned_segments = []
+        for (start, _), (transcribed, aligned) in zip(chunks, results):
+            offset = start / SAMPLE_RATE
+            segments.extend(ChunkedTranscriber._shift(s, offset) for s in transcribed['segments'])
+            aligned_segments.extend(ChunkedTranscriber._shift(s, offset) for s in aligned.get('segments', []))
+
+        word_segments = [w for s in aligned_segments for w in s.get('words', [])]
+
+        return {
+            'language_code': language_code,
+            'segments': segments,
+            'aligned': {'segments': aligned_segments, 'word_segments': word_segments},
+        }
+
+    @staticmethod
+    def _pack(audio: np.ndarray, start: int, end: int):
+        # 메모리 맵은 경로와 구간만 전달하여 구간 데이터를 복사하지 않음
+        if isinstance(audio, np.memmap):
+            return {'path': audio.filename, 'start': start, 'end': end}
+        return {'array': np.ascontiguousarray(audio[start:end])}
+
+    @staticmethod
+    def _shift(item: dict, offset: float) -> dict:
+        for key in ('start', 'end'):
+            if item.get(key) is not None:
+                item[key] = item[key] + offset
+        for child_key in ('words', 'chars'):
+            for child in item.get(child_key, []) or []:
+                ChunkedTranscriber._shift(child, offset)
+        return item
+
+
+def _init_chunk_worker(threads: int):
+    ModelHolder._THREAD_COUNT = threads
+    torch.set_num_threads(threads)
+
+
+def _unpack_chunk(chunk: dict) -> np.ndarray:
+    if 'path' in chunk:
+        return np.array(np.memmap(chunk['path'], dtype=np.float32, mode='r')[chunk['start']:chunk['end']])
+    return chunk['array']
+
+
+def _detect_chunk_language(chunk: dict):
+    return ModelHolder.get_model().detect_language(_unpack_chunk(chunk))
+
+
+def _transcribe_and_align_chunk(chunk: dict, language_code: str):
+    audio = _unpack_chunk(chunk)
+    model = ModelHolder.get_model()
+    transcribed = model.transcribe(audio, batch_size=ModelHolder.get_thread_count(), language=language_code)
+
+    align_model, metadata = ModelHolder.get_align_model(language_code)
+    aligned = whisperx.align(transcribed['segments'], align_model, metadata, audio, ModelHolder.get_device())
+
+    return transcribed, aligned
+
+
 class ModelHolder:
-    _MODEL = None
     _MODEL_NAME = 'Faster Whisper'
     _MODEL_SIZE = 'medium'  # base, small, large-v2
-    _ALIGN_MODEL = None
     _ALIGN_MODEL_NAME = 'Wav2Vec2'
-    _DIARIZATION_PIPELINE = None
     _DIARIZATION_MODEL_NAME = 'pyannote/speaker-diarization-3.1'
     _DEVICE = None
+    _THREAD_COUNT = None
 
     @staticmethod
     def get_model():
-        if ModelHolder._MODEL is None:
-            device = ModelHolder.get_device()
-            threads = ModelHolder.get_thread_count()
+        return ModelCache.get(('speech_recognition', ModelHolder._MODEL_SIZE), ModelHolder._load_model, ModelHolder.get_device())
+
+    @staticmethod
+    def _load_model():
+        device = ModelHolder.get_device()
+        threads = ModelHolder.get_thread_count()
 
-            ModelHolder._MODEL = whisperx.load_model(ModelHolder._MODEL_SIZE,
-                                                     device=device,
-                                                     compute_type="float16" if device == "cuda" else "int8",
-                                                     threads=threads,
-                                                     )
-        return ModelHolder._MODEL
+        return whisperx.load_model(ModelHolder._MODEL_SIZE,
+                                   device=device,
+                                   compute_type="float16" if device == "cuda" else "int8",
+                                   threads=threads,
+                                   )
 
     @staticmethod
     def get_model_name():
@@ -63,6 +241,11 @@ class ModelHolder:
 
     @staticmethod
     def get_align_model(language_code):
+        # 언어별 정렬 모델을 캐시하여 같은 언어의 연속된 작업은 모델을 다시 읽지 않음
+        return ModelCache.get(('alignment', language_code), lambda: ModelHolder._load_align_model(language_code), ModelHolder.get_device())
+
+    @staticmethod
+    def _load_align_model(language_code):
         align_model, metadata = whisperx.load_align_model(
             language_code=language_code, device=ModelHolder.get_device()
         )
@@ -74,17 +257,23 @@ class ModelHolder:
 
     @staticmethod
     def get_diarization_pipeline():
-        if ModelHolder._DIARIZATION_PIPELINE is None:
-            token = ModelHolder.get_hf_token()
+        return ModelCache.get(('diarization', ModelHolder._DIARIZATION_MODEL_NAME), ModelHolder._load_diarization_pipeline, ModelHolder.get_device())
+
+    @staticmethod
+    def _load_diarization_pipeline():
+        token = ModelHolder.get_hf_token()
 
-            from whisperx.diarize import DiarizationPipeline
+        from whisperx.diarize import DiarizationPipeline
 
-            ModelHolder._DIARIZATION_PIPELINE = DiarizationPipeline(
-                use_auth_token=token,
-                device=ModelHolder.get_device()
-            )
+        return DiarizationPipeline(
+            model_name=ModelHolder._DIARIZATION_MODEL_NAME,
+            use_auth_token=token,
+            device=ModelHolder.get_device()
+        )
 
-        return ModelHolder._DIARIZATION_PIPELINE
+    @staticmethod
+    def get_cache_stats():
+        return ModelCache.get_stats()
 
     @staticmethod
     def get_diarization_model_name():
@@ -111,6 +300,8 @@ class ModelHolder:
 
     @staticmethod
     def get_thread_count():
+        if ModelHolder._THREAD_COUNT is not None:
+            return ModelHolder._THREAD_COUNT
         if ModelHolder.get_device() == "cuda":
             return 16
         return 4
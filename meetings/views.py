@@ -1,6 +1,7 @@
+import hashlib
+import json
 import logging
 import os
-import subprocess
 import traceback
 import uuid
 from urllib.parse import quote
@@ -10,11 +11,10 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import Group
-from django.core.files.base import ContentFile
 from django.core.paginator import Paginator
 from django.db import transaction
 from django.db.models import Q, Exists, Count, Subquery, OuterRef
-from django.http import HttpResponse
+from django.http import HttpResponse, FileResponse
 from django.http import JsonResponse, HttpResponseForbidden
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
@@ -28,7 +28,8 @@ from common.decorators import json_login_required
 from common.mixins import JsonLoginRequiredMixin
 from common.utils import RequestUtils, ResponseUtils
 from meetings.forms import MeetingForm
-from meetings.models import Meeting, Attendee, MeetingTypeCode, Recording, Segment, SpeechRecognition, Summarization, Word
+from meetings.models import Meeting, Attendee, MeetingTypeCode, Recording, Segment, SpeechRecognition, Summarization, Word, RecordingUpload, RecordingUploadStatusCode, \
+    RecordingConversionStatusCode, get_recording_upload_path
 from reservations.models import Reservation
 
 logger = logging.getLogger(__name__)
@@ -62,16 +63,26 @@ def meetings(request):
     if word:
         if word_search_type == 'similar':
             word_like = Q(word__trigram_similar=word) | Q(corrected_word__trigram_similar=word)
+            text_like = Q(text__trigram_word_similar=word) | Q(corrected_text__trigram_word_similar=word)
         elif word_search_type == 'case-insensitive':
             word_like = Q(word__icontains=word) | Q(corrected_word__icontains=word)
+            text_like = Q(text__icontains=word) | Q(corrected_text__icontains=word)
         else:
             word_like = Q(word__contains=word) | Q(corrected_word__contains=word)
+            text_like = Q(text__contains=word) | Q(corrected_text__contains=word)
 
+        # 단어를 부분에 묶어 저장(WORD_STORAGE_MODE=packed)한 전사는 Word 행이 없으므로 부분 문자로 검색
         q &= Exists(
             Word.objects.filter(
                 word_like,
                 segment__speech_recognition__recording__meeting_id=OuterRef('pk')
             )
+        ) | Exists(
+            Segment.objects.filter(
+                text_like,
+                words__isnull=False,
+                speech_recognition__recording__meeting_id=OuterRef('pk')
+            )
         )
 
     active_meetings = \
@@ -291,6 +302,7 @@ class RecordingUploadView(JsonLoginRequiredMixin, View):
             'meeting': meeting,
             'content_type': file.content_type or '',
             'upload_file_name': original_file_name_with_ext,
+            'content_hash': getattr(request, 'upload_content_hashes', {}).get('file'),
             'created_user': request.user,
             'last_modified_user': request.user,
         }
@@ -309,61 +321,16 @@ class RecordingUploadView(JsonLoginRequiredMixin, View):
             recording_fields['upload_file'] = file
             recording_fields['upload_file_size'] = file.size
 
-            temp_input_path = None
-            temp_output_path = None
-
-            try:
-                temp_input_path = os.path.join(settings.MEDIA_ROOT, 'temp', upload_file_name)
-                temp_output_path = os.path.join(settings.MEDIA_ROOT, 'temp', webm_file_name)
-                os.makedirs(os.path.dirname(temp_input_path), exist_ok=True)
-
-                with open(temp_input_path, 'wb') as temp_file:
-                    for chunk in file.chunks():
-                        temp_file.write(chunk)
-
-                command = [
-                    'ffmpeg',
-                    '-i', temp_input_path,  # -i: 입력 파일
-                    '-c:a', 'libopus',  # -c:a: 오디오 코덱 (Opus는 WebM에서 효율적이며 품질이 좋음)
-                    '-b:a', '128k',  # -b:a: 오디오 비트레이트 (예: 128k)
-                    '-vn',  # -vn: 비디오 트랙 제거 (오디오 파일이므로)
-                    '-y',  # 덮어쓰기 허용
-                    '-f', 'webm',
-                    '-cluster_size_limit', '0',  # 클러스터 크기 제한 해제 (더 작은 클러스터 생성 유도)
-                    # '-chunk_limit', '500000',  # 클러스터 당 최대 청크 크기 제한 (더 잦은 Cues 생성 유도)
-                    '-fflags', '+genpts',  # 타임스탬프 생성을 강제
-                    '-movflags', 'faststart',  # 스트리밍 및 시킹 최적화 (메타데이터를 파일 시작으로 이동)
-                    temp_output_path
-                ]
-                subprocess.run(command, check=True, capture_output=True)
-
-                with open(temp_output_path, 'rb') as converted_file:
-                    converted_data = converted_file.read()
-
-                webm_content = ContentFile(converted_data)
-                webm_content.name = webm_file_name
-
-                recording_fields['webm_file'] = webm_content
-                recording_fields['webm_file_size'] = len(converted_data)
-
-                logger.info(f"Successfully converted {file.name} to WebM.")
-            except subprocess.CalledProcessError as e:
-                logger.error(f"FFmpeg conversion failed: {e.stderr.decode()}")
-                return JsonResponse({'status': 'error', 'message': '😱 파일 변환에 실패했어요.'}, status=500)
-            except Exception as e:
-                logger.error(f"File conversion failed: {e}")
-                return JsonResponse({'status': 'error', 'message': '😱 파일 변환 중 시스템 예외가 발생했어요.'}, status=500)
-            finally:
-                if temp_input_path and os.path.exists(temp_input_path):
-                    os.remove(temp_input_path)
-                if temp_output_path and os.path.exists(temp_output_path):
-                    os.remove(temp_output_path)
+            # 변환은 백그라운드 작업으로 처리하고 변환 중 상태로 바로 응답
+            recording_fields['conversion_status_code'] = RecordingConversionStatusCode.CONVERTING
 
         else:
             return JsonResponse({'status': 'error', 'message': '⛔️ 유효한 파일을 업로드해 주세요.'}, status=400)
 
         with transaction.atomic():
             recording = Recording.objects.create(**recording_fields)
+            if recording.is_converting():
+                recording.start_conversion_task(request.user)
 
         download_url = reverse('download_recording', args=[meeting_id, recording.pk])
 
@@ -371,10 +338,204 @@ class RecordingUploadView(JsonLoginRequiredMixin, View):
             'status': 'success',
             'id': recording.pk,
             'play_millisecond': recording.play_millisecond,  # 실제 재생 시간 추출 로직 필요
+            'conversion_status': recording.conversion_status_code,
             'download_url': request.build_absolute_uri(download_url) if download_url else None,
         })
 
 
+class RecordingResumableUploadView(JsonLoginRequiredMixin, View):
+    # 조각 업로드 시작: 파일 정보를 등록하고 업로드 키를 발급
+    def post(self, request, meeting_id):
+        meeting = get_object_or_404(Meeting, pk=meeting_id)
+
+        if not meeting.can_edit(request.user):
+            return JsonResponse({'status': 'error', 'message': '⛔️ 업로드 권한이 없어요.\n(리더, 작성자, 참석자만 업로드할 수 있어요.'}, status=403)
+
+        file_name = request.POST.get('file_name', '')
+        content_type = request.POST.get('content_type', '')
+        source_type = request.POST.get('source_type', 'unknown')
+        try:
+            file_size = int(request.POST.get('file_size', ''))
+        except ValueError:
+            return JsonResponse({'status': 'error', 'message': '⛔️ 파일 크기를 확인할 수 없어요.'}, status=400)
+
+        _, file_ext = os.path.splitext(file_name)
+        file_ext = file_ext.lower()
+        is_webm_file = (file_ext == '.webm' or content_type == 'audio/webm')
+        if not is_webm_file and not (source_type == 'upload_file' and file_ext in REQUIRES_CONVERSION_EXTENSIONS):
+            return JsonResponse({'status': 'error', 'message': '⛔️ 유효한 파일을 업로드해 주세요.'}, status=400)
+        if file_size <= 0 or file_size > settings.RECORDING_UPLOAD_MAX_BYTES:
+            return JsonResponse({'status': 'error', 'message': f"⛔️ {settings.RECORDING_UPLOAD_MAX_BYTES // 1024 // 1024}MB 이하의 파일을 업로드해 주세요."}, status=400)
+
+        self._delete_expired_uploads()
+
+        upload_key = uuid.uuid4().hex
+        with transaction.atomic():
+            upload = RecordingUpload.objects.create(
+                upload_key=upload_key,
+                file_name=file_name,
+                content_type=content_type,
+                source_type=source_type,
+                file_size=file_size,
+                upload_status_code=RecordingUploadStatusCode.UPLOADING,
+                meeting=meeting,
+                created_user=request.user,
+                last_modified_user=request.user,
+            )
+
+        file_path = upload.get_file_path()
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        open(file_path, 'wb').close()
+
+        return JsonResponse({
+            'status': 'success',
+            'upload_key': upload_key,
+            'offset': 0,
+            'chunk_size': settings.RECORDING_UPLOAD_CHUNK_BYTES,
+        })
+
+    @staticmethod
+    def _delete_expired_uploads():
+        for upload in RecordingUpload.find_expired():
+            file_path = upload.get_file_path()
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            upload.delete()
+
+
+class RecordingUploadChunkView(JsonLoginRequiredMixin, View):
+    # GET(HEAD): 현재까지 받은 위치(Upload-Offset) 조회
+    # PUT: Upload-Offset 위치에 조각을 이어 씀, Upload-Checksum(sha256 <hex>) 헤더가 있으면 조각을 검증하고 불일치하면 되돌림
+    def get(self, request, meeting_id, upload_key):
+        upload = RecordingUpload.objects.filter(upload_key=upload_key, meeting_id=meeting_id, created_user=request.user).first()
+        if upload is None:
+            return JsonResponse({'status': 'error', 'message': '😱 업로드 정보를 확인할 수 없어요.'}, status=404)
+
+        response = JsonResponse({'status': upload.upload_status_code, 'offset': upload.received_size, 'file_size': upload.file_size})
+        response['Upload-Offset'] = upload.received_size
+        return response
+
+    def put(self, request, meeting_id, upload_key):
+        try:
+            offset = int(request.headers.get('Upload-Offset', ''))
+            length = int(request.headers.get('Content-Length') or 0)
+        except ValueError:
+            return JsonResponse({'status': 'error', 'message': '⛔️ 업로드 위치를 확인할 수 없어요.'}, status=400)
+
+        if length > settings.RECORDING_UPLOAD_CHUNK_BYTES:
+            return JsonResponse({'status': 'error', 'message': '⛔️ 조각 크기가 너무 커요.'}, status=413)
+
+        with transaction.atomic():
+            try:
+                upload = RecordingUpload.find_by_upload_key_for_update(upload_key, meeting_id)
+            except RecordingUpload.DoesNotExist:
+                return JsonResponse({'status': 'error', 'message': '😱 업로드 정보를 확인할 수 없어요.'}, status=404)
+
+            if upload.created_user_id != request.user.id:
+                return JsonResponse({'status': 'error', 'message': '⛔️ 업로드 권한이 없어요.'}, status=403)
+            if not upload.is_uploading():
+                return JsonResponse({'status': 'error', 'message': '⛔️ 이미 완료된 업로드에요.'}, status=409)
+            if offset != upload.received_size:
+                # 이전 조각의 응답을 받지 못해 재전송한 경우 등은 서버가 받은 위치부터 다시 보내도록 안내
+                response = JsonResponse({'status': 'error', 'message': '⛔️ 업로드 위치가 맞지 않아요.', 'offset': upload.received_size}, status=409)
+                response['Upload-Offset'] = upload.received_size
+                return response
+            if offset + length > upload.file_size:
+                return JsonResponse({'status': 'error', 'message': '⛔️ 파일 크기를 초과했어요.'}, status=400)
+
+            digest = hashlib.sha256()
+            written_size = 0
+            with open(upload.get_file_path(), 'r+b') as f:
+                # 이전에 중단된 조각이 남긴 데이터를 버리고 확정된 위치부터 씀
+                f.seek(offset)
+                f.truncate()
+                while data := request.read(64 * 1024):
+                    f.write(data)
+                    digest.update(data)
+                    written_size += len(data)
+
+                checksum = request.headers.get('Upload-Checksum')
+                if checksum and checksum != f"sha256 {digest.hexdigest()}":
+                    f.truncate(offset)
+                    return JsonResponse({'status': 'error', 'message': '😱 조각이 손상되었어요. 다시 전송해 주세요.', 'offset': offset, 'retry': True}, status=400)
+
+            upload.receive(written_size, request.user)
+
+        response = JsonResponse({'status': 'success', 'offset': upload.received_size})
+        response['Upload-Offset'] = upload.received_size
+        return response
+
+
+class RecordingUploadCompleteView(JsonLoginRequiredMixin, View):
+    # 조각 업로드 완료: 받은 파일을 녹음 저장 위치로 옮기고(필요하면 webm으로 변환) 녹음을 생성
+    def post(self, request, meeting_id, upload_key):
+        with transaction.atomic():
+            try:
+                upload = RecordingUpload.find_by_upload_key_for_update(upload_key, meeting_id)
+            except RecordingUpload.DoesNotExist:
+                return JsonResponse({'status': 'error', 'message': '😱 업로드 정보를 확인할 수 없어요.'}, status=404)
+
+            if upload.created_user_id != request.user.id:
+                return JsonResponse({'status': 'error', 'message': '⛔️ 업로드 권한이 없어요.'}, status=403)
+
+            if upload.is_uploading():
+                if not upload.is_received():
+                    return JsonResponse({'status': 'error', 'message': '⛔️ 아직 업로드가 끝나지 않았어요.', 'offset': upload.received_size}, status=409)
+
+                recording = self._create_recording(upload, request.user)
+                recording.start_content_hash_task()
+                if recording.is_converting():
+                    recording.start_conversion_task(request.user)
+
+                upload.complete(recording, request.user)
+
+        recording = upload.recording
+        download_url = reverse('download_recording', args=[meeting_id, recording.pk])
+
+        return JsonResponse({
+            'status': 'success',
+            'id': recording.pk,
+            'play_millisecond': recording.play_millisecond,
+            'conversion_status': recording.conversion_status_code,
+            'download_url': request.build_absolute_uri(download_url),
+        })
+
+    @staticmethod
+    def _create_recording(upload: RecordingUpload, user):
+        file_path = upload.get_file_path()
+        _, file_ext = os.path.splitext(upload.file_name)
+        file_ext = file_ext.lower()
+
+        recording_fields = {
+            'meeting': upload.meeting,
+            'content_type': upload.content_type,
+            'upload_file_name': upload.file_name,
+            'created_user': user,
+            'last_modified_user': user,
+        }
+
+        # 받은 파일은 메모리로 읽지 않고 녹음 저장 위치로 옮기고, 변환이 필요한 파일은 백그라운드 작업으로 변환
+        if file_ext == '.webm' or upload.content_type == 'audio/webm':
+            webm_file_name = get_recording_upload_path(None, f"{upload.upload_key}.webm")
+            webm_file_path = os.path.join(settings.MEDIA_ROOT, webm_file_name)
+            os.makedirs(os.path.dirname(webm_file_path), exist_ok=True)
+            os.replace(file_path, webm_file_path)
+
+            recording_fields['webm_file'] = webm_file_name
+            recording_fields['webm_file_size'] = upload.file_size
+        else:
+            upload_file_name = get_recording_upload_path(None, f"{upload.upload_key}{file_ext}")
+            upload_file_path = os.path.join(settings.MEDIA_ROOT, upload_file_name)
+            os.makedirs(os.path.dirname(upload_file_path), exist_ok=True)
+            os.replace(file_path, upload_file_path)
+
+            recording_fields['upload_file'] = upload_file_name
+            recording_fields['upload_file_size'] = upload.file_size
+            recording_fields['conversion_status_code'] = RecordingConversionStatusCode.CONVERTING
+
+        return Recording.objects.create(**recording_fields)
+
+
 @require_GET
 @json_login_required
 def download_sample(request, filename):
@@ -460,6 +621,38 @@ class RecordingDownloadView(JsonLoginRequiredMixin, View):
         )
 
 
+class RecordingWaveformView(JsonLoginRequiredMixin, View):
+    # 파형 피크 파일은 녹음마다 한 번 만들어지고 바뀌지 않으므로 ETag로 검증하고 브라우저에 캐시
+    def get(self, request, meeting_id, recording_id):
+        try:
+            recording = Recording.objects.select_related('meeting').get(pk=recording_id, meeting_id=meeting_id)
+        except Recording.DoesNotExist:
+            return HttpResponse('🚫 녹음 정보를 찾을 수 없어요.', status=400)
+
+        if not recording.meeting.can_view(request.user):
+            return HttpResponseForbidden("⛔️ 접근 권한이 없어요.")
+
+        if not recording.peaks_file or not os.path.exists(recording.peaks_file.path):
+            return JsonResponse({'status': 'waiting', 'message': '🛠️ 파형을 준비하고 있어요.'}, status=404)
+
+        stat = os.stat(recording.peaks_file.path)
+        etag = f'"{recording.pk}-{int(stat.st_mtime)}-{stat.st_size}"'
+
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponse(status=304)
+        elif not settings.DEBUG:
+            response = HttpResponse()
+            response['X-Accel-Redirect'] = recording.peaks_file.url  # nginx 사용
+        else:
+            response = FileResponse(open(recording.peaks_file.path, 'rb'))
+            response['Content-Length'] = stat.st_size
+
+        response['Content-Type'] = 'application/octet-stream'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, max-age=86400'
+        return response
+
+
 class RecordingView(JsonLoginRequiredMixin, View):
     def get(self, request, meeting_id, recording_id):
         try:
@@ -469,7 +662,7 @@ class RecordingView(JsonLoginRequiredMixin, View):
 
             segment_queryset = (Segment.objects
                                 .select_related('speaker')
-                                .only('id', 'speaker__user', 'speaker__speaker_label', 'start_millisecond', 'end_millisecond', 'text', 'corrected_text')
+                                .only('id', 'speaker__user', 'speaker__speaker_label', 'start_millisecond', 'end_millisecond', 'text', 'corrected_text', 'is_provisional')
                                 .filter(speech_recognition=speech_recognition)
                                 .all()
                                 .order_by('start_millisecond'))
@@ -484,6 +677,7 @@ class RecordingView(JsonLoginRequiredMixin, View):
                     'end': segment.end_millisecond,
                     'text': segment.text,
                     'corrected_text': segment.corrected_text,
+                    'is_provisional': segment.is_provisional,
                 })
 
             return JsonResponse({
@@ -513,9 +707,35 @@ class RecordingView(JsonLoginRequiredMixin, View):
             if not recording.is_active:
                 raise Recording.DoesNotExist()
 
+            if recording.is_live:
+                return JsonResponse({'status': 'error', 'message': '🎙️ 녹음 중이에요. 녹음을 종료한 뒤 전사 작업을 요청해 주세요.'}, status=409)
+
+            if recording.is_converting():
+                return JsonResponse({'status': 'converting', 'message': '🛠️ 녹음 파일을 변환하고 있어요. 변환이 끝나면 전사 작업을 시작할게요.'})
+
+            if recording.is_failed_conversion():
+                return JsonResponse({'status': 'error', 'message': '😱 녹음 파일 변환에 실패했어요. 파일을 다시 업로드해 주세요.'}, status=400)
+
             if recording.can_speech_recognition_task():
+                # 요청 본문에 화자 수({"min_speaker_count": 2, "max_speaker_count": 5})가 있으면 화자 분리에 사용
+                if request.body:
+                    speaker_count = self._parse_speaker_count(request.body)
+                    if speaker_count is None:
+                        return JsonResponse({'status': 'error', 'message': '⛔️ 화자 수를 확인해 주세요.'}, status=400)
+
+                    with transaction.atomic():
+                        recording.save_speaker_count(*speaker_count, user)
+
                 recording.start_speech_recognition_task(user)
 
+                if recording.is_completed_speech_recognition():
+                    summarization = recording.latest_summarization
+                    return JsonResponse({
+                        'status': summarization.task_status_code,
+                        'task_id': summarization.task_id,
+                        'message': f'♻️ 같은 녹음의 전사 결과를 재사용했어요. 교정·요약 작업을 시작했어요. 예상 소요 시간: 약 {summarization.get_estimated_minute()}분'
+                    })
+
                 return JsonResponse({
                     'status': recording.latest_speech_recognition.task_status_code,
                     'task_id': recording.latest_speech_recognition.task_id,
@@ -559,6 +779,23 @@ class RecordingView(JsonLoginRequiredMixin, View):
             logger.error(f"음성 텍스트 변환 중 예외 발생: {e}")
             return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
 
+    @staticmethod
+    def _parse_speaker_count(body) -> tuple[int | None, int | None] | None:
+        try:
+            data = json.loads(body)
+            min_speaker_count = data.get('min_speaker_count')
+            max_speaker_count = data.get('max_speaker_count')
+        except (ValueError, AttributeError):
+            return None
+
+        for count in (min_speaker_count, max_speaker_count):
+            if count is not None and (not isinstance(count, int) or isinstance(count, bool) or not 1 <= count <= settings.DIARIZATION_MAX_SPEAKER_COUNT):
+                return None
+        if min_speaker_count is not None and max_speaker_count is not None and min_speaker_count > max_speaker_count:
+            return None
+
+        return min_speaker_count, max_speaker_count
+
 
 class RecordingTaskView(JsonLoginRequiredMixin, View):
     def get(self, request, meeting_id, recording_id, task_id):
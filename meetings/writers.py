@@ -0,0 +1,273 @@
+import logging
+import time
+from types import SimpleNamespace
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from config import settings
+from .models import Speaker, Segment, Word, WORD_STORAGE_MODE_PACKED
+
+logger = logging.getLogger(__name__)
+UNKNOWN_SPEAKER_LABEL = 'UNKNOWN'
+SENTENCE_END_CHARACTERS = ('.', '?', '!', '요')  # 한국어 구어체 특성상 문장 종결을 나타내는 문자
+
+
+class SpeechRecognitionWriter:
+    # 음성 인식 결과(화자, 부분, 단어)를 적은 왕복 횟수로 저장, 화자는 한 문장으로 upsert
+    # PostgreSQL: stage()에서 부분·단어를 인덱스 없는 UNLOGGED 임시 테이블에 COPY로 적재하고,
+    #             publish()에서 INSERT ... SELECT로 한 번에 반영하여 긴 트랜잭션 없이 결과 전체가 한 번에 보이도록 함
+    # 그 외 또는 WORD_STORAGE_MODE=packed: publish()에서 bulk_create로 저장(packed는 단어를 부분에 배열로 묶어 저장)
+    # publish()는 호출하는 쪽의 트랜잭션 안에서 실행
+    SEGMENT_STAGING_TABLE = 'meetings_segment_staging'
+    WORD_STAGING_TABLE = 'meetings_word_staging'
+    BASE_COLUMNS = ('created_user_id', 'created_date', 'last_modified_user_id', 'last_modified_date')
+    SEGMENT_COLUMNS = ('id', 'text', 'start_millisecond', 'end_millisecond', 'speech_recognition_id', 'speaker_id') + BASE_COLUMNS
+    WORD_COLUMNS = ('word', 'score', 'start_millisecond', 'end_millisecond', 'segment_id', 'speaker_id') + BASE_COLUMNS
+
+    def __init__(self, speech_recognition, user):
+        self.speech_recognition = speech_recognition
+        self.recording = speech_recognition.recording
+        self.user = user
+        self.is_packed_words = settings.WORD_STORAGE_MODE == WORD_STORAGE_MODE_PACKED
+        self.is_staging = connection.vendor == 'postgresql' and not self.is_packed_words
+        self.merged_segments = None
+        self.speaker_map = None
+        self.segment_count = 0
+        self.word_count = 0
+
+    def stage(self, segments_data: list[dict]):
+        start = time.perf_counter()
+
+        self.merged_segments = self.merge_segments(segments_data)
+        # 화자는 적고 이미 있는 화자는 변경하지 않으므로 발행 전에 등록
+        self.speaker_map = Speaker.upsert_all(self.recording.meeting, {s['speaker'] for s in self.merged_segments}, self.recording, self.user)
+
+        if self.is_staging:
+            with transaction.atomic():
+                self._clear_staging()
+                self._stage_rows()
+
+        logger.info(f"전사 결과 적재: SpeechRecognition #{self.speech_recognition.pk} 화자 {len(self.speaker_map)}명 ({time.perf_counter() - start:.2f}초)")
+
+    def publish(self):
+        start = time.perf_counter()
+
+        if self.is_staging:
+            self._publish_staging()
+        else:
+            self._write()
+
+        logger.info(f"전사 결과 저장: SpeechRecognition #{self.speech_recognition.pk} 부분 {self.segment_count}개, 단어 {self.word_count}개 "
+                    f"({time.perf_counter() - start:.2f}초)")
+
+    @staticmethod
+    def merge_segments(segments_data: list[dict]) -> list[dict]:
+        # 같은 화자의 연속된 부분을 합침, 문자열은 조각 목록으로 모아 한 번에 join
+        merged_segments = []
+        current = None
+        texts = []
+
+        for segment_data in segments_data:
+            speaker = segment_data.get('speaker') or UNKNOWN_SPEAKER_LABEL
+            text = segment_data['text']
+
+            if current is not None and current['speaker'] == speaker:
+                previous_text = texts[-1].strip()
+                texts.append("\n" if previous_text and previous_text[-1] in SENTENCE_END_CHARACTERS else " ")
+                texts.append(text)
+                current['end'] = segment_data.get('end')
+                current['words'].extend(segment_data.get('words', []))
+                continue
+
+            if current is not None:
+                current['text'] = ''.join(texts).strip()
+                merged_segments.append(current)
+
+            current = {
+                'speaker': speaker,
+                'start': segment_data.get('start'),
+                'end': segment_data.get('end'),
+                'words': list(segment_data.get('words', [])),
+            }
+            texts = [text]
+
+        if current is not None:
+            current['text'] = ''.join(texts).strip()
+            merged_segments.append(current)
+
+        return merged_segments
+
+    def _write(self):
+        segments = Segment.objects.bulk_create([self._build_segment(segment_data) for segment_data in self.merged_segments])
+        self.segment_count = len(segments)
+
+        if self.is_packed_words:
+            self.word_count = sum(len(segment_data['words']) for segment_data in self.merged_segments)
+            return
+
+        now = timezone.now()
+        words = Word.objects.bulk_create(
+            (Word(**dict(zip(self.WORD_COLUMNS, row))) for row in self._word_rows(zip(self.merged_segments, segments), now)),
+            batch_size=5000
+        )
+        self.word_count = len(words)
+
+    def _build_segment(self, segment_data: dict) -> Segment:
+        segment = Segment(
+            text=segment_data['text'],
+            start_millisecond=self._to_millisecond(segment_data.get('start')),
+            end_millisecond=self._to_millisecond(segment_data.get('end')),
+            speech_recognition=self.speech_recognition,
+            speaker=self.speaker_map[segment_data['speaker']],
+            created_user=self.user,
+            last_modified_user=self.user,
+        )
+        if self.is_packed_words:
+            segment.pack_words(segment_data['words'])
+
+        return segment
+
+    def _stage_rows(self):
+        now = timezone.now()
+
+        # 단어가 부분 id를 참조하므로 부분 id를 시퀀스에서 미리 할당
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                           [Segment._meta.db_table, len(self.merged_segments)])
+            segment_ids = [row[0] for row in cursor.fetchall()]
+
+        segments = [
+            SimpleNamespace(pk=segment_id, speaker_id=self.speaker_map[segment_data['speaker']].pk)
+            for segment_id, segment_data in zip(segment_ids, self.merged_segments)
+        ]
+
+        self.segment_count = copy_rows(self.SEGMENT_STAGING_TABLE, self.SEGMENT_COLUMNS, (
+            (segment.pk, segment_data['text'], self._to_millisecond(segment_data.get('start')), self._to_millisecond(segment_data.get('end')),
+             self.speech_recognition.pk, segment.speaker_id, self.user.pk, now, self.user.pk, now)
+            for segment_data, segment in zip(self.merged_segments, segments)
+        ))
+        self.word_count = copy_rows(self.WORD_STAGING_TABLE, self.WORD_COLUMNS + ('speech_recognition_id',), (
+            row + (self.speech_recognition.pk,) for row in self._word_rows(zip(self.merged_segments, segments), now)
+        ))
+
+    def _publish_staging(self):
+        segment_columns = ', '.join(self.SEGMENT_COLUMNS)
+        word_columns = ', '.join(self.WORD_COLUMNS)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {Segment._meta.db_table} ({segment_columns}, is_provisional) "
+                           f"SELECT {segment_columns}, false FROM {self.SEGMENT_STAGING_TABLE} WHERE speech_recognition_id = %s ORDER BY id",
+                           [self.speech_recognition.pk])
+            cursor.execute(f"INSERT INTO {Word._meta.db_table} ({word_columns}, is_correction_removed) "
+                           f"SELECT {word_columns}, false FROM {self.WORD_STAGING_TABLE} WHERE speech_recognition_id = %s",
+                           [self.speech_recognition.pk])
+
+        self._clear_staging()
+
+    def _clear_staging(self):
+        # 이전 작업이 적재만 하고 중단된 경우 남은 행도 함께 삭제
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.WORD_STAGING_TABLE} WHERE speech_recognition_id = %s", [self.speech_recognition.pk])
+            cursor.execute(f"DELETE FROM {self.SEGMENT_STAGING_TABLE} WHERE speech_recognition_id = %s", [self.speech_recognition.pk])
+
+    def _word_rows(self, segments, now):
+        return (
+            (word_data['word'], word_data.get('score', 0.0), self._to_millisecond(word_data.get('start')), self._to_millisecond(word_data.get('end')),
+             segment.pk, segment.speaker_id, self.user.pk, now, self.user.pk, now)
+            for segment_data, segment in segments
+            for word_data in segment_data['words']
+        )
+
+    @staticmethod
+    def _to_millisecond(second):
+        return int(second * 1000) if second is not None else None
+
+
+class WordCorrectionWriter:
+    # 단어 교정 결과 (단어 id, 교정된 단어) 목록을 저장, 교정된 단어가 None이면 교정 과정에서 삭제된 단어
+    # PostgreSQL은 임시 테이블에 COPY로 적재한 뒤 UPDATE ... FROM 한 문장으로 반영(bulk_update의 CASE WHEN 문은 행이 많으면 느림)
+    # 호출하는 쪽의 트랜잭션 안에서 실행(임시 테이블은 커밋 시 삭제)
+    TEMP_TABLE = 'meetings_word_correction_temp'
+
+    def __init__(self, user):
+        self.user = user
+
+    def write(self, corrections: list[tuple[int, str | None]]) -> int:
+        if not corrections:
+            return 0
+
+        now = timezone.now()
+
+        if connection.vendor != 'postgresql':
+            Word.objects.bulk_update(
+                [Word(pk=word_id, corrected_word=corrected_word, is_correction_removed=corrected_word is None, last_modified_user=self.user,
+                      last_modified_date=now) for word_id, corrected_word in corrections],
+                ['corrected_word', 'is_correction_removed', 'last_modified_user', 'last_modified_date'],
+                batch_size=1000
+            )
+            return len(corrections)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {self.TEMP_TABLE} (id bigint PRIMARY KEY, corrected_word varchar(128) NULL, "
+                           f"is_correction_removed boolean NOT NULL) ON COMMIT DROP")
+            cursor.execute(f"TRUNCATE {self.TEMP_TABLE}")
+
+        count = copy_rows(self.TEMP_TABLE, ('id', 'corrected_word', 'is_correction_removed'), (
+            (word_id, corrected_word, corrected_word is None) for word_id, corrected_word in corrections
+        ))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"UPDATE {Word._meta.db_table} AS w SET corrected_word = t.corrected_word, is_correction_removed = t.is_correction_removed, "
+                           f"last_modified_user_id = %s, last_modified_date = %s FROM {self.TEMP_TABLE} AS t WHERE w.id = t.id",
+                           [self.user.pk, now])
+
+        return count
+
+
+def copy_rows(table: str, columns: tuple, rows) -> int:
+    # 행을 PostgreSQL COPY로 적재하고 적재한 행 수 반환
+    reader = _CopyReader(rows)
+    with connection.cursor() as cursor:
+        cursor.cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", reader)
+    return reader.row_count
+
+
+class _CopyReader:
+    # COPY FROM STDIN에 행을 CSV로 조금씩 만들어 전달하는 파일 객체(전체 데이터를 메모리에 만들지 않음)
+    # NULL은 따옴표 없는 빈 값, 그 외 값은 모두 따옴표로 감싸 빈 문자열과 구분
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.buffer = ''
+        self.row_count = 0
+
+    def read(self, size=-1):
+        lines = []
+        length = len(self.buffer)
+        while size < 0 or length < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            line = ','.join(self._format(value) for value in row) + '\n'
+            lines.append(line)
+            length += len(line)
+            self.row_count += 1
+
+        data = self.buffer + ''.join(lines)
+        if size < 0:
+            self.buffer = ''
+            return data
+        self.buffer = data[size:]
+        return data[:size]
+
+    readline = read
+
+    @staticmethod
+    def _format(value):
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            value = 't' if value else 'f'
+        elif hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        return '"' + str(value).replace('"', '""') + '"'
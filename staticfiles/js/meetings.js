@@ -1,5 +1,6 @@
 const meetings = function (options) {
     const MESSAGE_CONFIRM_TRANSCRIPT = '🛠️ 전사 및 교정·요약 작업을 시작할까요?'
+    const LIVE_RECORDING_TIMESLICE_MILLISECOND = 5000;
 
     let seconds = 0;
     let timerInterval = null;
@@ -9,6 +10,8 @@ const meetings = function (options) {
     let audioCtx = null;
     let mediaRecorder = null;
     let audioChunks = [];
+    let liveSocket = null;
+    let liveTranscript = null;
     let lastBlobUrl = null;
     let startPollingInterval = null;
     let isManualSeeking = false;
@@ -130,6 +133,8 @@ const meetings = function (options) {
         }
         audio.dataset.bound = 'true';
 
+        this.drawWaveform(audio);
+
         audio.addEventListener("canplay", () => {
             if (pendingSeekTime !== null) {
                 isManualSeeking = true;
@@ -247,11 +252,20 @@ const meetings = function (options) {
             mediaRecorder.ondataavailable = e => {
                 if (e.data && e.data.size > 0) {
                     audioChunks.push(e.data);
+                    if (liveSocket && liveSocket.readyState === WebSocket.OPEN) {
+                        liveSocket.send(e.data);
+                    }
                 }
             };
             mediaRecorder.onstop = this.stop;
 
-            mediaRecorder.start();
+            // 등록된 회의는 녹음 조각을 실시간으로 전송하여 녹음 중에 전사
+            liveSocket = this.options.meetingId !== null ? await this.connectLiveRecording() : null;
+            if (liveSocket) {
+                mediaRecorder.start(LIVE_RECORDING_TIMESLICE_MILLISECOND);
+            } else {
+                mediaRecorder.start();
+            }
             this.options.recordingStatus.classList.remove('visually-hidden');
             this.options.startRecodingButton.classList.add('d-none');
             this.options.stopRecodingButton.classList.remove('d-none');
@@ -264,12 +278,136 @@ const meetings = function (options) {
         }
     };
 
+    this.drawWaveform = async (audio) => {
+        // 서버에서 미리 계산한 파형 피크로 타임라인을 그리고, 클릭하면 해당 위치로 이동
+        const recordingId = audio.dataset.recording_id;
+        let buffer;
+        try {
+            const response = await fetch(`/meetings/${this.options.meetingId}/recordings/${recordingId}/waveform`);
+            if (!response.ok) {
+                return;
+            }
+            buffer = await response.arrayBuffer();
+        } catch (err) {
+            return;
+        }
+
+        const view = new DataView(buffer);
+        if (String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3)) !== 'WPK1') {
+            return;
+        }
+        const durationMillisecond = view.getUint32(8, true);
+        const levelCount = view.getUint32(12, true);
+        const levels = [];
+        let dataOffset = 16 + levelCount * 8;
+        for (let i = 0; i < levelCount; i++) {
+            const count = view.getUint32(16 + i * 8 + 4, true);
+            levels.push(new Int8Array(buffer, dataOffset, count * 2));
+            dataOffset += count * 2;
+        }
+
+        const canvas = document.createElement('canvas');
+        canvas.className = 'w-100 mb-1';
+        canvas.height = 48;
+        canvas.style.cursor = 'pointer';
+        audio.parentElement.before(canvas);
+        canvas.width = canvas.clientWidth || 600;
+
+        // 캔버스 너비 이상의 피크를 가진 가장 작은 단계를 선택
+        let peaks = levels[0];
+        for (const level of levels) {
+            if (level.length / 2 >= canvas.width) {
+                peaks = level;
+            }
+        }
+
+        const ctx = canvas.getContext('2d');
+        const draw = () => {
+            const width = canvas.width;
+            const height = canvas.height;
+            const count = peaks.length / 2;
+            const played = durationMillisecond > 0 ? audio.currentTime * 1000 / durationMillisecond : 0;
+
+            ctx.clearRect(0, 0, width, height);
+            for (let x = 0; x < width; x++) {
+                const start = Math.floor(x * count / width);
+                const end = Math.max(start + 1, Math.floor((x + 1) * count / width));
+                let min = 0;
+                let max = 0;
+                for (let i = start; i < end && i < count; i++) {
+                    min = Math.min(min, peaks[i * 2]);
+                    max = Math.max(max, peaks[i * 2 + 1]);
+                }
+                ctx.fillStyle = x / width <= played ? '#0d6efd' : '#adb5bd';
+                ctx.fillRect(x, height / 2 - max * height / 256, 1, Math.max(1, (max - min) * height / 256));
+            }
+        };
+        draw();
+
+        audio.addEventListener('timeupdate', draw);
+        canvas.addEventListener('click', (event) => {
+            const rect = canvas.getBoundingClientRect();
+            audio.currentTime = (event.clientX - rect.left) / rect.width * durationMillisecond / 1000;
+        });
+    };
+
+    this.connectLiveRecording = () => {
+        return new Promise((resolve) => {
+            const protocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
+            let socket;
+            try {
+                socket = new WebSocket(`${protocol}://${window.location.host}/ws/meetings/${this.options.meetingId}/recordings/live/`);
+            } catch (err) {
+                resolve(null);
+                return;
+            }
+
+            socket.onmessage = async (event) => {
+                const data = JSON.parse(event.data);
+
+                if (data.type === 'started') {
+                    liveTranscript = document.createElement('div');
+                    liveTranscript.className = 'live-transcript small text-muted mt-2';
+                    this.options.recordingPlay.innerHTML = '';
+                    this.options.recordingPlay.appendChild(liveTranscript);
+                    resolve(socket);
+                } else if (data.type === 'segments') {
+                    data.segments.forEach(segment => {
+                        const line = document.createElement('div');
+                        line.textContent = `[${this.ms_to_hms(segment.start)}] ${segment.text}`;
+                        liveTranscript.appendChild(line);
+                    });
+                } else if (data.type === 'completed') {
+                    liveSocket = null;
+                    await this.addRecording(data);
+                    this.resetRecordingState();
+                } else if (data.type === 'error') {
+                    toast(data.message);
+                }
+            };
+            // 연결할 수 없으면(ASGI 서버 미사용 등) 녹음 종료 후 업로드하는 방식으로 진행
+            socket.onerror = () => resolve(null);
+            socket.onclose = () => {
+                liveSocket = null;
+                resolve(null);
+            };
+        });
+    };
+
     this.stop = () => {
         this.options.recordingStatus.classList.add('visually-hidden');
         cancelAnimationFrame(rafId);
         rafId = null;
         this.stopTimer();
 
+        if (liveSocket && liveSocket.readyState === WebSocket.OPEN) {
+            // 녹음은 이미 서버에 저장되었으므로 업로드하지 않고 녹음 종료 후 전사 작업을 시작
+            showSpinner();
+            liveSocket.send(JSON.stringify({type: 'stop'}));
+            this.options.stopRecodingButton.classList.add('d-none');
+            return;
+        }
+
         const blob = new Blob(audioChunks, {type: 'audio/webm'});
         const url = URL.createObjectURL(blob);
         lastBlobUrl = url;
@@ -341,14 +479,7 @@ const meetings = function (options) {
             filename = audioFile.name;
         }
 
-        const formData = new FormData();
-        formData.append('file', blobOrFile, filename);
-
-        if (audioFile !== null) {
-            formData.append('source_type', 'upload_file');
-        } else {
-            formData.append('source_type', 'browser_recording');
-        }
+        const sourceType = audioFile !== null ? 'upload_file' : 'browser_recording';
 
         try {
             showSpinner();
@@ -358,15 +489,7 @@ const meetings = function (options) {
             this.options.uploadFileButton.disabled = true;
             this.options.uploadFileButton.textContent = '업로드 중...';
 
-            const response = await fetch(`/meetings/${this.options.meetingId}/recordings/`, {
-                method: 'POST',
-                body: formData,
-                headers: {
-                    'Accept': 'application/json',
-                    'X-CSRFToken': document.getElementsByName('csrfmiddlewaretoken')[0].value
-                }
-            });
-            const data = await response.json();
+            const data = await this.uploadInChunks(blobOrFile, filename, sourceType);
 
             if (data.status === 'success') {
                 this.options.audioFile.value = null;
@@ -391,6 +514,101 @@ const meetings = function (options) {
         }
     };
 
+    this.uploadInChunks = async (blobOrFile, filename, sourceType) => {
+        // 큰 파일은 조각으로 나누어 업로드하고, 연결이 끊기면 서버가 받은 위치부터 이어서 전송
+        const baseUrl = `/meetings/${this.options.meetingId}/recordings/uploads/`;
+        const csrfToken = document.getElementsByName('csrfmiddlewaretoken')[0].value;
+        const contentType = blobOrFile.type || (filename.toLowerCase().endsWith('.webm') ? 'audio/webm' : '');
+        const storageKey = `recording-upload:${this.options.meetingId}:${filename}:${blobOrFile.size}:${blobOrFile.lastModified || ''}`;
+
+        let uploadKey = blobOrFile instanceof File ? localStorage.getItem(storageKey) : null;
+        let chunkSize = null;
+        let offset = 0;
+
+        if (uploadKey) {
+            const response = await fetch(`${baseUrl}${uploadKey}/`, {headers: {'Accept': 'application/json'}});
+            const data = await response.json();
+            if (response.ok && data.status === 'uploading') {
+                offset = data.offset;
+            } else {
+                uploadKey = null;
+            }
+        }
+
+        if (!uploadKey) {
+            const formData = new FormData();
+            formData.append('file_name', filename);
+            formData.append('file_size', blobOrFile.size);
+            formData.append('content_type', contentType);
+            formData.append('source_type', sourceType);
+
+            const response = await fetch(baseUrl, {
+                method: 'POST',
+                body: formData,
+                headers: {'Accept': 'application/json', 'X-CSRFToken': csrfToken}
+            });
+            const data = await response.json();
+            if (data.status !== 'success') {
+                return data;
+            }
+            uploadKey = data.upload_key;
+            chunkSize = data.chunk_size;
+            if (blobOrFile instanceof File) {
+                localStorage.setItem(storageKey, uploadKey);
+            }
+        }
+        chunkSize = chunkSize || 8 * 1024 * 1024;
+
+        let retries = 0;
+        while (offset < blobOrFile.size) {
+            const chunk = blobOrFile.slice(offset, Math.min(offset + chunkSize, blobOrFile.size));
+            const headers = {'Accept': 'application/json', 'X-CSRFToken': csrfToken, 'Upload-Offset': String(offset)};
+            if (window.crypto && window.crypto.subtle) {
+                const digest = await window.crypto.subtle.digest('SHA-256', await chunk.arrayBuffer());
+                headers['Upload-Checksum'] = 'sha256 ' + Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+            }
+
+            let response = null;
+            try {
+                response = await fetch(`${baseUrl}${uploadKey}/`, {method: 'PUT', body: chunk, headers: headers});
+            } catch (err) {
+                // 네트워크 오류는 잠시 후 같은 위치부터 재시도
+            }
+
+            if (response) {
+                const data = await response.json().catch(() => ({}));
+                if (response.ok || response.status === 409) {
+                    if (data.offset === undefined) {
+                        return data;
+                    }
+                    offset = data.offset;
+                    retries = 0;
+                    this.options.uploadButton.textContent = this.options.uploadFileButton.textContent = `업로드 중... ${Math.floor(offset * 100 / blobOrFile.size)}%`;
+                    continue;
+                }
+                // 서버 오류(5xx)와 조각 손상(retry)만 재시도하고, 크기 초과·업로드 정보 없음 등 다시 보내도 거부되는 응답은 바로 알림
+                if (response.status < 500 && !data.retry) {
+                    return data.message ? data : {status: 'error', message: `😱 조각 업로드를 거부했어요. (${response.status})`};
+                }
+            }
+
+            if (++retries > 5) {
+                throw new Error('upload failed');
+            }
+            await new Promise(resolve => setTimeout(resolve, 1000 * retries));
+        }
+
+        const response = await fetch(`${baseUrl}${uploadKey}/complete/`, {
+            method: 'POST',
+            headers: {'Accept': 'application/json', 'X-CSRFToken': csrfToken}
+        });
+        const data = await response.json();
+        if (data.status === 'success') {
+            localStorage.removeItem(storageKey);
+        }
+        return data;
+    };
+
     this.createMeeting = async () => {
         try {
             const formData = new FormData(this.options.meetingForm);
@@ -423,6 +641,7 @@ const meetings = function (options) {
         seconds = 0;
         lastBlobUrl = null;
         audioChunks = [];
+        liveTranscript = null;
 
         this.options.recordingTimer.textContent = '00:00:00';
 
@@ -506,6 +725,10 @@ const meetings = function (options) {
                 BootstrapAccordionUtils.focus(document.getElementById(`collapse-recording-${recordingId}`), 'center');
                 toast(data.message || '🛠️ 전사 작업을 시작할게요.', 'info');
                 this.startPolling(recordingId, data.task_id);
+            } else if (data.status === 'converting') {
+                // 변환이 끝날 때까지 잠시 후 다시 요청
+                toast(data.message, 'info');
+                setTimeout(() => this.transcribe(button), 10000);
             } else if (data.status === 'completed') {
                 BootstrapAccordionUtils.focus(document.getElementById(`collapse-recording-${recordingId}`), 'center');
                 toast('🔎 전사 기록을 불러올게요.', 'info');